@@ -6,13 +6,15 @@ of schedule and podcast feed URLs for all configured CCC events.
 """
 
 import sys
-import xml.etree.ElementTree as ET
+import time
 from pathlib import Path
 from typing import Optional
 
-import requests
 import yaml
 
+from media_feed.utils.validation_utils import ValidationResult as UrlValidationResult
+from media_feed.utils.validation_utils import validate_events
+
 
 class ValidationResult:
     """Store validation results for an event."""
@@ -69,136 +71,25 @@ class ValidationResult:
         return "\n".join(lines)
 
 
-def validate_fahrplan_xml(content: str) -> tuple[bool, bool, Optional[str]]:
-    """Validate fahrplan schedule XML structure and content.
-
-    Returns:
-        Tuple of (is_valid_xml, has_events, error_message)
-    """
-    try:
-        root = ET.fromstring(content)
-
-        # Check if it's a schedule XML
-        if root.tag != "schedule":
-            return True, False, "Root element is not 'schedule'"
-
-        # Check for conference info
-        conference = root.find("conference")
-        if conference is None:
-            return True, False, "Missing 'conference' element"
-
-        # Check for days with events
-        days = root.findall("day")
-        if not days:
-            return True, False, "No 'day' elements found"
-
-        # Check if there are actual events
-        total_events = 0
-        for day in days:
-            rooms = day.findall("room")
-            for room in rooms:
-                events = room.findall("event")
-                total_events += len(events)
-
-        if total_events == 0:
-            return True, False, "No events found in schedule"
-
-        return True, True, None
-
-    except ET.ParseError as e:
-        return False, False, f"XML parse error: {str(e)}"
-    except Exception as e:
-        return False, False, f"Unexpected error: {str(e)}"
-
-
-def validate_podcast_xml(content: str) -> tuple[bool, bool, Optional[str]]:
-    """Validate podcast RSS feed XML structure and content.
-
-    Returns:
-        Tuple of (is_valid_xml, has_items, error_message)
-    """
-    try:
-        root = ET.fromstring(content)
-
-        # Check if it's an RSS feed
-        if root.tag != "rss":
-            return True, False, "Root element is not 'rss'"
-
-        # Check for channel
-        channel = root.find("channel")
-        if channel is None:
-            return True, False, "Missing 'channel' element"
-
-        # Check for items
-        items = channel.findall("item")
-        if not items:
-            return True, False, "No 'item' elements found in feed"
-
-        # Validate at least one item has an enclosure (media file)
-        has_enclosure = False
-        for item in items:
-            if item.find("enclosure") is not None:
-                has_enclosure = True
-                break
-
-        if not has_enclosure:
-            return True, True, "Warning: No items have media enclosures"
-
-        return True, True, None
-
-    except ET.ParseError as e:
-        return False, False, f"XML parse error: {str(e)}"
-    except Exception as e:
-        return False, False, f"Unexpected error: {str(e)}"
-
-
-def validate_event(event_id: str, event_config: dict) -> ValidationResult:
-    """Validate a single event's URLs."""
+def build_event_result(
+    event_id: str, url_results: dict[str, UrlValidationResult]
+) -> ValidationResult:
+    """Combine the Fahrplan and podcast URL results of an event."""
     result = ValidationResult(event_id)
 
-    # Validate Fahrplan URL
-    fahrplan_url = event_config.get("fahrplan_url")
-    if fahrplan_url:
-        try:
-            print(f"  Fetching {fahrplan_url}...", end=" ")
-            response = requests.get(fahrplan_url, timeout=30)
-            result.fahrplan_status = response.status_code
-
-            if response.status_code == 200:
-                print("✓")
-                is_valid, has_events, error = validate_fahrplan_xml(response.text)
-                result.fahrplan_valid_xml = is_valid
-                result.fahrplan_has_events = has_events
-                result.fahrplan_error = error
-            else:
-                print(f"✗ (HTTP {response.status_code})")
-                result.fahrplan_error = f"HTTP {response.status_code}"
-
-        except requests.RequestException as e:
-            print(f"✗ ({str(e)})")
-            result.fahrplan_error = str(e)
-
-    # Validate Podcast URL
-    podcast_url = event_config.get("media_feed_url")
-    if podcast_url:
-        try:
-            print(f"  Fetching {podcast_url}...", end=" ")
-            response = requests.get(podcast_url, timeout=30)
-            result.podcast_status = response.status_code
-
-            if response.status_code == 200:
-                print("✓")
-                is_valid, has_items, error = validate_podcast_xml(response.text)
-                result.podcast_valid_xml = is_valid
-                result.podcast_has_items = has_items
-                result.podcast_error = error
-            else:
-                print(f"✗ (HTTP {response.status_code})")
-                result.podcast_error = f"HTTP {response.status_code}"
-
-        except requests.RequestException as e:
-            print(f"✗ ({str(e)})")
-            result.podcast_error = str(e)
+    fahrplan = url_results.get("fahrplan")
+    if fahrplan:
+        result.fahrplan_status = fahrplan.status_code
+        result.fahrplan_valid_xml = fahrplan.valid_xml
+        result.fahrplan_has_events = fahrplan.has_content
+        result.fahrplan_error = fahrplan.error
+
+    podcast = url_results.get("podcast")
+    if podcast:
+        result.podcast_status = podcast.status_code
+        result.podcast_valid_xml = podcast.valid_xml
+        result.podcast_has_items = podcast.has_content
+        result.podcast_error = podcast.error
 
     return result
 
@@ -220,13 +111,15 @@ def main():
         sys.exit(1)
 
     print(f"🔍 Validating {len(events)} events...\n")
-
-    # Validate each event
-    results = []
     for event_id, event_config in sorted(events.items()):
         print(f"📡 {event_id} ({event_config.get('year', 'unknown')})")
-        result = validate_event(event_id, event_config)
-        results.append(result)
+
+    # Validate all events concurrently
+    start = time.monotonic()
+    url_results = validate_events(events)
+    print(f"\n⏱️  Checked all URLs in {time.monotonic() - start:.1f}s")
+
+    results = [build_event_result(event_id, url_results[event_id]) for event_id in sorted(events)]
 
     # Print detailed results
     print("\n" + "=" * 70)
@@ -0,0 +1,303 @@
+"""SQLite full-text catalog of all configured CCC events."""
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional
+
+from media_feed.ccc_api import get_talk_index_keys, load_talk_indexes, merge_title_hits
+from media_feed.matching import normalize_title
+from media_feed.search import required_term_matches, tokenize
+from media_feed.utils.cache_utils import get_cache_directory
+from media_feed.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Catalog file name inside the cache directory
+CATALOG_FILE_NAME = "catalog.sqlite"
+
+# bm25() column weights for title, subtitle, speakers, description, track
+FTS_COLUMN_WEIGHTS = (3.0, 2.0, 2.0, 1.0, 1.0)
+
+# Bump whenever the schema changes; catalogs of other versions are rebuilt
+CATALOG_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_key TEXT PRIMARY KEY,
+    year INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    built_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS talks (
+    id INTEGER PRIMARY KEY,
+    event_key TEXT NOT NULL REFERENCES events(event_key),
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS talks_event ON talks(event_key, position);
+CREATE VIRTUAL TABLE IF NOT EXISTS talks_fts USING fts5(
+    title, subtitle, speakers, description, track
+);
+"""
+
+_DROP_SCHEMA = """
+DROP TABLE IF EXISTS talks_fts;
+DROP TABLE IF EXISTS talks;
+DROP TABLE IF EXISTS events;
+"""
+
+
+class CatalogError(Exception):
+    """Catalog is missing or cannot be used."""
+
+    pass
+
+
+def get_catalog_path() -> Path:
+    """Get the default catalog database path.
+
+    Returns:
+        Path to the catalog in the cache directory
+    """
+    return get_cache_directory() / CATALOG_FILE_NAME
+
+
+def open_catalog(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """Open the catalog database, creating its schema if needed.
+
+    A catalog written with another schema version is emptied, so the next build
+    ingests all events again.
+
+    Args:
+        db_path: Catalog database path (default: cache directory)
+
+    Returns:
+        Open database connection
+    """
+    db_path = db_path or get_catalog_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+    conn = sqlite3.connect(db_path)
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != CATALOG_SCHEMA_VERSION:
+        conn.executescript(_DROP_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+    conn.executescript(_SCHEMA)
+    db_path.chmod(0o600)
+    return conn
+
+
+def _replace_event(
+    conn: sqlite3.Connection,
+    event_key: str,
+    year: int,
+    content_hash: str,
+    talks: list[dict[str, Any]],
+) -> None:
+    """Replace all catalog rows of one event."""
+    _delete_event(conn, event_key)
+    conn.execute(
+        "INSERT INTO events (event_key, year, content_hash, built_at) VALUES (?, ?, ?, ?)",
+        (event_key, year, content_hash, time.time()),
+    )
+
+    for position, talk in enumerate(talks):
+        cursor = conn.execute(
+            "INSERT INTO talks (event_key, position, title, record) VALUES (?, ?, ?, ?)",
+            (event_key, position, talk["title"], json.dumps(talk)),
+        )
+        conn.execute(
+            "INSERT INTO talks_fts (rowid, title, subtitle, speakers, description, track) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                cursor.lastrowid,
+                talk["title"],
+                talk["subtitle"],
+                talk["speakers"],
+                talk["description"],
+                talk["track"],
+            ),
+        )
+
+
+def _delete_event(conn: sqlite3.Connection, event_key: str) -> None:
+    """Delete all catalog rows of one event."""
+    conn.execute(
+        "DELETE FROM talks_fts WHERE rowid IN (SELECT id FROM talks WHERE event_key = ?)",
+        (event_key,),
+    )
+    conn.execute("DELETE FROM talks WHERE event_key = ?", (event_key,))
+    conn.execute("DELETE FROM events WHERE event_key = ?", (event_key,))
+
+
+def build_catalog(
+    config: dict[str, Any], db_path: Optional[Path] = None, force: bool = False
+) -> dict[str, str]:
+    """Ingest all configured events into the catalog.
+
+    Events are only re-ingested if the content hash of their Fahrplan and media
+    feed XMLs changed since the last build; the talk indexes of unchanged events
+    are not loaded at all. Events no longer configured are removed.
+
+    Args:
+        config: Configuration dictionary
+        db_path: Catalog database path (default: cache directory)
+        force: Re-ingest all events even if unchanged
+
+    Returns:
+        Build status by event key ('added', 'updated', 'unchanged', 'removed'
+        or an error message)
+    """
+    events = config["events"]
+    keys, errors = get_talk_index_keys(events)
+
+    with closing(open_catalog(db_path)) as conn, conn:
+        known = dict(conn.execute("SELECT event_key, content_hash FROM events").fetchall())
+
+        changed = {
+            event_key: events[event_key]
+            for event_key, index_key in keys.items()
+            if force or known.get(event_key) != index_key
+        }
+        indexes, load_errors = load_talk_indexes(changed) if changed else ({}, {})
+        errors.update(load_errors)
+
+        status = {event_key: f"failed: {error}" for event_key, error in errors.items()}
+        for event_key in sorted(keys):
+            if event_key not in changed:
+                status[event_key] = "unchanged"
+                continue
+            if event_key not in indexes:
+                continue
+
+            index = indexes[event_key]
+            _replace_event(
+                conn, event_key, events[event_key]["year"], index.content_hash, index.talks
+            )
+            status[event_key] = "updated" if event_key in known else "added"
+            logger.info(f"Catalog: ingested {len(index.talks)} talk(s) of {event_key}")
+
+        for event_key in set(known) - set(events):
+            _delete_event(conn, event_key)
+            status[event_key] = "removed"
+
+    return status
+
+
+def _fts_terms(query: str) -> list[str]:
+    """Turn free text into its distinct FTS5 query terms."""
+    return [f'"{term}"' for term in dict.fromkeys(tokenize(query))]
+
+
+def _check_event(conn: sqlite3.Connection, event_key: str) -> None:
+    """Raise CatalogError unless an event has been ingested."""
+    if not conn.execute("SELECT 1 FROM events WHERE event_key = ?", (event_key,)).fetchone():
+        raise CatalogError(
+            f"Event '{event_key}' is not in the catalog. Run 'media-feed catalog build'."
+        )
+
+
+def search_catalog(
+    query: str,
+    limit: int = 10,
+    event_key: Optional[str] = None,
+    db_path: Optional[Path] = None,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Rank catalog talks by full-text relevance.
+
+    Like TalkIndex.search, only talks containing at least MIN_TERM_MATCH_SHARE
+    of the distinct query terms are ranked hits. Talks whose title contains the
+    query come first (see merge_title_hits).
+
+    Args:
+        query: Search query
+        limit: Maximum number of hits
+        event_key: Only search this event
+        db_path: Catalog database path (default: cache directory)
+
+    Returns:
+        Ranked list of (event_key, talk) hits, ties go to the newer event
+
+    Raises:
+        CatalogError: If the catalog or the event is missing
+    """
+    db_path = db_path or get_catalog_path()
+    if not db_path.exists():
+        raise CatalogError("No catalog found. Run 'media-feed catalog build' first.")
+
+    terms = _fts_terms(query)
+    # Count the query terms each candidate contains
+    term_matches = " + ".join(
+        "(talks_fts.rowid IN (SELECT rowid FROM talks_fts WHERE talks_fts MATCH ?))" for _ in terms
+    )
+    sql = (
+        "SELECT talks.event_key, talks.record FROM talks_fts "
+        "JOIN talks ON talks.id = talks_fts.rowid "
+        "JOIN events ON events.event_key = talks.event_key "
+        f"WHERE talks_fts MATCH ? AND {term_matches} >= ?"
+    )
+    params: list[Any] = [" OR ".join(terms), *terms, required_term_matches(len(terms))]
+    if event_key:
+        sql += " AND talks.event_key = ?"
+        params.append(event_key)
+    sql += f" ORDER BY bm25(talks_fts, {', '.join(map(str, FTS_COLUMN_WEIGHTS))}), "
+    sql += "events.year DESC, talks.position LIMIT ?"
+    params.append(limit)
+
+    # Talks whose normalized title contains the query, newest event first
+    title_sql = (
+        "SELECT talks.event_key, talks.record FROM talks "
+        "JOIN events ON events.event_key = talks.event_key "
+        "WHERE instr(json_extract(talks.record, '$.normalized_title'), ?) > 0"
+    )
+    title_params: list[Any] = [normalize_title(query, remove_event_suffix=False)]
+    if event_key:
+        title_sql += " AND talks.event_key = ?"
+        title_params.append(event_key)
+    title_sql += " ORDER BY events.year DESC, talks.position LIMIT ?"
+    title_params.append(limit)
+
+    with closing(open_catalog(db_path)) as conn:
+        if event_key:
+            _check_event(conn, event_key)
+        if not terms:
+            return []
+        rows = conn.execute(sql, params).fetchall()
+        title_rows = conn.execute(title_sql, title_params).fetchall()
+
+    return merge_title_hits(
+        query,
+        [(row_event, json.loads(record)) for row_event, record in rows],
+        [(row_event, json.loads(record)) for row_event, record in title_rows],
+        limit,
+    )
+
+
+def load_catalog_talks(event_key: str, db_path: Optional[Path] = None) -> list[dict[str, Any]]:
+    """Load all talks of an event from the catalog in schedule order.
+
+    Args:
+        event_key: Event identifier
+        db_path: Catalog database path (default: cache directory)
+
+    Returns:
+        List of talk records
+
+    Raises:
+        CatalogError: If the catalog or the event is missing
+    """
+    db_path = db_path or get_catalog_path()
+    if not db_path.exists():
+        raise CatalogError("No catalog found. Run 'media-feed catalog build' first.")
+
+    with closing(open_catalog(db_path)) as conn:
+        _check_event(conn, event_key)
+        rows = conn.execute(
+            "SELECT record FROM talks WHERE event_key = ? ORDER BY position", (event_key,)
+        ).fetchall()
+
+    return [json.loads(record) for (record,) in rows]
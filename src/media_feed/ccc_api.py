@@ -1,17 +1,59 @@
 """CCC event API and search functionality."""
 
+import heapq
+import io
+import mmap
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, cast
+from typing import IO, Any, cast
 from xml.dom.minidom import Document, Element, Text
-
-from defusedxml import minidom
-
-from media_feed.utils.cache_utils import get_cache_directory
-from media_feed.utils.http_utils import download_with_cache
+from xml.etree.ElementTree import Element as ETElement
+
+from defusedxml import ElementTree, minidom
+
+from media_feed.matching import TitleMatcher, normalize_title
+from media_feed.search import TalkIndex
+from media_feed.utils.cache_utils import (
+    combine_digests,
+    compute_content_hash,
+    get_cache_digest,
+    get_cache_path,
+    get_memory_cache,
+    is_compressed_cache,
+    open_cache_entry,
+    read_marshal_cache,
+    read_sized_derived_cache,
+    write_derived_cache,
+    write_marshal_cache,
+)
+from media_feed.utils.http_utils import download_to_cache, is_download_cached
 from media_feed.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bump whenever the layout of talk index records or the talk matching changes
+TALK_INDEX_VERSION = 5
+
+# Bump whenever the layout of extracted Fahrplan event or media item records changes
+PARSER_VERSION = 1
+
+# XML parser backends: "iterparse" streams the feeds, "minidom" loads them fully
+XML_BACKEND_ITERPARSE = "iterparse"
+XML_BACKEND_MINIDOM = "minidom"
+DEFAULT_XML_BACKEND = XML_BACKEND_ITERPARSE
+
+# Concurrency limits when loading several events at once
+MAX_DOWNLOAD_WORKERS = 4
+MAX_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Parse workers are started while download threads (and stale-while-revalidate
+# refreshes) may hold locks, so they are spawned instead of forked
+PARSE_WORKER_START_METHOD = "spawn"
+
 
 def get_text_content(node: Element) -> str:
     """Get text content from an Element's first child node.
@@ -27,23 +69,55 @@ def get_text_content(node: Element) -> str:
     return ""
 
 
-def get_parent_element(node: Element) -> Element:
-    """Get parent element of a node, with type assertion.
+# Source of XML content: an in-memory buffer or a file that is memory-mapped
+XMLSource = bytes | Path
+
+
+@contextmanager
+def open_xml_source(source: XMLSource) -> Iterator[IO[bytes]]:
+    """Open XML content for reading without copying it.
+
+    Buffers are wrapped in a BytesIO (which shares the buffer) and files are
+    memory-mapped, so no temporary copies are written to disk. Compressed cache
+    entries are decompressed while they are read.
 
     Args:
-        node: XML Element node
+        source: XML content or path to an XML file
 
-    Returns:
-        Parent Element
+    Yields:
+        Binary file-like object
+
+    Raises:
+        FileNotFoundError: If a file source doesn't exist
     """
-    return cast(Element, node.parentNode)
+    if isinstance(source, bytes):
+        yield io.BytesIO(source)
+        return
+
+    if not source.exists():
+        raise FileNotFoundError(f"XML file not found: {source}")
 
+    if is_compressed_cache(source):
+        with open_cache_entry(source) as stream:
+            yield cast(IO[bytes], stream)
+        return
 
-def parse_xml_file(file_path: Path) -> Document:
-    """Safely parse an XML file.
+    with open(source, "rb") as f:
+        if source.stat().st_size == 0:
+            # Empty files cannot be mapped; let the parser report the error
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield cast(IO[bytes], mapped)
+
+
+def parse_xml_file(source: XMLSource) -> Document:
+    """Safely parse XML content or an XML file into a minidom Document.
+
+    Compressed cache entries are decompressed on the fly.
 
     Args:
-        file_path: Path to the XML file
+        source: XML content or path to the XML file
 
     Returns:
         Parsed XML Document
@@ -52,10 +126,8 @@ def parse_xml_file(file_path: Path) -> Document:
         FileNotFoundError: If file doesn't exist
         Exception: If XML parsing fails
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"XML file not found: {file_path}")
-
-    return minidom.parse(str(file_path))
+    with open_xml_source(source) as stream:
+        return minidom.parse(stream)
 
 
 def map_track_to_categories(track: str, config: dict[str, Any]) -> list[str]:
@@ -85,257 +157,785 @@ def map_track_to_categories(track: str, config: dict[str, Any]) -> list[str]:
     return categories
 
 
-def normalize_title(title: str, remove_event_suffix: bool = True) -> str:
-    """Normalize title for matching.
+def get_child_text(parent: Element, tag: str) -> str:
+    """Get text content of the first descendant element with the given tag.
 
     Args:
-        title: Title to normalize
-        remove_event_suffix: Remove event ID suffix like (38c3)
+        parent: XML Element to search in
+        tag: Tag name of the descendant
 
     Returns:
-        Normalized title
+        Text content or empty string if not available
     """
-    import re
+    elems = parent.getElementsByTagName(tag)
+    if elems and elems[0].childNodes:
+        return get_text_content(elems[0])
+    return ""
 
-    normalized = title.strip()
 
-    # Remove event suffix like (38c3), (37c3), etc.
-    if remove_event_suffix:
-        normalized = re.sub(r"\s*\(\d+c3\)\s*$", "", normalized, flags=re.IGNORECASE)
+def extract_fahrplan_events(fahrplan_dom: Document) -> list[dict[str, str]]:
+    """Extract the fields needed for searching from all Fahrplan events.
 
-    # Normalize whitespace
-    normalized = re.sub(r"\s+", " ", normalized)
+    Args:
+        fahrplan_dom: Parsed Fahrplan schedule XML
 
-    return normalized.strip().upper()
+    Returns:
+        List of event records in schedule order
+    """
+    events = []
+    for event in fahrplan_dom.getElementsByTagName("event"):
+        title = get_child_text(event, "title")
+        if not title:
+            continue
 
+        # Extract speakers
+        try:
+            persons = event.getElementsByTagName("persons")[0]
+            speakers = ", ".join(
+                [
+                    get_text_content(p)
+                    for p in persons.getElementsByTagName("person")
+                    if p.childNodes
+                ]
+            )
+        except (IndexError, AttributeError):
+            speakers = ""
+
+        events.append(
+            {
+                "id": event.getAttribute("id"),
+                "title": title,
+                "subtitle": get_child_text(event, "subtitle"),
+                "speakers": speakers,
+                "description": get_child_text(event, "description"),
+                "track": get_child_text(event, "track"),
+                "url": get_child_text(event, "url"),
+            }
+        )
+    return events
 
-def titles_match(fahrplan_title: str, media_title: str, threshold: float = 0.90) -> bool:
-    """Check if titles match using multiple strategies.
 
-    Tries progressively more lenient matching:
-    1. Exact match (normalized)
-    2. Substring match (current behavior)
-    3. Token-based fuzzy match (handles word order and minor differences)
+def extract_media_items(media_dom: Document) -> list[dict[str, str]]:
+    """Extract title and enclosure data from all media feed items.
+
+    Items without an enclosure are skipped since they cannot be added to a feed.
 
     Args:
-        fahrplan_title: Title from fahrplan XML
-        media_title: Title from media feed XML
-        threshold: Similarity threshold for fuzzy matching (0-1)
+        media_dom: Parsed media feed RSS XML
 
     Returns:
-        True if titles match
+        List of media item records in feed order
     """
-    # Normalize both titles
-    norm_fahrplan = normalize_title(fahrplan_title)
-    norm_media = normalize_title(media_title)
-
-    # Level 1: Exact match
-    if norm_fahrplan == norm_media:
-        logger.debug(f"Exact match: '{fahrplan_title}'")
-        return True
-
-    # Level 2: Bidirectional substring match
-    # Check both directions because media feed may drop subtitles
-    if norm_fahrplan in norm_media or norm_media in norm_fahrplan:
-        logger.debug(f"Substring match: '{fahrplan_title}'")
-        return True
-
-    # Level 3: Token-based fuzzy matching
-    # Split into tokens and calculate similarity
-    # There are some occasions where words are mixed between titles:
-    # "is" in fahrplan but "are" in media title
-    fahrplan_tokens = set(norm_fahrplan.split())
-    media_tokens = set(norm_media.split())
-
-    # Calculate Jaccard similarity (intersection over union)
-    if not fahrplan_tokens or not media_tokens:
-        return False
-
-    intersection = len(fahrplan_tokens & media_tokens)
-    union = len(fahrplan_tokens | media_tokens)
-    similarity = intersection / union if union > 0 else 0
-
-    if similarity >= threshold:
-        logger.debug(
-            f"Fuzzy match (similarity: {similarity:.2f}): '{fahrplan_title}' ≈ '{media_title}'"
+    items = []
+    for item in media_dom.getElementsByTagName("item"):
+        title = get_child_text(item, "title")
+        enclosures = item.getElementsByTagName("enclosure")
+        if not title or not enclosures:
+            continue
+
+        enclosure = enclosures[0]
+        items.append(
+            {
+                "title": title,
+                "published": get_child_text(item, "pubDate"),
+                "description": get_child_text(item, "description"),
+                "media_url": enclosure.getAttribute("url"),
+                "media_length": enclosure.getAttribute("length"),
+                "media_type": enclosure.getAttribute("type"),
+            }
         )
-        return True
+    return items
 
-    return False
 
+def _stream_elements(
+    source: XMLSource, tag: str, extract: Callable[[ETElement], dict[str, str] | None]
+) -> list[dict[str, str]]:
+    """Stream XML content and extract a record from every element with the given tag.
 
-def search_ccc_talk(
-    query: str,
+    Handled elements are cleared and detached from their parent right away, so
+    memory stays flat regardless of the content size.
+
+    Args:
+        source: XML content or path to an XML file
+        tag: Tag name of the elements to extract
+        extract: Function turning an element into a record (or None to skip it)
+
+    Returns:
+        List of extracted records in document order
+
+    Raises:
+        FileNotFoundError: If a file source doesn't exist
+        xml.etree.ElementTree.ParseError: If XML parsing fails
+    """
+    records = []
+    parents: list[ETElement] = []
+
+    with open_xml_source(source) as stream:
+        for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                continue
+
+            parents.pop()
+            if elem.tag != tag:
+                continue
+
+            record = extract(elem)
+            if record is not None:
+                records.append(record)
+
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+
+    return records
+
+
+def _extract_fahrplan_event_element(event: ETElement) -> dict[str, str] | None:
+    """Extract an event record from a streamed Fahrplan <event> element."""
+    title = event.findtext("title") or ""
+    if not title:
+        return None
+
+    persons = event.find("persons")
+    speakers = (
+        ", ".join(p.text for p in persons.iter("person") if p.text) if persons is not None else ""
+    )
+
+    return {
+        "id": event.get("id", ""),
+        "title": title,
+        "subtitle": event.findtext("subtitle") or "",
+        "speakers": speakers,
+        "description": event.findtext("description") or "",
+        "track": event.findtext("track") or "",
+        "url": event.findtext("url") or "",
+    }
+
+
+def _extract_media_item_element(item: ETElement) -> dict[str, str] | None:
+    """Extract a media item record from a streamed RSS <item> element."""
+    title = item.findtext("title") or ""
+    enclosure = item.find("enclosure")
+    if not title or enclosure is None:
+        return None
+
+    return {
+        "title": title,
+        "published": item.findtext("pubDate") or "",
+        "description": item.findtext("description") or "",
+        "media_url": enclosure.get("url", ""),
+        "media_length": enclosure.get("length", ""),
+        "media_type": enclosure.get("type", ""),
+    }
+
+
+def read_fahrplan_events(
+    source: XMLSource, backend: str = DEFAULT_XML_BACKEND
+) -> list[dict[str, str]]:
+    """Read all event records from Fahrplan schedule XML.
+
+    Args:
+        source: Fahrplan XML content or path to the XML file
+        backend: XML parser backend ("iterparse" or "minidom")
+
+    Returns:
+        List of event records in schedule order
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend == XML_BACKEND_ITERPARSE:
+        return _stream_elements(source, "event", _extract_fahrplan_event_element)
+    if backend == XML_BACKEND_MINIDOM:
+        return extract_fahrplan_events(parse_xml_file(source))
+    raise ValueError(f"Unknown XML backend: {backend}")
+
+
+def read_media_items(source: XMLSource, backend: str = DEFAULT_XML_BACKEND) -> list[dict[str, str]]:
+    """Read all media item records from media feed RSS XML.
+
+    Args:
+        source: Media feed XML content or path to the XML file
+        backend: XML parser backend ("iterparse" or "minidom")
+
+    Returns:
+        List of media item records in feed order
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend == XML_BACKEND_ITERPARSE:
+        return _stream_elements(source, "item", _extract_media_item_element)
+    if backend == XML_BACKEND_MINIDOM:
+        return extract_media_items(parse_xml_file(source))
+    raise ValueError(f"Unknown XML backend: {backend}")
+
+
+def _load_records(
+    source: XMLSource,
+    kind: str,
+    read: Callable[[XMLSource, str], list[dict[str, str]]],
+    backend: str,
+) -> list[dict[str, str]]:
+    """Read records from XML, reusing records cached for the same cached XML content."""
+    if not isinstance(source, Path):
+        return read(source, backend)
+
+    digest = get_cache_digest(source)
+    key = f"{kind}:{PARSER_VERSION}:{digest}"
+    records_path = get_cache_path(key, extension=".records")
+
+    cached = read_marshal_cache(records_path, key)
+    if cached is not None:
+        return cast(list[dict[str, str]], cached)
+
+    records = read(source, backend)
+    write_marshal_cache(records_path, key, records)
+    return records
+
+
+def load_fahrplan_events(
+    source: XMLSource, backend: str = DEFAULT_XML_BACKEND
+) -> list[dict[str, str]]:
+    """Load event records from Fahrplan XML, parsing it only once per content.
+
+    For a cache file, the extracted records are stored in the cache keyed by the
+    XML content hash and PARSER_VERSION, so the same XML is never parsed twice.
+
+    Args:
+        source: Fahrplan XML content or path to the cached XML file
+        backend: XML parser backend used when the XML has to be parsed
+
+    Returns:
+        List of event records in schedule order
+    """
+    return _load_records(source, "fahrplan", read_fahrplan_events, backend)
+
+
+def load_media_items(source: XMLSource, backend: str = DEFAULT_XML_BACKEND) -> list[dict[str, str]]:
+    """Load media item records from media feed XML, parsing it only once per content.
+
+    For a cache file, the extracted records are stored in the cache keyed by the
+    XML content hash and PARSER_VERSION, so the same XML is never parsed twice.
+
+    Args:
+        source: Media feed XML content or path to the cached XML file
+        backend: XML parser backend used when the XML has to be parsed
+
+    Returns:
+        List of media item records in feed order
+    """
+    return _load_records(source, "media", read_media_items, backend)
+
+
+def build_talk_index(
+    events: list[dict[str, str]], items: list[dict[str, str]]
+) -> list[dict[str, Any]]:
+    """Join Fahrplan events with their media items into talk index records.
+
+    Events without a matching media item are left out, as there is nothing to add
+    to a feed for them yet.
+
+    Args:
+        events: Fahrplan event records
+        items: Media item records
+
+    Returns:
+        List of talk records in schedule order
+    """
+    matcher = TitleMatcher([item["title"] for item in items])
+
+    talks = []
+    for event in events:
+        media_idx = matcher.match(event["title"])
+        if media_idx is None:
+            continue
+
+        media = items[media_idx]
+
+        talks.append(
+            {
+                "id": event["id"],
+                "title": event["title"],
+                "normalized_title": normalize_title(event["title"]),
+                "subtitle": event["subtitle"],
+                "speakers": event["speakers"],
+                "description": event["description"],
+                "track": event["track"],
+                "url": event["url"],
+                "published": media["published"],
+                "media_description": media["description"],
+                "media_url": media["media_url"],
+                "media_length": media["media_length"],
+                "media_type": media["media_type"],
+            }
+        )
+    return talks
+
+
+def _talk_index_location(
+    event_config: dict[str, Any], fahrplan_path: Path, media_path: Path
+) -> tuple[Path, str]:
+    """Get the cache path and content key of an event's talk index."""
+    fahrplan_url = event_config["fahrplan_url"]
+    media_url = event_config["media_feed_url"]
+
+    index_key = combine_digests(
+        compute_content_hash(str(TALK_INDEX_VERSION).encode()),
+        get_cache_digest(fahrplan_path),
+        get_cache_digest(media_path),
+    )
+    index_path = get_cache_path(f"{fahrplan_url}\n{media_url}", extension=".index.json")
+    return index_path, index_key
+
+
+def _read_cached_talk_index(index_path: Path, index_key: str) -> TalkIndex | None:
+    """Get a talk index from the memory tier, falling back to the disk cache."""
+    memory_cache = get_memory_cache()
+    index = memory_cache.get(("talk_index", index_key))
+    if isinstance(index, TalkIndex):
+        return index
+
+    cached = read_sized_derived_cache(index_path, index_key)
+    if cached is None:
+        return None
+
+    payload, size = cached
+    index = TalkIndex.from_dict(payload)
+    index.content_hash = index_key
+    memory_cache.put(("talk_index", index_key), index, size=size)
+    return index
+
+
+def _store_talk_index(index_path: Path, index_key: str, index: TalkIndex) -> None:
+    """Store a freshly built talk index in the disk cache and the memory tier."""
+    size = write_derived_cache(index_path, index_key, index.to_dict())
+    index.content_hash = index_key
+    get_memory_cache().put(("talk_index", index_key), index, size=size)
+
+
+def _download_event_feeds(
+    event_config: dict[str, Any], stale_while_revalidate: bool = False
+) -> tuple[Path, Path]:
+    """Download (or find in cache) the Fahrplan and media feed of an event."""
+    fahrplan_path = download_to_cache(
+        event_config["fahrplan_url"], stale_while_revalidate=stale_while_revalidate
+    )
+    media_path = download_to_cache(
+        event_config["media_feed_url"], stale_while_revalidate=stale_while_revalidate
+    )
+    return fahrplan_path, media_path
+
+
+def parse_talk_index(
+    fahrplan_source: XMLSource, media_source: XMLSource, backend: str = DEFAULT_XML_BACKEND
+) -> TalkIndex:
+    """Parse Fahrplan and media feed XML and build the talk index from them.
+
+    Args:
+        fahrplan_source: Fahrplan schedule XML or path to it
+        media_source: Media feed RSS XML or path to it
+        backend: XML parser backend
+
+    Returns:
+        Talk index with search statistics
+    """
+    # Parse XMLs securely, straight from the cached files or buffers
+    events = load_fahrplan_events(fahrplan_source, backend)
+    items = load_media_items(media_source, backend)
+    return TalkIndex(build_talk_index(events, items))
+
+
+def load_talk_index(
     event_config: dict[str, Any],
-    config: dict[str, Any],
-    use_long_desc: bool = False,
-    event_key: str = "",
-) -> dict[str, Any] | None:
-    """Search for CCC talk and return entry dictionary.
+    backend: str = DEFAULT_XML_BACKEND,
+    stale_while_revalidate: bool = False,
+) -> TalkIndex:
+    """Load the talk index for an event, rebuilding it if the XMLs changed.
+
+    The index is stored in the cache directory and keyed by the content hash of
+    the Fahrplan and media feed XMLs, so it is only rebuilt when either changes.
+    Within a process, loaded indexes are kept in the in-memory cache tier.
 
     Args:
-        query: Search query
         event_config: Event configuration
-        config: Global configuration
-        use_long_desc: Use long description from Fahrplan
-        event_key: Event identifier for error messages (e.g., "38c3")
+        backend: XML parser backend used when the index has to be rebuilt
+        stale_while_revalidate: Use recently expired XMLs while refreshing them
+            in the background
 
     Returns:
-        Talk entry dictionary or None if not found
+        Talk index with search statistics
 
     Raises:
         requests.RequestException: If download fails
         Exception: If XML parsing fails
     """
-    cache_dir = get_cache_directory()
+    fahrplan_url = event_config["fahrplan_url"]
+    media_url = event_config["media_feed_url"]
+    fahrplan_future: Future[Path]
+    media_future: Future[Path]
+    fahrplan_events: list[dict[str, str]] | None = None
+    media_items: list[dict[str, str]] | None = None
+
+    if is_download_cached(fahrplan_url, stale_while_revalidate) and is_download_cached(
+        media_url, stale_while_revalidate
+    ):
+        fahrplan_path, media_path = _download_event_feeds(event_config, stale_while_revalidate)
+    else:
+        # Download both XMLs concurrently. Whichever arrives first is parsed while
+        # the other one is still in flight: a download means the index is most
+        # likely stale anyway, so the parse overlaps with network time instead of
+        # adding to it.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fahrplan_future = pool.submit(
+                download_to_cache, fahrplan_url, stale_while_revalidate=stale_while_revalidate
+            )
+            media_future = pool.submit(
+                download_to_cache, media_url, stale_while_revalidate=stale_while_revalidate
+            )
 
-    try:
-        # Download XMLs with caching
-        fahrplan_content = download_with_cache(event_config["fahrplan_url"])
-        media_content = download_with_cache(event_config["media_feed_url"])
+            for future in as_completed([fahrplan_future, media_future]):
+                path = future.result()
+                if fahrplan_future.done() and media_future.done():
+                    break
+                if future is fahrplan_future:
+                    fahrplan_events = load_fahrplan_events(path, backend)
+                else:
+                    media_items = load_media_items(path, backend)
 
-        # Save to temp files for parsing
-        fahrplan_file = cache_dir / "temp_fahrplan.xml"
-        media_file = cache_dir / "temp_media.xml"
+        fahrplan_path = fahrplan_future.result()
+        media_path = media_future.result()
 
-        fahrplan_file.write_bytes(fahrplan_content)
-        media_file.write_bytes(media_content)
+    index_path, index_key = _talk_index_location(event_config, fahrplan_path, media_path)
+    index = _read_cached_talk_index(index_path, index_key)
+    if index is not None:
+        return index
 
-        # Parse XMLs securely
-        fahrplan_dom = parse_xml_file(fahrplan_file)
-        media_dom = parse_xml_file(media_file)
+    logger.info(f"Building talk index for {fahrplan_url}")
+    if fahrplan_events is None:
+        fahrplan_events = load_fahrplan_events(fahrplan_path, backend)
+    if media_items is None:
+        media_items = load_media_items(media_path, backend)
+    index = TalkIndex(build_talk_index(fahrplan_events, media_items))
+    _store_talk_index(index_path, index_key, index)
+    return index
 
-        # Clean up temp files
-        fahrplan_file.unlink(missing_ok=True)
-        media_file.unlink(missing_ok=True)
 
-        # Search logic
-        query_upper = query.upper()
+def get_talk_index_keys(
+    event_configs: dict[str, dict[str, Any]], stale_while_revalidate: bool = False
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Fetch the feeds of several events and get the content keys of their talk indexes.
 
-        for fahrplan_elem in fahrplan_dom.getElementsByTagName("title"):
-            if not fahrplan_elem.childNodes:
-                continue
+    A key changes whenever either feed of the event or the index format
+    changes, so data derived from an index can be checked for staleness without
+    loading the index.
 
-            title_text = get_text_content(fahrplan_elem)
+    Args:
+        event_configs: Event configurations by event key
+        stale_while_revalidate: Use recently expired XMLs while refreshing them
+            in the background
 
-            if query_upper not in title_text.upper():
+    Returns:
+        Tuple of (index keys by event key, error messages by event key)
+    """
+    keys: dict[str, str] = {}
+    errors: dict[str, str] = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as download_pool:
+        downloads = {
+            download_pool.submit(
+                _download_event_feeds, event_config, stale_while_revalidate
+            ): event_key
+            for event_key, event_config in event_configs.items()
+        }
+        for download in as_completed(downloads):
+            event_key = downloads[download]
+            try:
+                fahrplan_path, media_path = download.result()
+            except Exception as e:
+                logger.warning(f"Failed to fetch feeds for {event_key}: {e}")
+                errors[event_key] = str(e)
                 continue
 
-            # Extract from Fahrplan
-            event = get_parent_element(fahrplan_elem)
-            event_id = event.getAttribute("id")
-
-            subtitle_elems = event.getElementsByTagName("subtitle")
-            subtitle = (
-                get_text_content(subtitle_elems[0])
-                if subtitle_elems and subtitle_elems[0].childNodes
-                else ""
+            _, keys[event_key] = _talk_index_location(
+                event_configs[event_key], fahrplan_path, media_path
             )
 
-            # Extract speakers
+    return keys, errors
+
+
+def load_talk_indexes(
+    event_configs: dict[str, dict[str, Any]],
+    backend: str = DEFAULT_XML_BACKEND,
+    stale_while_revalidate: bool = False,
+) -> tuple[dict[str, TalkIndex], dict[str, str]]:
+    """Load the talk indexes of several events concurrently.
+
+    Feeds are fetched in a bounded thread pool. As soon as both feeds of an event
+    are available, a stale index is rebuilt in a process pool, so parsing one
+    event overlaps with downloading the others.
+
+    Args:
+        event_configs: Event configurations by event key
+        backend: XML parser backend used when an index has to be rebuilt
+        stale_while_revalidate: Use recently expired XMLs while refreshing them
+            in the background
+
+    Returns:
+        Tuple of (talk indexes by event key, error messages by event key)
+    """
+    indexes: dict[str, TalkIndex] = {}
+    errors: dict[str, str] = {}
+
+    with (
+        ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as download_pool,
+        ProcessPoolExecutor(
+            max_workers=MAX_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context(PARSE_WORKER_START_METHOD),
+        ) as parse_pool,
+    ):
+        downloads = {
+            download_pool.submit(
+                _download_event_feeds, event_config, stale_while_revalidate
+            ): event_key
+            for event_key, event_config in event_configs.items()
+        }
+        builds: dict[Future[TalkIndex], tuple[str, Path, str]] = {}
+
+        for download in as_completed(downloads):
+            event_key = downloads[download]
             try:
-                persons = event.getElementsByTagName("persons")[0]
-                speakers = ", ".join(
-                    [
-                        get_text_content(p)
-                        for p in persons.getElementsByTagName("person")
-                        if p.childNodes
-                    ]
-                )
-            except (IndexError, AttributeError):
-                speakers = ""
-
-            desc_elems = event.getElementsByTagName("description")
-            description = (
-                get_text_content(desc_elems[0]) if desc_elems and desc_elems[0].childNodes else ""
-            )
+                fahrplan_path, media_path = download.result()
+            except Exception as e:
+                logger.warning(f"Failed to fetch feeds for {event_key}: {e}")
+                errors[event_key] = str(e)
+                continue
 
-            # Extract track for category mapping
-            track_elems = event.getElementsByTagName("track")
-            track = (
-                get_text_content(track_elems[0])
-                if track_elems and track_elems[0].childNodes
-                else ""
+            index_path, index_key = _talk_index_location(
+                event_configs[event_key], fahrplan_path, media_path
             )
+            cached = _read_cached_talk_index(index_path, index_key)
+            if cached is not None:
+                indexes[event_key] = cached
+                continue
 
-            # Find in media feed
-            for media_elem in media_dom.getElementsByTagName("title"):
-                if not media_elem.childNodes:
-                    continue
-
-                media_title = get_text_content(media_elem)
-                if not titles_match(title_text, media_title):
-                    continue
-
-                item = get_parent_element(media_elem)
-
-                pub_elems = item.getElementsByTagName("pubDate")
-                pub_date = (
-                    get_text_content(pub_elems[0]) if pub_elems and pub_elems[0].childNodes else ""
-                )
-
-                media_desc_elems = item.getElementsByTagName("description")
-                media_desc = (
-                    get_text_content(media_desc_elems[0])
-                    if media_desc_elems and media_desc_elems[0].childNodes
-                    else ""
-                )
-
-                enclosures = item.getElementsByTagName("enclosure")
-                if not enclosures:
-                    continue
-
-                enclosure = enclosures[0]
-                media_url = enclosure.getAttribute("url")
-                media_length = enclosure.getAttribute("length")
-                media_type = enclosure.getAttribute("type")
-
-                # Try to extract URL from fahrplan XML first (preferred method)
-                url_elems = event.getElementsByTagName("url")
-                if url_elems and url_elems[0].childNodes:
-                    web_url = get_text_content(url_elems[0])
-                    logger.debug(f"Extracted web_url from <url> tag: {web_url}")
-                else:
-                    # Fallback: construct URL from pattern (for backward compatibility)
-                    if (
-                        "event_pattern_head" in event_config
-                        and "event_pattern_tail" in event_config
-                    ):
-                        web_url = (
-                            f"{event_config['event_pattern_head']}"
-                            f"{event_id}"
-                            f"{event_config['event_pattern_tail']}"
-                        )
-                        logger.debug(f"Constructed web_url from pattern: {web_url}")
-                    else:
-                        # No URL available - this shouldn't happen with modern fahrplan XMLs
-                        web_url = ""
-                        logger.warning(
-                            f"No <url> tag found and no event_pattern configured for "
-                            f"event {event_id}"
-                        )
-
-                final_desc = description if use_long_desc else media_desc
-
-                # Map track to categories
-                categories = map_track_to_categories(track, config)
-                # Use the first category as a string (media YAML format)
-                category = categories[0] if categories else "Technology"
-
-                logger.info(f"Found talk: {title_text}")
-
-                return {
-                    "title": title_text,
-                    "published": pub_date,
-                    "speakers": speakers,
-                    "subtitle": subtitle,
-                    "media_url": media_url,
-                    "media_type": media_type,
-                    "media_length": media_length,
-                    "web_url": web_url,
-                    "description": final_desc,
-                    "category": category,
-                }
+            logger.info(f"Building talk index for {event_key}")
+            build = parse_pool.submit(parse_talk_index, fahrplan_path, media_path, backend)
+            builds[build] = (event_key, index_path, index_key)
+
+        for build in as_completed(builds):
+            event_key, index_path, index_key = builds[build]
+            try:
+                index = build.result()
+            except Exception as e:
+                logger.warning(f"Failed to parse feeds for {event_key}: {e}")
+                errors[event_key] = str(e)
+                continue
+
+            _store_talk_index(index_path, index_key, index)
+            indexes[event_key] = index
+
+    return indexes, errors
+
+
+def find_talks(talks: list[dict[str, Any]], query: str) -> list[dict[str, Any]]:
+    """Find all talks whose title contains the query.
+
+    Args:
+        talks: Talk index records
+        query: Search query
+
+    Returns:
+        Matching talk records in schedule order
+    """
+    query_normalized = normalize_title(query, remove_event_suffix=False)
+    return [talk for talk in talks if query_normalized in talk["normalized_title"]]
+
+
+def merge_title_hits(
+    query: str,
+    ranked: list[tuple[str, dict[str, Any]]],
+    title_hits: list[tuple[str, dict[str, Any]]],
+    limit: int = 10,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Merge ranked hits with the talks whose title contains the query.
+
+    Ranked search only matches whole words, so a partial word like "BahnMin"
+    finds its talk through the title alone. Talks whose title contains the
+    query come first (ranked ones in rank order, then the others in the given
+    order), followed by the remaining ranked hits.
+
+    Args:
+        query: Search query
+        ranked: Ranked list of (event_key, talk) hits
+        title_hits: (event_key, talk) hits whose title contains the query
+        limit: Maximum number of hits
+
+    Returns:
+        Merged list of (event_key, talk) hits
+    """
+    query_normalized = normalize_title(query, remove_event_suffix=False)
+    if not query_normalized:
+        return ranked[:limit]
+
+    in_title = [hit for hit in ranked if query_normalized in hit[1]["normalized_title"]]
+    others = [hit for hit in ranked if query_normalized not in hit[1]["normalized_title"]]
+    seen = {(event_key, talk["id"]) for event_key, talk in ranked}
+    unranked = [hit for hit in title_hits if (hit[0], hit[1]["id"]) not in seen]
+    return (in_title + unranked + others)[:limit]
+
+
+def search_event(
+    query: str, event_key: str, index: TalkIndex, limit: int = 10
+) -> list[tuple[str, dict[str, Any]]]:
+    """Search a query in the talk index of one event.
+
+    Args:
+        query: Search query
+        event_key: Event identifier
+        index: Talk index of the event
+        limit: Maximum number of hits
+
+    Returns:
+        List of (event_key, talk) hits, talks whose title contains the query first
+    """
+    ranked = [(event_key, talk) for _, talk in index.search(query, limit)]
+    title_hits = [(event_key, talk) for talk in find_talks(index.talks, query)]
+    return merge_title_hits(query, ranked, title_hits, limit)
+
+
+def search_all_events(
+    query: str,
+    config: dict[str, Any],
+    limit: int = 10,
+    backend: str = DEFAULT_XML_BACKEND,
+    stale_while_revalidate: bool = False,
+) -> tuple[list[tuple[str, dict[str, Any]]], dict[str, str]]:
+    """Search a query in all configured events.
+
+    Every event is scored with term statistics taken over all events, so hits
+    are ranked by their BM25 score across events; ties go to the newer event.
+    Talks whose title contains the query come first (see merge_title_hits).
+
+    Args:
+        query: Search query
+        config: Global configuration
+        limit: Maximum number of hits
+        backend: XML parser backend used when an index has to be rebuilt
+        stale_while_revalidate: Use recently expired XMLs while refreshing them
+            in the background
+
+    Returns:
+        Tuple of (ranked list of (event_key, talk) hits, error messages by event key)
+    """
+    events = config["events"]
+    indexes, errors = load_talk_indexes(events, backend, stale_while_revalidate)
+
+    corpus = list(indexes.values())
+    hits: list[tuple[float, int, str, dict[str, Any]]] = []
+    for event_key, index in indexes.items():
+        year = events[event_key]["year"]
+        hits.extend(
+            (score, year, event_key, talk)
+            for score, talk in index.search(query, limit, corpus=corpus)
+        )
+    best = heapq.nlargest(limit, hits, key=lambda hit: hit[:2])
+    ranked = [(event_key, talk) for _, _, event_key, talk in best]
+
+    title_hits = [
+        (event_key, talk)
+        for event_key in sorted(indexes, key=lambda key: events[key]["year"], reverse=True)
+        for talk in find_talks(indexes[event_key].talks, query)
+    ]
+    return merge_title_hits(query, ranked, title_hits, limit), errors
+
+
+def build_media_entry(
+    talk: dict[str, Any],
+    event_config: dict[str, Any],
+    config: dict[str, Any],
+    use_long_desc: bool = False,
+) -> dict[str, Any]:
+    """Build a media YAML entry from a talk index record.
+
+    Args:
+        talk: Talk index record
+        event_config: Event configuration
+        config: Global configuration
+        use_long_desc: Use long description from Fahrplan
+
+    Returns:
+        Talk entry dictionary
+    """
+    event_id = talk["id"]
+
+    # Prefer URL from fahrplan XML
+    web_url = talk["url"]
+    if web_url:
+        logger.debug(f"Extracted web_url from <url> tag: {web_url}")
+    elif "event_pattern_head" in event_config and "event_pattern_tail" in event_config:
+        # Fallback: construct URL from pattern (for backward compatibility)
+        web_url = (
+            f"{event_config['event_pattern_head']}{event_id}{event_config['event_pattern_tail']}"
+        )
+        logger.debug(f"Constructed web_url from pattern: {web_url}")
+    else:
+        # No URL available - this shouldn't happen with modern fahrplan XMLs
+        logger.warning(f"No <url> tag found and no event_pattern configured for event {event_id}")
+
+    final_desc = talk["description"] if use_long_desc else talk["media_description"]
+
+    # Map track to categories
+    categories = map_track_to_categories(talk["track"], config)
+    # Use the first category as a string (media YAML format)
+    category = categories[0] if categories else "Technology"
+
+    return {
+        "title": talk["title"],
+        "published": talk["published"],
+        "speakers": talk["speakers"],
+        "subtitle": talk["subtitle"],
+        "media_url": talk["media_url"],
+        "media_type": talk["media_type"],
+        "media_length": talk["media_length"],
+        "web_url": web_url,
+        "description": final_desc,
+        "category": category,
+    }
+
+
+def search_ccc_talk(
+    query: str,
+    event_config: dict[str, Any],
+    config: dict[str, Any],
+    use_long_desc: bool = False,
+    event_key: str = "",
+) -> dict[str, Any] | None:
+    """Search for the best matching CCC talk and return its entry dictionary.
+
+    The talk is looked up in the persisted talk index of the event.
+
+    Args:
+        query: Search query
+        event_config: Event configuration
+        config: Global configuration
+        use_long_desc: Use long description from Fahrplan
+        event_key: Event identifier for error messages (e.g., "38c3")
+
+    Returns:
+        Talk entry dictionary or None if not found
+
+    Raises:
+        requests.RequestException: If download fails
+        Exception: If XML parsing fails
+    """
+    try:
+        hits = load_talk_index(event_config).search(query, limit=1)
+        if hits:
+            _, talk = hits[0]
+            logger.info(f"Found talk: {talk['title']}")
+            return build_media_entry(talk, event_config, config, use_long_desc)
 
         event_identifier = (
             f"{event_config['congress_number']}C3 ({event_config['year']})"
@@ -1,13 +1,31 @@
 """Media Feed CLI command implementations."""
 
+import json
 import logging
 import re
+import sqlite3
+import sys
+import time
 from pathlib import Path
 from typing import Any, Optional
 
 import click
 
-from media_feed.ccc_api import search_ccc_talk
+from media_feed.catalog import (
+    CatalogError,
+    build_catalog,
+    get_catalog_path,
+    load_catalog_talks,
+    search_catalog,
+)
+from media_feed.ccc_api import (
+    build_media_entry,
+    find_talks,
+    load_talk_index,
+    load_talk_indexes,
+    search_all_events,
+    search_event,
+)
 from media_feed.config import (
     ConfigError,
     calculate_congress_number,
@@ -15,12 +33,31 @@ from media_feed.config import (
     get_latest_event,
     load_config,
 )
+from media_feed.link_check import LINK_CHECK_MAX_AGE_HOURS, check_media_links
+from media_feed.matching import normalize_title
 from media_feed.rss import calculate_average_rating, generate_rss_feed
-from media_feed.utils.http_utils import check_url_exists
-from media_feed.utils.logger import configure_logging
+from media_feed.search import TalkIndex
+from media_feed.utils.cache_utils import (
+    CACHE_MAX_AGE_DAYS,
+    clear_cache,
+    get_cache_max_bytes,
+    get_cache_stats,
+    get_memory_cache,
+    parse_byte_size,
+    prune_cache,
+)
+from media_feed.utils.file_utils import MAX_YAML_FILE_SIZE, safe_read
+from media_feed.utils.http_utils import (
+    check_url_exists,
+    get_request_scheduler,
+    get_session_stats,
+)
+from media_feed.utils.logger import configure_logging, get_logger
 from media_feed.utils.validation_utils import validate_event_urls
 from media_feed.utils.yaml_utils import load_yaml, save_yaml, validate_yaml_data
 
+logger = get_logger(__name__)
+
 # Input sanitization constants
 MAX_USERNAME_LENGTH = 50
 MAX_COMMENT_LENGTH = 500
@@ -200,6 +237,238 @@ def prompt_for_feedback(username: Optional[str] = None) -> Optional[dict[str, An
     return feedback_entry
 
 
+def prompt_for_entry_rating(entry: dict[str, Any]) -> None:
+    """Ask whether to rate a talk and attach the feedback to its entry.
+
+    Args:
+        entry: Media entry to attach feedback to
+    """
+    click.echo("\n" + ("━" * 50))
+    if click.confirm("Would you like to rate this talk?", default=True):
+        username = click.prompt(
+            "Username (optional, press Enter to skip)", default="", show_default=False
+        ).strip()
+
+        feedback = prompt_for_feedback(username if username else None)
+        if feedback:
+            entry["feedback"] = [feedback]
+            click.echo("✓ Rating saved")
+
+
+def read_query_file(query_file: Path) -> list[str]:
+    """Read search queries from a file, one per line.
+
+    Blank lines and lines starting with '#' are ignored.
+
+    Args:
+        query_file: Path to the query file
+
+    Returns:
+        List of queries in file order
+    """
+    content = safe_read(query_file, max_size=MAX_YAML_FILE_SIZE)
+    queries = []
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            queries.append(line)
+    return queries
+
+
+def _add_entry(
+    entry: dict[str, Any], output_file: Path, category: Optional[str], rate: bool
+) -> None:
+    """Show a found talk, optionally rate it and insert it at the top of a media YAML.
+
+    Args:
+        entry: Media entry to add
+        output_file: Media YAML file to add the entry to
+        category: Category override
+        rate: Prompt for a rating
+    """
+    # Override category if provided
+    if category:
+        entry["category"] = category
+
+    click.echo("\n✓ Found talk:")
+    click.echo(f"  Title: {entry['title']}")
+    click.echo(f"  Speakers: {entry['speakers']}")
+    click.echo(f"  Category: {entry.get('category', 'N/A')}")
+
+    # Prompt for feedback
+    if rate:
+        prompt_for_entry_rating(entry)
+
+    try:
+        # Load existing YAML
+        if output_file.exists():
+            data = load_yaml(output_file)
+        else:
+            click.echo(f"✗ File not found: {output_file}", err=True)
+            return
+
+        # Insert at top of feed (an empty "feed:" loads as None)
+        data["feed"] = data.get("feed") or []
+        data["feed"].insert(0, entry)
+
+        # Write back
+        save_yaml(output_file, data)
+
+        click.echo(f"\n✓ Added entry to {output_file}")
+
+    except Exception as e:
+        click.echo(f"✗ Failed to save: {e}", err=True)
+
+
+def _add_batch(
+    queries: list[str],
+    event_key: str,
+    event_config: dict[str, Any],
+    config: dict[str, Any],
+    output_file: Path,
+    long_desc: bool,
+    category: Optional[str],
+    rate: bool,
+    use_catalog: bool = False,
+    stale_ok: bool = False,
+) -> None:
+    """Resolve many queries against one event and add all matches in a single write.
+
+    Args:
+        queries: Search queries
+        event_key: Event identifier (e.g., '39c3')
+        event_config: Event configuration
+        config: Global configuration
+        output_file: Media YAML file to add entries to
+        long_desc: Use long description from Fahrplan
+        category: Category override for all entries
+        rate: Prompt for a rating of every added talk
+        use_catalog: Read talks from the SQLite catalog instead of the XMLs
+        stale_ok: Use recently expired XMLs while refreshing them in the background
+    """
+    if not output_file.exists():
+        click.echo(f"✗ File not found: {output_file}", err=True)
+        return
+
+    index: Optional[TalkIndex] = None
+    try:
+        data = load_yaml(output_file)
+        if use_catalog:
+            talks = load_catalog_talks(event_key)
+        else:
+            index = load_talk_index(event_config, stale_while_revalidate=stale_ok)
+            talks = index.talks
+    except Exception as e:
+        click.echo(f"✗ Search failed: {e}", err=True)
+        return
+
+    # An empty "feed:" loads as None
+    data["feed"] = data.get("feed") or []
+    known_urls = {item.get("media_url") for item in data["feed"]}
+
+    entries: list[dict[str, Any]] = []
+    missing: list[str] = []
+    ambiguous: list[tuple[str, list[dict[str, Any]]]] = []
+    duplicates: list[str] = []
+
+    for query in queries:
+        matches = find_talks(talks, query)
+        if not matches:
+            missing.append(query)
+            continue
+
+        if len(matches) > 1:
+            # An exact title match resolves the ambiguity
+            query_normalized = normalize_title(query)
+            exact = [m for m in matches if m["normalized_title"] == query_normalized]
+            if len(exact) != 1:
+                ambiguous.append((query, matches))
+                continue
+            matches = exact
+
+        talk = matches[0]
+        if talk["media_url"] in known_urls:
+            duplicates.append(talk["title"])
+            continue
+        known_urls.add(talk["media_url"])
+
+        entry = build_media_entry(talk, event_config, config, long_desc)
+        if category:
+            entry["category"] = category
+
+        click.echo(f"✓ {query} → {entry['title']}")
+        if rate:
+            prompt_for_entry_rating(entry)
+        entries.append(entry)
+
+    for query in missing:
+        click.echo(f"✗ No matching talk found for '{query}'", err=True)
+        if index is None:
+            suggestions = [talk for _, talk in search_catalog(query, 1, event_key)]
+        else:
+            suggestions = [talk for _, talk in index.search(query, limit=1)]
+        if suggestions:
+            click.echo(f"   Did you mean: {suggestions[0]['title']}", err=True)
+
+    for query, matches in ambiguous:
+        click.echo(f"⚠️  '{query}' matches {len(matches)} talks, skipped:", err=True)
+        for match in matches[:5]:
+            click.echo(f"   • {match['title']}", err=True)
+        if len(matches) > 5:
+            click.echo(f"   • ... and {len(matches) - 5} more", err=True)
+
+    for title in duplicates:
+        click.echo(f"○ Already in {output_file.name}: {title}")
+
+    if not entries:
+        click.echo("\nNo entries added.", err=True)
+        return
+
+    # Insert at top of feed, keeping the order of the query file
+    data["feed"][0:0] = entries
+
+    try:
+        save_yaml(output_file, data)
+    except Exception as e:
+        click.echo(f"✗ Failed to save: {e}", err=True)
+        return
+
+    click.echo(f"\n✓ Added {len(entries)} of {len(queries)} queried talk(s) to {output_file}")
+
+
+def _choose_talk(
+    query: str, hits: list[tuple[str, dict[str, Any]]]
+) -> Optional[tuple[str, dict[str, Any]]]:
+    """Let the user pick one of the ranked search hits.
+
+    The best hit is only taken without asking if it is the only one whose title
+    contains the query. A hit matching on other fields is always confirmed.
+
+    Args:
+        query: Search query
+        hits: Ranked list of (event_key, talk) hits
+
+    Returns:
+        Tuple of (event_key, talk) or None if there are no hits
+    """
+    if not hits:
+        return None
+
+    query_normalized = normalize_title(query, remove_event_suffix=False)
+    title_hits = [hit for hit in hits if query_normalized in hit[1]["normalized_title"]]
+    if len(title_hits) == 1 and title_hits[0] is hits[0]:
+        return hits[0]
+
+    click.echo(f"\nBest {len(hits)} matching talk(s):")
+    for idx, (event_key, talk) in enumerate(hits, start=1):
+        click.echo(f"  [{idx}] {event_key.upper():<6} {talk['title']}")
+        if talk["speakers"]:
+            click.echo(f"      Speakers: {talk['speakers']}")
+
+    choice = click.prompt("Select talk", type=click.IntRange(1, len(hits)), default=1)
+    return hits[choice - 1]
+
+
 # CLI Commands
 
 
@@ -223,6 +492,15 @@ def main(verbose: int) -> None:
     else:
         configure_logging(logging.ERROR)  # Default: ERROR only
 
+    # Report how well the in-process cache tier served this run and how much
+    # requests were held back by the per-host limits
+    context = click.get_current_context()
+    context.call_on_close(lambda: logger.debug(f"Memory cache: {get_memory_cache().stats()}"))
+    context.call_on_close(
+        lambda: logger.debug(f"Request scheduler: {get_request_scheduler().stats()}")
+    )
+    context.call_on_close(lambda: logger.debug(f"HTTP sessions: {get_session_stats()}"))
+
 
 @main.command()
 @click.argument("input_files", nargs=-1, type=click.Path(exists=True))
@@ -301,9 +579,16 @@ def build(input_files: tuple[str, ...], all: bool, output_dir: str, all_ratings:
 
 
 @main.command()
-@click.argument("query")
+@click.argument("query", required=False)
+@click.option(
+    "--from-file",
+    "-f",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Add all talks listed in a file (one query per line)",
+)
 @click.option("--event", "-e", help="Event name (e.g., 36c3)")
 @click.option("--year", "-y", type=int, help="Year of the event")
+@click.option("--all-events", is_flag=True, help="Search all configured events")
 @click.option("--output", "-o", help="Output YAML file")
 @click.option("--long-desc", "-l", is_flag=True, help="Use long description from Fahrplan")
 @click.option(
@@ -311,21 +596,108 @@ def build(input_files: tuple[str, ...], all: bool, output_dir: str, all_ratings:
     "-c",
     help="Override category (if multiple provided, only first is used)",
 )
+@click.option(
+    "--limit", "-n", type=click.IntRange(min=1), default=5, help="Number of candidates to show"
+)
+@click.option(
+    "--catalog", "use_catalog", is_flag=True, help="Search the SQLite catalog instead of the XMLs"
+)
+@click.option("--no-rate", is_flag=True, help="Do not prompt for ratings")
+@click.option(
+    "--stale-ok",
+    is_flag=True,
+    help="Use recently expired cached XMLs and refresh them in the background",
+)
 def add(
-    query: str,
+    query: Optional[str],
+    from_file: Optional[str],
     event: Optional[str],
     year: Optional[int],
+    all_events: bool,
     output: Optional[str],
     long_desc: bool,
     categories: Optional[str],
+    limit: int,
+    use_catalog: bool,
+    no_rate: bool,
+    stale_ok: bool,
 ) -> None:
-    """Search CCC events and add media items to YAML."""
+    """Search CCC events and add media items to YAML.
+
+    Talks are ranked by how well title, subtitle, speakers, description and track
+    match the query. Unless the title of exactly one talk contains the query,
+    the best candidates are shown to choose from.
+
+    Use --from-file to add many talks at once: the event is parsed once, all
+    queries are resolved against it and the YAML file is written once.
+
+    Use --all-events to search every configured event at once and pick from the
+    ranked hits.
+
+    Use --stale-ok to skip waiting for feeds that expired recently: the cached
+    XMLs are used right away and refreshed in the background for the next run.
+    """
+    if bool(query) == bool(from_file):
+        click.echo("✗ Provide either a QUERY or --from-file", err=True)
+        return
+
+    if all_events and (event or year or from_file):
+        click.echo(
+            "✗ --all-events cannot be combined with --event, --year or --from-file", err=True
+        )
+        return
+
     try:
         config = load_config()
     except (ConfigError, FileNotFoundError) as e:
         click.echo(f"✗ Configuration error: {e}", err=True)
         return
 
+    # Take first category from comma-separated list
+    category = categories.split(",")[0].strip() if categories else None
+
+    if all_events:
+        assert query is not None
+        errors: dict[str, str] = {}
+        try:
+            if use_catalog:
+                hits = search_catalog(query, limit)
+            else:
+                hits, errors = search_all_events(
+                    query, config, limit, stale_while_revalidate=stale_ok
+                )
+        except Exception as e:
+            click.echo(f"✗ Search failed: {e}", err=True)
+            return
+
+        # The catalog may still hold events removed from config.yaml since it was built
+        for event_key, _ in hits:
+            if event_key not in config["events"]:
+                errors[event_key] = "not in config.yaml, run 'media-feed catalog build'"
+        hits = [hit for hit in hits if hit[0] in config["events"]]
+
+        for error_event, error in errors.items():
+            click.echo(f"⚠️  Skipped {error_event.upper()}: {error}", err=True)
+
+        selection = _choose_talk(query, hits)
+        if not selection:
+            click.echo(
+                f"✗ No matching talk found for '{query}' in {len(config['events'])} event(s)",
+                err=True,
+            )
+            return
+
+        event_key, talk = selection
+        event_config = config["events"][event_key]
+        output_file = Path(output) if output else Path(f"media/media_{event_key}.yml")
+        _add_entry(
+            build_media_entry(talk, event_config, config, long_desc),
+            output_file,
+            category,
+            rate=not no_rate,
+        )
+        return
+
     # Resolve event
     if event:
         event_key = event
@@ -346,14 +718,45 @@ def add(
             click.echo(f"✗ {e}", err=True)
             return
 
+    # Determine output file
+    output_file = Path(output) if output else Path(f"media/media_{event_key}.yml")
+
+    if from_file:
+        try:
+            queries = read_query_file(Path(from_file))
+        except (OSError, ValueError) as e:
+            click.echo(f"✗ Failed to read {from_file}: {e}", err=True)
+            return
+
+        _add_batch(
+            queries,
+            event_key,
+            event_config,
+            config,
+            output_file,
+            long_desc,
+            category,
+            rate=not no_rate,
+            use_catalog=use_catalog,
+            stale_ok=stale_ok,
+        )
+        return
+
+    assert query is not None
+
     # Search
     try:
-        entry = search_ccc_talk(query, event_config, config, long_desc, event_key)
+        if use_catalog:
+            hits = search_catalog(query, limit, event_key)
+        else:
+            index = load_talk_index(event_config, stale_while_revalidate=stale_ok)
+            hits = search_event(query, event_key, index, limit)
     except Exception as e:
         click.echo(f"✗ Search failed: {e}", err=True)
         return
 
-    if not entry:
+    selection = _choose_talk(query, hits)
+    if not selection:
         congress_num = event_config.get("congress_number", "?")
         year = event_config.get("year", "?")
         click.echo(
@@ -368,52 +771,253 @@ def add(
         )
         return
 
-    # Override category if provided
-    if categories:
-        # Take first category from comma-separated list
-        category_list = [cat.strip() for cat in categories.split(",")]
-        entry["category"] = category_list[0]
+    _add_entry(
+        build_media_entry(selection[1], event_config, config, long_desc),
+        output_file,
+        category,
+        rate=not no_rate,
+    )
 
-    click.echo("\n✓ Found talk:")
-    click.echo(f"  Title: {entry['title']}")
-    click.echo(f"  Speakers: {entry['speakers']}")
-    click.echo(f"  Category: {entry.get('category', 'N/A')}")
 
-    # Prompt for feedback
-    click.echo("\n" + ("━" * 50))
-    if click.confirm("Would you like to rate this talk?", default=True):
-        username = click.prompt(
-            "Username (optional, press Enter to skip)", default="", show_default=False
-        ).strip()
+@main.group()
+def catalog() -> None:
+    """Manage the SQLite full-text catalog of all configured events."""
 
-        feedback = prompt_for_feedback(username if username else None)
-        if feedback:
-            entry["feedback"] = [feedback]
-            click.echo("✓ Rating saved")
 
-    # Determine output file
-    output_file = Path(output) if output else Path(f"media/media_{event_key}.yml")
+@catalog.command("build")
+@click.option("--force", is_flag=True, help="Re-ingest all events even if unchanged")
+def catalog_build(force: bool) -> None:
+    """Ingest all events from config.yaml into the catalog.
 
+    Only events whose Fahrplan or media feed changed since the last build are
+    re-ingested.
+    """
     try:
-        # Load existing YAML
-        if output_file.exists():
-            data = load_yaml(output_file)
+        config = load_config()
+    except (ConfigError, FileNotFoundError) as e:
+        click.echo(f"✗ Configuration error: {e}", err=True)
+        return
+
+    try:
+        status = build_catalog(config, force=force)
+    except Exception as e:
+        click.echo(f"✗ Catalog build failed: {e}", err=True)
+        return
+
+    symbols = {"added": "✓", "updated": "✓", "unchanged": "○", "removed": "−"}
+    for event_key in sorted(status):
+        symbol = symbols.get(status[event_key], "✗")
+        click.echo(f"{symbol} {event_key.upper():<6} {status[event_key]}")
+
+    click.echo(f"\n💾 Catalog: {get_catalog_path()}")
+
+
+@catalog.command("search")
+@click.argument("query")
+@click.option("--event", "-e", help="Only search this event (e.g., 36c3)")
+@click.option(
+    "--limit", "-n", type=click.IntRange(min=1), default=10, help="Maximum number of hits"
+)
+def catalog_search(query: str, event: Optional[str], limit: int) -> None:
+    """Search talks of all events in the catalog."""
+    try:
+        hits = search_catalog(query, limit, event)
+    except (CatalogError, sqlite3.Error) as e:
+        click.echo(f"✗ {e}", err=True)
+        return
+
+    if not hits:
+        click.echo(f"\nNo talks found for '{query}'.\n")
+        return
+
+    for event_key, talk in hits:
+        click.echo(f"{event_key.upper():<6} {talk['title']}")
+        if talk["speakers"]:
+            click.echo(f"       Speakers: {talk['speakers']}")
+
+
+def _parse_byte_size(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[int]:
+    """Parse a byte size like '500M' or '2G' (click option callback)."""
+    if value is None:
+        return None
+
+    try:
+        return parse_byte_size(value)
+    except ValueError:
+        raise click.BadParameter("expected a size like 500M or 2G") from None
+
+
+def _format_bytes(size: float) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@main.group()
+def cache() -> None:
+    """Inspect and manage the download cache."""
+
+
+@cache.command("stats")
+def cache_stats() -> None:
+    """Show cache size, entries, hit rate and oldest/newest entries."""
+    stats = get_cache_stats()
+
+    click.echo(f"💾 Cache: {stats['directory']}")
+    click.echo(
+        f"  Entries:  {stats['entries']} ({_format_bytes(stats['bytes'])} "
+        f"of {_format_bytes(stats['max_bytes'])} budget)"
+    )
+    click.echo(
+        f"  Hit rate: {stats['hit_rate']:.0%} "
+        f"({stats['hits']} hit(s), {stats['fetches']} fetch(es))"
+    )
+
+    for label in ("oldest", "newest"):
+        if stats[label]:
+            name, url, written_at = stats[label]
+            written = time.strftime("%Y-%m-%d %H:%M", time.localtime(written_at))
+            click.echo(f"  {label.capitalize() + ':':<9} {written}  {url or name}")
+
+    if stats["other_files"]:
+        click.echo(
+            f"  Other:    {stats['other_files']} file(s), {_format_bytes(stats['other_bytes'])}"
+        )
+
+
+@cache.command("prune")
+@click.option("--max-age-days", type=click.FloatRange(min=0), help="Delete entries older than this")
+@click.option(
+    "--max-size",
+    callback=_parse_byte_size,
+    help="Evict least recently used entries beyond this size (e.g. 200M)",
+)
+def cache_prune(max_age_days: Optional[float], max_size: Optional[int]) -> None:
+    """Evict cache entries by age and/or size budget.
+
+    Without options, entries older than the cache lifetime are deleted and the
+    default size budget is enforced. Talk indexes and other derived data, and
+    feeds that can be revalidated, age from when they were last used. Stale
+    partial downloads and unused lock files are swept as well.
+    """
+    if max_age_days is None and max_size is None:
+        max_age_days, max_size = CACHE_MAX_AGE_DAYS, get_cache_max_bytes()
+
+    pruned = prune_cache(max_age_days=max_age_days, max_bytes=max_size)
+    stats = get_cache_stats()
+    click.echo(
+        f"✓ Pruned {len(pruned)} file(s), {stats['entries']} entr"
+        f"{'y' if stats['entries'] == 1 else 'ies'} left ({_format_bytes(stats['bytes'])})"
+    )
+
+
+@cache.command("warm")
+def cache_warm() -> None:
+    """Prefetch all Fahrplan and media feeds from config.yaml in parallel.
+
+    Talk indexes are built as well, so the first add of an event is instant.
+    """
+    try:
+        config = load_config()
+    except (ConfigError, FileNotFoundError) as e:
+        click.echo(f"✗ Configuration error: {e}", err=True)
+        return
+
+    start = time.monotonic()
+    indexes, errors = load_talk_indexes(config["events"])
+
+    for event_key in sorted(config["events"]):
+        if event_key in indexes:
+            click.echo(f"✓ {event_key.upper():<6} {len(indexes[event_key].talks)} talk(s)")
         else:
-            click.echo(f"✗ File not found: {output_file}", err=True)
-            return
+            click.echo(f"✗ {event_key.upper():<6} {errors.get(event_key, 'failed')}")
 
-        # Insert at top of feed
-        if "feed" not in data:
-            data["feed"] = []
-        data["feed"].insert(0, entry)
+    click.echo(f"\n⏱️  Warmed {len(indexes)} event(s) in {time.monotonic() - start:.1f}s")
 
-        # Write back
-        save_yaml(output_file, data)
 
-        click.echo(f"\n✓ Added entry to {output_file}")
+@cache.command("clear")
+def cache_clear() -> None:
+    """Delete all cached files."""
+    count = clear_cache()
+    click.echo(f"✓ Cleared {count} cached file(s)")
 
-    except Exception as e:
-        click.echo(f"✗ Failed to save: {e}", err=True)
+
+@main.command("check-links")
+@click.argument("input_files", nargs=-1, type=click.Path(exists=True))
+@click.option("--output", "-o", type=click.Path(), help="Write the JSON report to a file")
+@click.option(
+    "--max-age",
+    type=click.FloatRange(min=0),
+    default=LINK_CHECK_MAX_AGE_HOURS,
+    show_default=True,
+    help="Reuse results of links probed less than this many hours ago",
+)
+@click.option("--timeout", type=click.IntRange(min=1), default=30, help="Timeout per link")
+def check_links(
+    input_files: tuple[str, ...], output: Optional[str], max_age: float, timeout: int
+) -> None:
+    """Check media and web URLs of media YAML files for link rot.
+
+    Checks all media/media_*.yml files unless files are given. Enclosures are
+    also checked against their media_length. The JSON report is printed to
+    stdout (or written to --output), a summary to stderr. Exits with status 1
+    if any link is broken or has a different size.
+    """
+    if input_files:
+        files_to_process = [Path(f) for f in input_files]
+    else:
+        files_to_process = sorted(Path("media").glob("media_*.yml"))
+
+    if not files_to_process:
+        click.echo("No files to check.", err=True)
+        return
+
+    start = time.perf_counter()
+    try:
+        report = check_media_links(files_to_process, max_age_hours=max_age, timeout=timeout)
+    except (OSError, ValueError) as e:
+        click.echo(f"✗ Failed to read media files: {e}", err=True)
+        return
+    elapsed = time.perf_counter() - start
+
+    report_json = json.dumps(report, indent=2, ensure_ascii=False)
+    if output:
+        Path(output).write_text(report_json + "\n", encoding="utf-8")
+    else:
+        click.echo(report_json)
+
+    for link in report["links"]:
+        if link["status"] == "broken":
+            click.echo(f"✗ {link['title']} ({link['kind']}): {link['error']}", err=True)
+            click.echo(f"   {link['url']}", err=True)
+        elif link["status"] == "size_mismatch":
+            click.echo(
+                f"⚠️  {link['title']}: size {link['content_length']} "
+                f"!= media_length {link['expected_length']}",
+                err=True,
+            )
+
+    summary = report["summary"]
+    click.echo(
+        f"\n{'✓' if summary['ok'] == summary['links'] else '✗'} {summary['ok']} of "
+        f"{summary['links']} link(s) OK, {summary['broken']} broken, "
+        f"{summary['size_mismatch']} size mismatch(es)",
+        err=True,
+    )
+    click.echo(
+        f"⏱️  Probed {summary['probed']} link(s) in {elapsed:.1f}s, {summary['cached']} from cache",
+        err=True,
+    )
+    if output:
+        click.echo(f"💾 Report written to {output}", err=True)
+
+    if summary["broken"] or summary["size_mismatch"]:
+        sys.exit(1)
 
 
 @main.command("new-event")
@@ -0,0 +1,186 @@
+"""Link-rot checks of the enclosure and web URLs in media YAML files."""
+
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from media_feed.utils.cache_utils import (
+    get_cache_path,
+    lock_cache_entry,
+    read_derived_cache,
+    write_derived_cache,
+)
+from media_feed.utils.http_utils import HTTP_TIMEOUT
+from media_feed.utils.logger import get_logger
+from media_feed.utils.validation_utils import (
+    LinkCheckResult,
+    check_links,
+)
+from media_feed.utils.yaml_utils import load_yaml
+
+logger = get_logger(__name__)
+
+# Probed links are not probed again for this long
+LINK_CHECK_MAX_AGE_HOURS = 24
+
+# Bump when the stored result format changes
+LINK_CHECK_CACHE_VERSION = 1
+LINK_CHECK_CACHE_KEY = f"link-checks:{LINK_CHECK_CACHE_VERSION}"
+
+# Item fields holding the links of a talk, by link kind
+LINK_FIELDS = {"media": "media_url", "web": "web_url"}
+
+
+def get_link_cache_path() -> Path:
+    """Get the path of the cached link check results.
+
+    Returns:
+        Path to the result cache file
+    """
+    return get_cache_path(LINK_CHECK_CACHE_KEY, extension=".json")
+
+
+def _load_cached_results() -> dict[str, LinkCheckResult]:
+    """Load all cached link check results by URL."""
+    payload = read_derived_cache(get_link_cache_path(), LINK_CHECK_CACHE_KEY)
+    if not isinstance(payload, dict):
+        return {}
+    return {url: LinkCheckResult.from_dict(data) for url, data in payload.items()}
+
+
+def _store_results(results: Sequence[LinkCheckResult]) -> None:
+    """Merge link check results into the cache.
+
+    Results of requests that failed without an HTTP status (timeouts, connection
+    errors) are transient and not stored, so the next run probes them again.
+    """
+    cache_path = get_link_cache_path()
+    with lock_cache_entry(cache_path):
+        # Another run may have stored results while we were probing
+        cached = {url: result.to_dict() for url, result in _load_cached_results().items()}
+        for result in results:
+            if result.status_code is not None:
+                cached[result.url] = result.to_dict()
+        write_derived_cache(cache_path, LINK_CHECK_CACHE_KEY, cached)
+
+
+def collect_links(media_files: Sequence[Path]) -> list[dict[str, Any]]:
+    """Collect the links of all talks in media YAML files.
+
+    Args:
+        media_files: Media YAML files
+
+    Returns:
+        One record per link with the file, talk title, link kind ('media' or
+        'web'), URL and the expected enclosure size (media links only)
+
+    Raises:
+        ValueError: If a YAML file is invalid
+        OSError: If a YAML file cannot be read
+    """
+    links: list[dict[str, Any]] = []
+
+    for media_file in media_files:
+        data = load_yaml(media_file)
+        for item in data.get("feed") or []:
+            for kind, field in LINK_FIELDS.items():
+                url = item.get(field)
+                if not url:
+                    continue
+
+                expected_length: Optional[int] = None
+                if kind == "media" and str(item.get("media_length", "")).isdigit():
+                    expected_length = int(item["media_length"])
+
+                links.append(
+                    {
+                        "file": str(media_file),
+                        "title": item.get("title", "Untitled"),
+                        "kind": kind,
+                        "url": str(url),
+                        "expected_length": expected_length,
+                    }
+                )
+
+    return links
+
+
+def check_media_links(
+    media_files: Sequence[Path],
+    max_age_hours: float = LINK_CHECK_MAX_AGE_HOURS,
+    timeout: int = HTTP_TIMEOUT,
+) -> dict[str, Any]:
+    """Check the enclosure and web URLs of media YAML files for link rot.
+
+    Every distinct URL is probed with a HEAD request at most once, concurrently
+    within the request scheduler's per-host limits. Results younger than
+    max_age_hours are reused from the cache instead. Enclosures are also
+    compared against their media_length.
+
+    Args:
+        media_files: Media YAML files
+        max_age_hours: Reuse cached results younger than this (0 probes everything)
+        timeout: Deadline per request in seconds
+
+    Returns:
+        Report with a summary (links, probed, cached, ok, broken, size mismatches)
+        and one record per link with its status: 'ok', 'broken' or
+        'size_mismatch'
+
+    Raises:
+        ValueError: If a YAML file is invalid
+        OSError: If a YAML file cannot be read
+    """
+    links = collect_links(media_files)
+
+    cutoff = time.time() - max_age_hours * 60 * 60
+    results = {
+        url: result for url, result in _load_cached_results().items() if result.checked_at >= cutoff
+    }
+    cached_urls = set(results)
+
+    stale_urls = list(dict.fromkeys(link["url"] for link in links if link["url"] not in results))
+    if stale_urls:
+        logger.info(f"Probing {len(stale_urls)} link(s), {len(cached_urls)} cached")
+        probed = check_links(stale_urls, timeout)
+        _store_results(probed)
+        results.update((result.url, result) for result in probed)
+
+    summary = {
+        "links": len(links),
+        "probed": len(stale_urls),
+        "cached": 0,
+        "ok": 0,
+        "broken": 0,
+        "size_mismatch": 0,
+    }
+    records = []
+    for link in links:
+        result = results[link["url"]]
+        if not result.is_success:
+            status = "broken"
+        elif (
+            link["expected_length"] is not None
+            and result.content_length is not None
+            and result.content_length != link["expected_length"]
+        ):
+            status = "size_mismatch"
+        else:
+            status = "ok"
+
+        summary[status] += 1
+        summary["cached"] += link["url"] in cached_urls
+        records.append(
+            {
+                **link,
+                "status": status,
+                "status_code": result.status_code,
+                "content_length": result.content_length,
+                "error": result.error,
+                "checked_at": result.checked_at,
+                "cached": link["url"] in cached_urls,
+            }
+        )
+
+    return {"generated_at": time.time(), "summary": summary, "links": records}
@@ -0,0 +1,156 @@
+"""Title normalization and Fahrplan to media feed matching."""
+
+import re
+from collections.abc import Iterable, Sequence
+
+# Jaccard similarity required for a token-based fuzzy match
+FUZZY_MATCH_THRESHOLD = 0.90
+
+# Length of the character n-grams indexed for substring matching
+NGRAM_SIZE = 3
+
+_EVENT_SUFFIX_PATTERN = re.compile(r"\s*\(\d+c3\)\s*$", flags=re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_title(title: str, remove_event_suffix: bool = True) -> str:
+    """Normalize title for matching.
+
+    Args:
+        title: Title to normalize
+        remove_event_suffix: Remove event ID suffix like (38c3)
+
+    Returns:
+        Normalized title
+    """
+    normalized = title.strip()
+
+    # Remove event suffix like (38c3), (37c3), etc.
+    if remove_event_suffix:
+        normalized = _EVENT_SUFFIX_PATTERN.sub("", normalized)
+
+    # Normalize whitespace
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized)
+
+    return normalized.strip().upper()
+
+
+def _ngrams(text: str, size: int = NGRAM_SIZE) -> list[str]:
+    """Split text into its overlapping character n-grams (none if it is shorter)."""
+    return [text[start : start + size] for start in range(len(text) - size + 1)]
+
+
+def _jaccard_similarity(tokens_a: frozenset[str], tokens_b: frozenset[str]) -> float:
+    """Calculate Jaccard similarity (intersection over union) of two token sets."""
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+
+class TitleMatcher:
+    """Match titles against a fixed set of candidate titles.
+
+    Candidates are normalized and indexed once (exact titles, character n-grams
+    and words), so each lookup only compares a few candidates and matching a
+    whole Fahrplan against a media feed is close to linear.
+    """
+
+    def __init__(self, titles: Sequence[str], threshold: float = FUZZY_MATCH_THRESHOLD):
+        self.threshold = threshold
+        self._normalized = [normalize_title(title) for title in titles]
+        self._tokens = [frozenset(normalized.split()) for normalized in self._normalized]
+        self._exact: dict[str, int] = {}
+        self._lengths: set[int] = set()
+        self._ngram_postings: dict[str, list[int]] = {}
+        self._token_postings: dict[str, list[int]] = {}
+
+        for idx, normalized in enumerate(self._normalized):
+            if not normalized:
+                continue
+            self._exact.setdefault(normalized, idx)
+            self._lengths.add(len(normalized))
+            for ngram in set(_ngrams(normalized)):
+                self._ngram_postings.setdefault(ngram, []).append(idx)
+            for token in self._tokens[idx]:
+                self._token_postings.setdefault(token, []).append(idx)
+
+    def match(self, title: str) -> int | None:
+        """Find the candidate matching a title.
+
+        Tries progressively more lenient levels:
+        1. Exact match (normalized)
+        2. Bidirectional substring match, as media feeds may drop subtitles
+        3. Token-based fuzzy match (handles word order and minor differences)
+
+        A more exact level always wins, and within a level the first candidate in
+        input order is chosen.
+
+        Args:
+            title: Title to look up
+
+        Returns:
+            Index of the matching candidate or None if nothing matches
+        """
+        normalized = normalize_title(title)
+        if not normalized:
+            return None
+
+        # Level 1: Exact match
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            return exact
+
+        # Level 2: Bidirectional substring match
+        substring = self._match_substring(normalized)
+        if substring is not None:
+            return substring
+
+        # Level 3: Token-based fuzzy match
+        # There are some occasions where words are mixed between titles:
+        # "is" in fahrplan but "are" in media title
+        tokens = frozenset(normalized.split())
+
+        # A candidate this similar shares at least threshold * len(tokens) of the
+        # tokens, so it contains one of any len(tokens) - that + 1 of them; only
+        # the candidates listed under the rarest ones need a look
+        probes = len(tokens) - int(self.threshold * len(tokens)) + 1
+        rarest = sorted(tokens, key=lambda token: len(self._token_postings.get(token, ())))
+        candidates: set[int] = set()
+        for token in rarest[:probes]:
+            candidates.update(self._token_postings.get(token, ()))
+
+        for idx in sorted(candidates):
+            if _jaccard_similarity(tokens, self._tokens[idx]) >= self.threshold:
+                return idx
+
+        return None
+
+    def _match_substring(self, normalized: str) -> int | None:
+        """Find the first candidate containing or contained in a normalized title."""
+        matches = []
+
+        # Candidates contained in the title are among its substrings
+        for length in self._lengths:
+            if length >= len(normalized):
+                continue
+            for start in range(len(normalized) - length + 1):
+                idx = self._exact.get(normalized[start : start + length])
+                if idx is not None:
+                    matches.append(idx)
+
+        # Candidates containing the title contain each of its n-grams
+        ngrams = _ngrams(normalized)
+        if ngrams:
+            rarest = min(ngrams, key=lambda ngram: len(self._ngram_postings.get(ngram, ())))
+            pool: Iterable[int] = self._ngram_postings.get(rarest, ())
+        else:
+            # Titles shorter than an n-gram are compared with every candidate
+            pool = range(len(self._normalized))
+
+        # Postings are in input order, so the first hit is the earliest
+        for idx in pool:
+            if normalized in self._normalized[idx]:
+                matches.append(idx)
+                break
+
+        return min(matches, default=None)
@@ -1,17 +1,43 @@
 """RSS feed generation with feedback formatting."""
 
+import json
+import marshal
+import threading
 from email.utils import formatdate
 from pathlib import Path
 from typing import Any, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
+from media_feed import __version__
+from media_feed.utils.cache_utils import (
+    compute_content_hash,
+    get_cache_directory,
+    get_cache_path,
+    read_marshal_cache,
+    write_marshal_cache,
+)
 from media_feed.utils.file_utils import atomic_write
 from media_feed.utils.logger import get_logger
 from media_feed.utils.yaml_utils import validate_yaml_data
 
 logger = get_logger(__name__)
 
+# Feed and feed item templates, shipped next to this module
+RSS_TEMPLATE_NAME = "rss_template.xml.j2"
+RSS_ITEM_TEMPLATE_NAME = "rss_item.xml.j2"
+
+# Bump when the rendering of items changes outside the item template (e.g. in
+# format_item_description)
+FRAGMENT_CACHE_VERSION = 1
+
+# Compiled templates are kept in this subdirectory of the cache directory, so
+# a new process loads them instead of compiling the template again
+TEMPLATE_BYTECODE_DIR = "jinja"
+
+_environment: Optional[Environment] = None
+_environment_lock = threading.Lock()
+
 
 def _normalize_feed_for_comparison(xml_content: str) -> str:
     """Normalize RSS feed by removing timestamp fields for comparison.
@@ -44,6 +70,117 @@ def _normalize_feed_for_comparison(xml_content: str) -> str:
     return normalized.strip()
 
 
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Get the persistent bytecode cache, or None if it cannot be created."""
+    try:
+        bytecode_dir = get_cache_directory() / TEMPLATE_BYTECODE_DIR
+        bytecode_dir.mkdir(exist_ok=True, mode=0o700)
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(str(bytecode_dir))
+
+
+def get_template_environment() -> Environment:
+    """Get the Jinja2 environment shared by all feed builds, creating it on first use.
+
+    The environment keeps compiled templates in memory for the lifetime of the
+    process and in a bytecode cache on disk across processes. Both are
+    invalidated when the template file changes.
+
+    Returns:
+        Shared Jinja2 environment
+    """
+    global _environment
+
+    with _environment_lock:
+        if _environment is None:
+            _environment = Environment(
+                loader=FileSystemLoader(str(Path(__file__).parent)),
+                bytecode_cache=_get_bytecode_cache(),
+            )
+        return _environment
+
+
+def get_rss_template() -> Template:
+    """Get the compiled RSS feed template.
+
+    Returns:
+        Compiled template
+    """
+    return get_template_environment().get_template(RSS_TEMPLATE_NAME)
+
+
+def _get_fragment_cache_key() -> str:
+    """Get the key identifying how item fragments are rendered."""
+    template_source = (Path(__file__).parent / RSS_ITEM_TEMPLATE_NAME).read_bytes()
+    template_hash = compute_content_hash(template_source)
+    return f"rss-fragments:{FRAGMENT_CACHE_VERSION}:{__version__}:{template_hash}"
+
+
+def _get_item_hash(item: dict[str, Any], image_url: str) -> str:
+    """Hash everything the rendered fragment of an item depends on."""
+    try:
+        # Much faster than JSON; the key order of YAML items is stable
+        content = marshal.dumps((item, image_url))
+    except ValueError:
+        # Values YAML loads as other types (e.g. unquoted dates)
+        content = json.dumps([item, image_url], sort_keys=True, default=str).encode("utf-8")
+    return compute_content_hash(content)
+
+
+def render_item_fragments(
+    items: list[dict[str, Any]], image_url: str, cache_path: Optional[Path] = None
+) -> list[str]:
+    """Render the <item> XML fragments of published feed items.
+
+    With a cache path, fragments are stored by a hash of their item and the
+    feed image URL, so a rebuild only renders items that changed since the
+    last build. Fragments of items no longer in the feed are dropped. The
+    store is kept uncompressed: it is rewritten whenever an item changes, and
+    compressing it would take longer than rendering the items.
+
+    Args:
+        items: Feed items; items without a published date are skipped
+        image_url: Image URL of the feed, used for every item
+        cache_path: Fragment cache file (None renders every item)
+
+    Returns:
+        Rendered fragments in item order
+    """
+    cache_key = _get_fragment_cache_key()
+    cached: dict[str, str] = {}
+    if cache_path is not None:
+        cached = read_marshal_cache(cache_path, cache_key) or {}
+
+    template = get_template_environment().get_template(RSS_ITEM_TEMPLATE_NAME)
+    fragments: dict[str, str] = {}
+    ordered: list[str] = []
+
+    for item in items:
+        if not item.get("published"):
+            continue
+
+        item_hash = _get_item_hash(item, image_url)
+        fragment = fragments.get(item_hash) or cached.get(item_hash)
+        if fragment is None:
+            fragment = template.render(
+                item=item,
+                image_url=image_url,
+                format_item_description=format_item_description,
+            )
+        fragments[item_hash] = fragment
+        ordered.append(fragment)
+
+    rendered = len(fragments.keys() - cached.keys())
+    logger.debug(f"Rendered {rendered} of {len(ordered)} item(s), rest from cache")
+
+    if cache_path is not None and fragments != cached:
+        write_marshal_cache(cache_path, cache_key, fragments, compress=False)
+
+    return ordered
+
+
 # Feedback formatting functions
 
 
@@ -199,15 +336,20 @@ def generate_rss_feed(
     output_file: Path,
     include_all_ratings: bool = False,
     validate: bool = True,
+    use_fragment_cache: bool = True,
 ) -> tuple[Path, bool]:
     """Generate RSS feed from YAML data.
 
+    Items are rendered into XML fragments that are cached per output file, so
+    rebuilding a feed only renders the items that changed.
+
     Args:
         data: YAML data dictionary
         global_config: Global configuration
         output_file: Path to output RSS file
         include_all_ratings: If False, exclude talks with rating ≤2
         validate: Perform validation before generation
+        use_fragment_cache: Reuse item fragments rendered by previous builds
 
     Returns:
         Tuple of (path to RSS file, whether file was written)
@@ -229,10 +371,24 @@ def generate_rss_feed(
     if "feed" in data:
         data["feed"] = filter_feed_by_rating(data["feed"], include_all_ratings)
 
-    # Load Jinja2 template
-    template_dir = Path(__file__).parent
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
-    template = env.get_template("rss_template.xml.j2")
+    # Compiled once per process (or loaded from the bytecode cache)
+    template = get_rss_template()
+
+    # Items show the feed image, falling back to the global one like the channel
+    meta = data.get("meta") or {}
+    image_url = meta["image_url"] if "image_url" in meta else global_config.get("image_url", "")
+
+    fragment_cache_path = None
+    if use_fragment_cache:
+        try:
+            fragment_cache_path = get_cache_path(
+                f"rss-fragments:{output_file.resolve()}", extension=".fragments"
+            )
+        except OSError as e:
+            logger.warning(f"Feed fragment cache disabled: {e}")
+    item_fragments = render_item_fragments(
+        data.get("feed") or [], str(image_url), fragment_cache_path
+    )
 
     # Render with current timestamp
     now = formatdate(timeval=None, localtime=False, usegmt=True)
@@ -241,7 +397,7 @@ def generate_rss_feed(
         global_config=global_config,
         now=now,
         generator="media-feed Python CLI",
-        format_item_description=format_item_description,
+        item_fragments=item_fragments,
     )
 
     # Write atomically
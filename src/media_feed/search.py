@@ -0,0 +1,179 @@
+"""Ranked full-text search over talk index records."""
+
+import heapq
+import math
+import re
+from collections.abc import Sequence
+from typing import Any
+
+# Fields searched and how much a term occurrence in each of them counts
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "subtitle": 2.0,
+    "speakers": 2.0,
+    "track": 1.0,
+    "description": 1.0,
+}
+
+# BM25 parameters: term frequency saturation and document length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Score multiplier for talks whose title contains the whole query
+TITLE_PHRASE_BOOST = 2.0
+
+# Share of the distinct query terms a talk has to contain to be a hit, so a
+# common word like "the" alone does not make a talk a candidate
+MIN_TERM_MATCH_SHARE = 0.75
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms in text order
+    """
+    return _WORD_PATTERN.findall(text.casefold())
+
+
+def required_term_matches(term_count: int) -> int:
+    """Get how many of term_count distinct query terms a hit has to contain.
+
+    Args:
+        term_count: Number of distinct query terms
+
+    Returns:
+        Minimum number of matching terms
+    """
+    return math.ceil(term_count * MIN_TERM_MATCH_SHARE)
+
+
+def _idf(doc_count: int, doc_frequency: int) -> float:
+    """Inverse document frequency of a term found in doc_frequency of doc_count talks."""
+    return math.log(1 + (doc_count - doc_frequency + 0.5) / (doc_frequency + 0.5))
+
+
+class TalkIndex:
+    """Talk records of an event with precomputed BM25 term statistics.
+
+    Every talk is a document whose fields are weighted by FIELD_WEIGHTS (a
+    simplified BM25F). Postings and document lengths are computed once when the
+    index is built and stored along with the talks, so a search only walks the
+    postings of the query terms and keeps the best hits in a bounded heap.
+    """
+
+    def __init__(
+        self,
+        talks: list[dict[str, Any]],
+        postings: dict[str, list[list[float]]] | None = None,
+        doc_lengths: list[float] | None = None,
+    ):
+        self.talks = talks
+        if postings is None or doc_lengths is None:
+            postings, doc_lengths = self._compute_statistics(talks)
+        self.postings = postings
+        self.doc_lengths = doc_lengths
+        self.avg_doc_length = sum(doc_lengths) / len(doc_lengths) if doc_lengths else 0.0
+        self._title_phrases = [" ".join(tokenize(talk["title"])) for talk in talks]
+        # Hash of the XML content the index was built from, set by the loader
+        self.content_hash = ""
+
+    @staticmethod
+    def _compute_statistics(
+        talks: list[dict[str, Any]],
+    ) -> tuple[dict[str, list[list[float]]], list[float]]:
+        """Compute weighted term frequencies per talk and talk lengths."""
+        postings: dict[str, list[list[float]]] = {}
+        doc_lengths: list[float] = []
+
+        for doc, talk in enumerate(talks):
+            frequencies: dict[str, float] = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                for term in tokenize(str(talk.get(field, ""))):
+                    frequencies[term] = frequencies.get(term, 0.0) + weight
+
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, []).append([doc, frequency])
+            doc_lengths.append(sum(frequencies.values()))
+
+        return postings, doc_lengths
+
+    def idf(self, term: str) -> float:
+        """Inverse document frequency of a term."""
+        return _idf(len(self.talks), len(self.postings.get(term, ())))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        corpus: Sequence["TalkIndex"] | None = None,
+    ) -> list[tuple[float, dict[str, Any]]]:
+        """Rank talks by BM25 relevance for a query.
+
+        Only talks containing at least MIN_TERM_MATCH_SHARE of the distinct
+        query terms are hits.
+
+        Args:
+            query: Search query
+            limit: Maximum number of hits
+            corpus: Indexes searched together with this one (including it). Term
+                rarity and average talk length are taken over all of them, so the
+                scores of their hits can be compared. Default: this index alone
+
+        Returns:
+            List of (score, talk) tuples, best first
+        """
+        if corpus is None:
+            corpus = [self]
+        doc_count = sum(len(index.talks) for index in corpus)
+        avg_doc_length = (
+            sum(index.avg_doc_length * len(index.talks) for index in corpus) / doc_count
+            if doc_count
+            else 0.0
+        )
+
+        scores: dict[int, float] = {}
+        matched_terms: dict[int, int] = {}
+
+        terms = set(tokenize(query))
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = _idf(doc_count, sum(len(index.postings.get(term, ())) for index in corpus))
+            for doc, frequency in postings:
+                doc = int(doc)
+                length_norm = 1 - BM25_B + BM25_B * self.doc_lengths[doc] / avg_doc_length
+                term_score = idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                scores[doc] = scores.get(doc, 0.0) + term_score
+                matched_terms[doc] = matched_terms.get(doc, 0) + 1
+
+        required = required_term_matches(len(terms))
+        scores = {doc: score for doc, score in scores.items() if matched_terms[doc] >= required}
+
+        phrase = " ".join(tokenize(query))
+        if phrase:
+            for doc in scores:
+                if phrase in self._title_phrases[doc]:
+                    scores[doc] *= TITLE_PHRASE_BOOST
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda hit: (hit[1], -hit[0]))
+        return [(score, self.talks[doc]) for doc, score in best]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the index for the cache."""
+        return {
+            "talks": self.talks,
+            "postings": self.postings,
+            "doc_lengths": self.doc_lengths,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TalkIndex":
+        """Restore an index serialized with to_dict."""
+        return cls(data["talks"], data["postings"], data["doc_lengths"])
@@ -1,16 +1,191 @@
 """Secure caching utilities."""
 
+import gzip
 import hashlib
+import io
+import json
+import marshal
+import os
+import re
+import tempfile
+import threading
 import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+from media_feed.utils.file_utils import atomic_write
 from media_feed.utils.logger import get_logger
 
+try:
+    import fcntl
+except ImportError:  # Windows: locks only serialize threads of one process
+    fcntl = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 # Cache settings
 CACHE_MAX_AGE_DAYS = 7
+# Past CACHE_MAX_AGE_DAYS, entries may still be served stale while they are
+# refreshed in the background (opt-in, see download_to_cache)
+CACHE_STALE_GRACE_DAYS = 7
+
+# Cache entries are stored gzip-compressed; entries without the gzip magic
+# bytes (written by older versions) are read as-is
+CACHE_COMPRESSION_LEVEL = 6
+CACHE_CHUNK_SIZE = 64 * 1024  # 64 KB
+GZIP_MAGIC = b"\x1f\x8b"
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# The manifest tracks every cache entry (URL, size, access statistics and
+# validators); least recently used entries are evicted beyond the byte budget
+CACHE_MANIFEST_FILE = "manifest.json"
+CACHE_MANIFEST_VERSION = 1
+CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+# Overrides CACHE_MAX_BYTES, as a size like 200M or 2G
+CACHE_MAX_SIZE_ENV = "MEDIA_FEED_CACHE_MAX_SIZE"
+
+# Multipliers of the accepted byte size suffixes
+BYTE_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+# Lock files serializing writers of one cache entry across processes
+CACHE_LOCK_DIR = "locks"
+CACHE_LOCK_SUFFIX = ".lock"
+
+# Partial downloads are kept next to their entry until they complete
+CACHE_PART_SUFFIX = ".part"
+
+_cache_locks: dict[Path, "CacheLock"] = {}
+_cache_locks_guard = threading.Lock()
+
+# In-process tier in front of the disk cache for parsed structures (e.g. talk
+# indexes)
+MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+
+class _GzipDecoder:
+    """Incrementally decompress gzip data in bounded output chunks."""
+
+    def __init__(self) -> None:
+        self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+
+    def decode(self, data: bytes) -> Iterator[bytes]:
+        """Decompress the next piece of gzip data (handles multiple members)."""
+        while data:
+            if self._decompressor.eof:
+                self._decompressor = zlib.decompressobj(_GZIP_WBITS)
+            yield self._decompressor.decompress(data, CACHE_CHUNK_SIZE)
+            data = self._decompressor.unconsumed_tail or self._decompressor.unused_data
+
+    def finish(self) -> None:
+        """Check that the data ended on a complete gzip member."""
+        if not self._decompressor.eof:
+            raise ValueError("Compressed content is truncated")
+
+
+class MemoryCache:
+    """Size-bounded in-process LRU cache.
+
+    Holds parsed structures so repeated reads within one process skip the disk
+    and the parser. When the total size exceeds max_bytes, the least recently
+    used values are dropped.
+    """
+
+    policy = "lru"
+
+    def __init__(self, max_bytes: int = MEMORY_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """Store a value, evicting least recently used values beyond the cap.
+
+        Values larger than the cap are not stored.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size in bytes (e.g. of the serialized value)
+        """
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def _discard(self, key: Hashable) -> None:
+        """Remove a value if present (lock must be held)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Drop all values and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get the eviction policy, occupancy and hit/miss counters.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        with self._lock:
+            return {
+                "policy": self.policy,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_memory_cache = MemoryCache()
+
+
+def get_memory_cache() -> MemoryCache:
+    """Get the process-wide in-memory cache tier.
+
+    Returns:
+        Shared MemoryCache instance
+    """
+    return _memory_cache
 
 
 def get_cache_directory() -> Path:
@@ -24,6 +199,44 @@ def get_cache_directory() -> Path:
     return cache_dir
 
 
+def parse_byte_size(value: str) -> int:
+    """Parse a byte size like '500M' or '2G'.
+
+    Args:
+        value: Number of bytes with an optional K, M or G suffix
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the value is not a size
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*", value, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"expected a size like 500M or 2G, got {value!r}")
+
+    number, unit = match.groups()
+    return int(float(number) * BYTE_SIZE_UNITS[unit.upper()])
+
+
+def get_cache_max_bytes() -> int:
+    """Get the byte budget of the disk cache.
+
+    Returns:
+        Size from the MEDIA_FEED_CACHE_MAX_SIZE environment variable, or
+        CACHE_MAX_BYTES if it is unset or invalid
+    """
+    value = os.environ.get(CACHE_MAX_SIZE_ENV)
+    if not value:
+        return CACHE_MAX_BYTES
+
+    try:
+        return parse_byte_size(value)
+    except ValueError as e:
+        logger.warning(f"Ignoring {CACHE_MAX_SIZE_ENV}: {e}")
+        return CACHE_MAX_BYTES
+
+
 def get_cache_path(url: str, extension: str = "") -> Path:
     """Get cache file path for a URL.
 
@@ -68,58 +281,893 @@ def is_cache_valid(cache_path: Path, max_age_days: int = CACHE_MAX_AGE_DAYS) ->
         return False
 
 
-def read_cache(cache_path: Path, max_size: Optional[int] = None) -> Optional[bytes]:
+def lookup_cache(
+    cache_path: Path, max_size: Optional[int] = None, check_age: bool = True
+) -> Optional[Path]:
+    """Check that a cache entry is usable without reading it.
+
+    Args:
+        cache_path: Path to cached file
+        max_size: Maximum file size in bytes (as stored on disk)
+        check_age: Treat entries older than CACHE_MAX_AGE_DAYS as invalid
+
+    Returns:
+        Path to the cached file or None if invalid
+    """
+    if not cache_path.exists() or (check_age and not is_cache_valid(cache_path)):
+        return None
+
+    try:
+        file_size = cache_path.stat().st_size
+    except OSError as e:
+        logger.warning(f"Failed to read cache: {e}")
+        return None
+
+    if max_size and file_size > max_size:
+        logger.warning(
+            f"Cached file {cache_path.name} exceeds size limit ({file_size} > {max_size})"
+        )
+        return None
+
+    logger.debug(f"Cache hit: {cache_path.name}")
+    _record_access(cache_path)
+    return cache_path
+
+
+def read_cache(
+    cache_path: Path, max_size: Optional[int] = None, check_age: bool = True
+) -> Optional[bytes]:
     """Read cached content if valid.
 
     Args:
         cache_path: Path to cached file
         max_size: Maximum file size in bytes
+        check_age: Treat entries older than CACHE_MAX_AGE_DAYS as invalid
 
     Returns:
         Cached content or None if invalid
     """
-    if not is_cache_valid(cache_path):
+    if lookup_cache(cache_path, max_size=max_size, check_age=check_age) is None:
         return None
 
     try:
-        if max_size:
-            file_size = cache_path.stat().st_size
-            if file_size > max_size:
-                logger.warning(
-                    f"Cached file {cache_path.name} exceeds size limit ({file_size} > {max_size})"
-                )
-                return None
-
-        content = cache_path.read_bytes()
-        logger.debug(f"Cache hit: {cache_path.name}")
-        return content
-
-    except OSError as e:
+        return read_cache_entry(cache_path, max_size=max_size)
+    except (OSError, ValueError, zlib.error) as e:
         logger.warning(f"Failed to read cache: {e}")
         return None
 
 
-def write_cache(cache_path: Path, content: bytes) -> None:
-    """Write content to cache file securely.
+def read_cache_entry(cache_path: Path, max_size: Optional[int] = None) -> bytes:
+    """Read the decompressed content of a cache entry.
+
+    Unlike read_cache(), the entry is not checked for age and no access is
+    recorded.
+
+    Args:
+        cache_path: Path to cached file
+        max_size: Maximum decompressed size in bytes
+
+    Returns:
+        Cached content
+
+    Raises:
+        OSError: If the cache file cannot be read
+        ValueError: If the content exceeds max_size or is corrupt
+    """
+    data = cache_path.read_bytes()
+    return _decompress(data, max_size) if data.startswith(GZIP_MAGIC) else data
+
+
+def _decompress(data: bytes, max_size: Optional[int] = None) -> bytes:
+    """Decompress gzip data, refusing to inflate it beyond max_size."""
+    decoder = _GzipDecoder()
+    content = bytearray()
+    for chunk in decoder.decode(data):
+        content += chunk
+        if max_size and len(content) > max_size:
+            raise ValueError(f"Decompressed content exceeds maximum size ({max_size} bytes)")
+    decoder.finish()
+    return bytes(content)
+
+
+def is_compressed_cache(cache_path: Path) -> bool:
+    """Check whether a cache entry is stored gzip-compressed.
+
+    Args:
+        cache_path: Path to cached file
+
+    Returns:
+        True if the file starts with the gzip magic bytes
+    """
+    with open(cache_path, "rb") as f:
+        return f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+def open_cache_entry(cache_path: Path) -> io.BufferedIOBase:
+    """Open a cache entry for reading its decompressed content.
+
+    Args:
+        cache_path: Path to cached file
+
+    Returns:
+        Binary file-like object yielding the original content
+
+    Raises:
+        OSError: If the cache file cannot be opened
+    """
+    if is_compressed_cache(cache_path):
+        return gzip.open(cache_path, "rb")
+    return open(cache_path, "rb")
+
+
+def write_cache(
+    cache_path: Path,
+    content: bytes,
+    max_cache_bytes: Optional[int] = None,
+    compress: bool = True,
+) -> None:
+    """Write content gzip-compressed to cache file securely.
 
     Args:
         content: Content to cache
         cache_path: Path to cache file
+        max_cache_bytes: Byte budget of the cache directory enforced after the
+            write (default: get_cache_max_bytes())
+        compress: Compress the content; large artifacts that are rewritten on
+            every run may be stored as-is, trading disk space for speed
     """
     try:
         # Ensure cache directory exists with secure permissions
         cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
 
-        # Write with secure permissions (user read/write only)
-        cache_path.write_bytes(content)
-        cache_path.chmod(0o600)
+        if compress:
+            content = gzip.compress(content, compresslevel=CACHE_COMPRESSION_LEVEL, mtime=0)
+
+        # Write to a uniquely named temporary file with user-only permissions
+        # and rename it into place, so concurrent writers never interleave
+        fd, temp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+        )
+        try:
+            with open(fd, "wb") as f:
+                f.write(content)
+            Path(temp_name).replace(cache_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
 
         logger.debug(f"Cached: {cache_path.name}")
+        _record_write(cache_path, max_cache_bytes)
 
     except OSError as e:
         logger.warning(f"Failed to write cache: {e}")
 
 
+def write_cache_stream(
+    cache_path: Path,
+    chunks: Iterable[bytes],
+    max_size: Optional[int] = None,
+    max_cache_bytes: Optional[int] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> tuple[int, str]:
+    """Stream content into a gzip-compressed cache file, replacing it atomically.
+
+    Chunks are written to a temporary file in the cache directory while their
+    size is checked and their SHA-256 computed, then the file is renamed into
+    place. Readers never see a partially written entry, and memory use does not
+    grow with the content size.
+
+    Args:
+        cache_path: Path to cache file
+        chunks: Content chunks, in order
+        max_size: Maximum content size in bytes
+        max_cache_bytes: Byte budget of the cache directory enforced after the
+            write (default: get_cache_max_bytes())
+        metadata: Manifest metadata (e.g. URL and validators) recorded in the
+            same update as the size and digest
+
+    Returns:
+        Tuple of (content size in bytes, SHA-256 hex digest of the content)
+
+    Raises:
+        ValueError: If content exceeds max_size
+        OSError: If the cache file cannot be written
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+    # mkstemp creates the file with user-only permissions
+    fd, temp_name = tempfile.mkstemp(
+        dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+    )
+    temp_path = Path(temp_name)
+    digest = hashlib.sha256()
+    size = 0
+    encoder = zlib.compressobj(CACHE_COMPRESSION_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+
+    try:
+        with open(fd, "wb") as f:
+            for chunk in chunks:
+                size += len(chunk)
+                if max_size and size > max_size:
+                    raise ValueError(f"Downloaded content exceeds maximum size ({max_size} bytes)")
+                digest.update(chunk)
+                f.write(encoder.compress(chunk))
+            f.write(encoder.flush())
+
+        temp_path.replace(cache_path)
+
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    logger.debug(f"Cached: {cache_path.name}")
+    sha256 = digest.hexdigest()
+    _record_write(cache_path, max_cache_bytes, size, sha256, metadata)
+    return size, sha256
+
+
+def move_into_cache(
+    source_path: Path,
+    cache_path: Path,
+    max_size: Optional[int] = None,
+    max_cache_bytes: Optional[int] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> tuple[int, str]:
+    """Move a gzip-compressed file into the cache, replacing the entry atomically.
+
+    The file is decompressed once to check its size and compute its SHA-256,
+    then renamed into place without being copied. It must be on the same file
+    system as the cache directory, e.g. a partial download kept next to the
+    entry.
+
+    Args:
+        source_path: Gzip-compressed file (one or more members)
+        cache_path: Path to cache file
+        max_size: Maximum decompressed content size in bytes
+        max_cache_bytes: Byte budget of the cache directory enforced after the
+            move (default: get_cache_max_bytes())
+        metadata: Manifest metadata (e.g. URL and validators) recorded in the
+            same update as the size and digest
+
+    Returns:
+        Tuple of (decompressed content size in bytes, SHA-256 hex digest of the
+        decompressed content)
+
+    Raises:
+        ValueError: If content exceeds max_size or is truncated
+        zlib.error: If the file is not valid gzip data
+        OSError: If the file cannot be read or moved
+    """
+    digest = hashlib.sha256()
+    size = 0
+    decoder = _GzipDecoder()
+
+    with open(source_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CACHE_CHUNK_SIZE), b""):
+            for content in decoder.decode(chunk):
+                size += len(content)
+                if max_size and size > max_size:
+                    raise ValueError(f"Downloaded content exceeds maximum size ({max_size} bytes)")
+                digest.update(content)
+    decoder.finish()
+
+    source_path.chmod(0o600)
+    source_path.replace(cache_path)
+
+    logger.debug(f"Cached: {cache_path.name}")
+    sha256 = digest.hexdigest()
+    _record_write(cache_path, max_cache_bytes, size, sha256, metadata)
+    return size, sha256
+
+
+class CacheLock:
+    """Exclusive lock on a cache file, shared by threads and processes.
+
+    Threads of a process serialize on a reentrant lock; the outermost holder
+    also takes an flock() on a lock file, so other processes wait as well.
+    Where fcntl is unavailable, only threads of the same process are serialized.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.lock_path = cache_path.parent / CACHE_LOCK_DIR / (cache_path.name + CACHE_LOCK_SUFFIX)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Block until the lock is held by the calling thread."""
+        self._lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            self._fd = self._lock_file()
+        self._depth += 1
+
+    def _lock_file(self) -> Optional[int]:
+        """Open and flock() the lock file, or return None if that fails."""
+        assert fcntl is not None
+        while True:
+            try:
+                self.lock_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+                fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            except OSError as e:
+                # A read-only cache must not make every access fail
+                logger.warning(f"Failed to open cache lock {self.lock_path.name}: {e}")
+                return None
+
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError as e:
+                logger.warning(f"Failed to lock {self.lock_path.name}: {e}")
+                os.close(fd)
+                return None
+
+            # prune_cache deletes unused lock files; a lock on a file deleted
+            # while we waited for it excludes nobody, so lock the new one
+            if _is_same_file(fd, self.lock_path):
+                return fd
+            os.close(fd)
+
+    def release(self) -> None:
+        """Release one level of the lock held by the calling thread."""
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            # Closing the descriptor drops the flock
+            os.close(self._fd)
+            self._fd = None
+        self._lock.release()
+
+    def __enter__(self) -> "CacheLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+def _is_same_file(fd: int, path: Path) -> bool:
+    """Check whether an open file is still the file at a path."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_dev, opened.st_ino) == (stat.st_dev, stat.st_ino)
+
+
+def _reset_cache_locks() -> None:
+    """Drop the locks inherited by a forked child process.
+
+    The child must not keep the parent's lock file descriptors open: the flock
+    would stay held until the child exits. Locks held by parent threads that do
+    not exist in the child would never be released either.
+    """
+    global _cache_locks_guard
+
+    for lock in _cache_locks.values():
+        if lock._fd is not None:
+            os.close(lock._fd)
+    _cache_locks.clear()
+    _cache_locks_guard = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_cache_locks)
+
+
+def lock_cache_entry(cache_path: Path) -> CacheLock:
+    """Get the lock serializing writers of a cache entry.
+
+    Hold it while producing an entry so that concurrent threads and processes
+    wait for one writer and then reuse its result instead of repeating the work.
+
+    Args:
+        cache_path: Path to cached file
+
+    Returns:
+        Reentrant lock usable as a context manager
+    """
+    with _cache_locks_guard:
+        lock = _cache_locks.get(cache_path)
+        if lock is None:
+            lock = _cache_locks[cache_path] = CacheLock(cache_path)
+        return lock
+
+
+def get_manifest_path(cache_dir: Optional[Path] = None) -> Path:
+    """Get the path of the cache manifest.
+
+    Args:
+        cache_dir: Cache directory (default: user cache directory)
+
+    Returns:
+        Path to the manifest file
+    """
+    return (cache_dir or get_cache_directory()) / CACHE_MANIFEST_FILE
+
+
+def read_manifest(cache_dir: Optional[Path] = None) -> dict[str, dict[str, Any]]:
+    """Read the cache manifest.
+
+    Args:
+        cache_dir: Cache directory (default: user cache directory)
+
+    Returns:
+        Manifest entries by cache file name, empty if missing or unreadable
+    """
+    manifest_path = get_manifest_path(cache_dir)
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        manifest = json.loads(manifest_path.read_bytes())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read cache manifest: {e}")
+        return {}
+
+    if not isinstance(manifest, dict) or manifest.get("version") != CACHE_MANIFEST_VERSION:
+        logger.debug("Ignoring cache manifest of another version")
+        return {}
+
+    entries = manifest.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+@contextmanager
+def _edit_manifest(cache_dir: Path) -> Iterator[dict[str, dict[str, Any]]]:
+    """Read, modify and write back the manifest of a cache directory."""
+    with lock_cache_entry(get_manifest_path(cache_dir)):
+        entries = read_manifest(cache_dir)
+        yield entries
+        try:
+            atomic_write(
+                get_manifest_path(cache_dir),
+                json.dumps({"version": CACHE_MANIFEST_VERSION, "entries": entries}),
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write cache manifest: {e}")
+
+
+def _record_access(cache_path: Path) -> None:
+    """Count a cache hit and mark the entry as recently used."""
+    with _edit_manifest(cache_path.parent) as entries:
+        entry = entries.setdefault(cache_path.name, {"hits": 0, "fetches": 0})
+        entry["hits"] = entry.get("hits", 0) + 1
+        entry["last_access"] = time.time()
+
+
+def _record_write(
+    cache_path: Path,
+    max_cache_bytes: Optional[int],
+    content_size: Optional[int] = None,
+    sha256: Optional[str] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> None:
+    """Record a (re)written cache entry and enforce the byte budget.
+
+    The stored size, content digest and metadata change in one manifest update,
+    so readers never see the digest of the previous content next to the new size.
+    """
+    with _edit_manifest(cache_path.parent) as entries:
+        entry = entries.setdefault(cache_path.name, {"hits": 0, "fetches": 0})
+        entry["size"] = cache_path.stat().st_size
+        if sha256 is None:
+            entry.pop("content_size", None)
+            entry.pop("sha256", None)
+        else:
+            entry["content_size"] = content_size
+            entry["sha256"] = sha256
+        entry.update(metadata or {})
+        entry["fetches"] = entry.get("fetches", 0) + 1
+        entry["last_access"] = time.time()
+
+        if max_cache_bytes is None:
+            max_cache_bytes = get_cache_max_bytes()
+        _evict_entries(cache_path.parent, entries, max_cache_bytes, keep=cache_path.name)
+
+
+def _evict_entries(
+    cache_dir: Path,
+    entries: dict[str, dict[str, Any]],
+    max_bytes: int,
+    keep: Optional[str] = None,
+) -> list[str]:
+    """Delete least recently used entries until the total size fits max_bytes."""
+    evicted = []
+
+    # Forget entries whose files were removed behind our back
+    for name in [name for name in entries if not (cache_dir / name).exists()]:
+        del entries[name]
+
+    total = sum(entry.get("size", 0) for entry in entries.values())
+    by_last_access = sorted(entries, key=lambda name: entries[name].get("last_access", 0))
+
+    for name in by_last_access:
+        if total <= max_bytes:
+            break
+        if name == keep:
+            continue
+        try:
+            (cache_dir / name).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to evict cache entry {name}: {e}")
+            continue
+        total -= entries.pop(name).get("size", 0)
+        evicted.append(name)
+
+    if evicted:
+        logger.info(f"Evicted {len(evicted)} least recently used cache file(s)")
+    return evicted
+
+
+def prune_cache(
+    max_age_days: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> list[str]:
+    """Delete cache entries older than an age and/or beyond a byte budget.
+
+    Downloads without an ETag or Last-Modified validator are aged from when
+    they were written, since they must be fetched again once expired. Derived
+    artifacts (parsed indexes, records, rendered fragments, link check results)
+    and revalidatable downloads are aged from when they were last used.
+
+    Leftovers of interrupted downloads and writes older than max_age_days (or
+    the cache lifetime) and lock files of entries that no longer exist are
+    swept as well.
+
+    Args:
+        max_age_days: Delete entries written or last used longer ago than this
+        max_bytes: Then evict least recently used entries beyond this budget
+        cache_dir: Cache directory (default: user cache directory)
+
+    Returns:
+        Names of the deleted cache files
+    """
+    cache_dir = cache_dir or get_cache_directory()
+    pruned: list[str] = []
+
+    with _edit_manifest(cache_dir) as entries:
+        if max_age_days is not None:
+            cutoff = time.time() - max_age_days * 24 * 60 * 60
+            for name in list(entries):
+                path = cache_dir / name
+                try:
+                    if path.exists() and _last_used(entries[name], path) >= cutoff:
+                        continue
+                    path.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"Failed to prune cache entry {name}: {e}")
+                    continue
+                del entries[name]
+                pruned.append(name)
+
+        if max_bytes is not None:
+            pruned.extend(_evict_entries(cache_dir, entries, max_bytes))
+
+    orphan_age_days = CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    pruned.extend(_sweep_orphans(cache_dir, time.time() - orphan_age_days * 24 * 60 * 60))
+
+    logger.info(f"Pruned {len(pruned)} cached file(s)")
+    return pruned
+
+
+def _last_used(entry: dict[str, Any], path: Path) -> float:
+    """Get the time age pruning counts a cache entry as last used.
+
+    Only downloads record their URL; derived artifacts are written without one.
+    """
+    written = path.stat().st_mtime
+    if entry.get("url") and not (entry.get("etag") or entry.get("last_modified")):
+        return written
+    return max(written, float(entry.get("last_access", 0)))
+
+
+def _sweep_orphans(cache_dir: Path, cutoff: float) -> list[str]:
+    """Delete stale partial downloads, temporary files and unused lock files."""
+    swept = []
+
+    for path in cache_dir.iterdir():
+        name = path.name
+        is_part = name.endswith((CACHE_PART_SUFFIX, f"{CACHE_PART_SUFFIX}.json"))
+        is_temp = name.startswith(".") and name.endswith(".tmp")
+        if not (is_part or is_temp):
+            continue
+        try:
+            # Downloads and writes in progress keep touching their files
+            if path.stat().st_mtime >= cutoff:
+                continue
+            path.unlink()
+        except OSError as e:
+            logger.warning(f"Failed to sweep {name}: {e}")
+            continue
+        swept.append(name)
+
+    lock_dir = cache_dir / CACHE_LOCK_DIR
+    if fcntl is None or not lock_dir.is_dir():
+        return swept
+
+    for lock_path in lock_dir.iterdir():
+        entry_name = lock_path.name.removesuffix(CACHE_LOCK_SUFFIX)
+        if (cache_dir / entry_name).exists():
+            continue
+        if _remove_unused_lock(lock_path):
+            swept.append(f"{CACHE_LOCK_DIR}/{lock_path.name}")
+
+    return swept
+
+
+def _remove_unused_lock(lock_path: Path) -> bool:
+    """Delete a lock file unless another thread or process holds it.
+
+    The file is deleted while locked; CacheLock notices when it locked a deleted
+    file and locks the new one instead.
+    """
+    assert fcntl is not None
+    try:
+        fd = os.open(lock_path, os.O_RDWR)
+    except OSError:
+        return False
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        if not _is_same_file(fd, lock_path):
+            return False
+        lock_path.unlink()
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def get_cache_stats(cache_dir: Optional[Path] = None) -> dict[str, Any]:
+    """Summarize the disk cache.
+
+    Args:
+        cache_dir: Cache directory (default: user cache directory)
+
+    Returns:
+        Dictionary with the number and total size of tracked entries, hits,
+        fetches, hit rate, the oldest and newest entries as (name, url, written
+        at) and the number and size of other files in the cache directory
+    """
+    cache_dir = cache_dir or get_cache_directory()
+    entries = read_manifest(cache_dir)
+
+    written: list[tuple[float, str]] = []
+    total_bytes = 0
+    for name in entries:
+        try:
+            stat = (cache_dir / name).stat()
+        except OSError:
+            continue
+        written.append((stat.st_mtime, name))
+        total_bytes += stat.st_size
+    written.sort()
+
+    other_files = [
+        path
+        for path in cache_dir.iterdir()
+        if path.is_file() and path.name not in entries and path.name != CACHE_MANIFEST_FILE
+    ]
+
+    hits = sum(entries[name].get("hits", 0) for _, name in written)
+    fetches = sum(entries[name].get("fetches", 0) for _, name in written)
+
+    def describe(item: tuple[float, str]) -> tuple[str, str, float]:
+        written_at, name = item
+        return name, str(entries[name].get("url", "")), written_at
+
+    return {
+        "directory": str(cache_dir),
+        "entries": len(written),
+        "bytes": total_bytes,
+        "hits": hits,
+        "fetches": fetches,
+        "hit_rate": hits / (hits + fetches) if hits + fetches else 0.0,
+        "oldest": describe(written[0]) if written else None,
+        "newest": describe(written[-1]) if written else None,
+        "other_files": len(other_files),
+        "other_bytes": sum(path.stat().st_size for path in other_files),
+        "max_bytes": get_cache_max_bytes(),
+    }
+
+
+def read_cache_metadata(cache_path: Path) -> dict[str, Any]:
+    """Read the manifest entry (URL, validators, sizes, statistics) of a cache entry.
+
+    Args:
+        cache_path: Path to cached file
+
+    Returns:
+        Copy of the manifest entry, empty if not tracked
+    """
+    with lock_cache_entry(get_manifest_path(cache_path.parent)):
+        return dict(read_manifest(cache_path.parent).get(cache_path.name, {}))
+
+
+def write_cache_metadata(cache_path: Path, metadata: dict[str, Any]) -> None:
+    """Merge metadata into the manifest entry of a cache entry.
+
+    Args:
+        cache_path: Path to cached file
+        metadata: JSON-serializable metadata
+    """
+    with _edit_manifest(cache_path.parent) as entries:
+        entries.setdefault(cache_path.name, {"hits": 0, "fetches": 0}).update(metadata)
+
+
+def touch_cache(cache_path: Path) -> None:
+    """Mark a cache entry as freshly fetched without rewriting it.
+
+    Args:
+        cache_path: Path to cached file
+    """
+    try:
+        os.utime(cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to refresh cache entry {cache_path.name}: {e}")
+
+
+def combine_digests(*digests: str) -> str:
+    """Combine SHA-256 hex digests of several blobs into one.
+
+    Args:
+        digests: SHA-256 hex digests, in order
+
+    Returns:
+        Hex digest identifying the combined content
+    """
+    digest = hashlib.sha256()
+    for part in digests:
+        digest.update(bytes.fromhex(part))
+    return digest.hexdigest()
+
+
+def compute_content_hash(*contents: bytes) -> str:
+    """Compute a SHA-256 hash over one or more content blobs.
+
+    Args:
+        contents: Content blobs to hash, in order
+
+    Returns:
+        Hex digest identifying the combined content
+    """
+    return combine_digests(*(hashlib.sha256(content).hexdigest() for content in contents))
+
+
+def get_cache_digest(cache_path: Path) -> str:
+    """Get the SHA-256 hex digest of a cache entry's content.
+
+    The digest recorded in the manifest when the entry was written is used when
+    it is present and the stored entry size still matches; otherwise the
+    decompressed content is hashed.
+
+    Args:
+        cache_path: Path to cached file
+
+    Returns:
+        SHA-256 hex digest of the cached content
+
+    Raises:
+        OSError: If the cache file cannot be read
+    """
+    metadata = read_cache_metadata(cache_path)
+    if metadata.get("sha256") and metadata.get("size") == cache_path.stat().st_size:
+        return str(metadata["sha256"])
+
+    with open_cache_entry(cache_path) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def read_derived_cache(cache_path: Path, key: str) -> Optional[Any]:
+    """Read a derived artifact (e.g. a parsed index) if it matches the given key.
+
+    Derived artifacts do not expire by age: they stay valid as long as the
+    content they were built from is unchanged, which the key encodes.
+
+    Args:
+        cache_path: Path to the artifact file
+        key: Expected key (typically a content hash)
+
+    Returns:
+        Stored payload or None if missing, unreadable or built from other content
+    """
+    entry = read_sized_derived_cache(cache_path, key)
+    return None if entry is None else entry[0]
+
+
+def read_sized_derived_cache(cache_path: Path, key: str) -> Optional[tuple[Any, int]]:
+    """Read a derived artifact like read_derived_cache, along with its serialized size.
+
+    The size is a cheap stand-in for the memory footprint of the parsed
+    payload, e.g. to account for it in the memory cache.
+
+    Args:
+        cache_path: Path to the artifact file
+        key: Expected key (typically a content hash)
+
+    Returns:
+        Tuple of (payload, serialized size in bytes) or None if missing,
+        unreadable or built from other content
+    """
+    if lookup_cache(cache_path, check_age=False) is None:
+        return None
+
+    # Callers keep the parsed artifact in memory; the serialized form is not cached
+    try:
+        content = read_cache_entry(cache_path)
+        data = json.loads(content)
+    except (OSError, ValueError, zlib.error) as e:
+        logger.warning(f"Failed to read derived cache {cache_path.name}: {e}")
+        return None
+
+    if not isinstance(data, dict) or data.get("key") != key:
+        logger.debug(f"Derived cache stale: {cache_path.name}")
+        return None
+
+    logger.debug(f"Derived cache hit: {cache_path.name}")
+    return data.get("payload"), len(content)
+
+
+def write_derived_cache(cache_path: Path, key: str, payload: Any) -> int:
+    """Write a derived artifact together with the key it was built from.
+
+    Args:
+        cache_path: Path to the artifact file
+        key: Key identifying the source content
+        payload: JSON-serializable payload
+
+    Returns:
+        Serialized size in bytes
+    """
+    content = json.dumps({"key": key, "payload": payload}, separators=(",", ":")).encode("utf-8")
+    write_cache(cache_path, content)
+    return len(content)
+
+
+def read_marshal_cache(cache_path: Path, key: str) -> Optional[Any]:
+    """Read a marshal-serialized derived artifact if it matches the given key.
+
+    marshal loads much faster than JSON for plain lists and dicts of strings.
+    It is not safe against crafted input, which is acceptable only because the
+    cache directory is private to the user.
+
+    Args:
+        cache_path: Path to the artifact file
+        key: Expected key (typically a content hash and format version)
+
+    Returns:
+        Stored payload or None if missing, unreadable or built from other content
+    """
+    if lookup_cache(cache_path, check_age=False) is None:
+        return None
+
+    try:
+        data = marshal.loads(read_cache_entry(cache_path))
+    except (OSError, ValueError, EOFError, TypeError, zlib.error) as e:
+        logger.warning(f"Failed to read derived cache {cache_path.name}: {e}")
+        return None
+
+    if not isinstance(data, tuple) or len(data) != 2 or data[0] != key:
+        logger.debug(f"Derived cache stale: {cache_path.name}")
+        return None
+
+    logger.debug(f"Derived cache hit: {cache_path.name}")
+    return data[1]
+
+
+def write_marshal_cache(cache_path: Path, key: str, payload: Any, compress: bool = True) -> None:
+    """Write a marshal-serialized derived artifact with the key it was built from.
+
+    Args:
+        cache_path: Path to the artifact file
+        key: Key identifying the source content
+        payload: Payload of builtin types (lists, dicts, strings, numbers)
+        compress: Store the artifact gzip-compressed
+    """
+    write_cache(cache_path, marshal.dumps((key, payload)), compress=compress)
+
+
 def clear_cache() -> int:
     """Clear all cached files.
 
@@ -1,8 +1,41 @@
 """HTTP download utilities with caching."""
 
+import json
+import os
+import re
+import threading
+import time
+import weakref
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+from urllib.parse import urlparse
+
 import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 
-from media_feed.utils.cache_utils import get_cache_path, read_cache, write_cache
+from media_feed.utils.cache_utils import (
+    CACHE_COMPRESSION_LEVEL,
+    CACHE_MAX_AGE_DAYS,
+    CACHE_PART_SUFFIX,
+    CACHE_STALE_GRACE_DAYS,
+    get_cache_path,
+    is_cache_valid,
+    lock_cache_entry,
+    lookup_cache,
+    move_into_cache,
+    read_cache_entry,
+    read_cache_metadata,
+    touch_cache,
+    write_cache_metadata,
+    write_cache_stream,
+)
+from media_feed.utils.file_utils import atomic_write
 from media_feed.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,65 +44,749 @@ logger = get_logger(__name__)
 HTTP_TIMEOUT = 30
 HTTP_USER_AGENT = "media-feed/1.0"
 MAX_DOWNLOAD_SIZE = 100 * 1024 * 1024  # 100 MB
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # 64 KB
 
+# Interrupted downloads are kept as .part files and resumed with Range requests
+DOWNLOAD_RESUME_ATTEMPTS = 3  # Attempts per download, each resuming the last
 
-def download_with_cache(url: str, max_size: int = MAX_DOWNLOAD_SIZE) -> bytes:
-    """Download content with caching.
+# Connection pooling and retry settings
+HTTP_POOL_CONNECTIONS = 10  # Number of hosts with a kept-alive pool
+HTTP_POOL_MAXSIZE = 10  # Connections kept alive per host
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.5  # Seconds, doubled after each retry
+HTTP_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Politeness limits of the request scheduler, shared by all network callers
+HTTP_HOST_RATE_LIMIT = 10.0  # Requests started per second and host
+HTTP_HOST_BURST = 10  # Requests a host may get at once after being idle
+HTTP_HOST_MAX_IN_FLIGHT = 6  # Requests in flight per host
+HTTP_MAX_IN_FLIGHT = 16  # Requests in flight overall
+
+_session: Optional[requests.Session] = None
+_probe_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# URLs with a background refresh in flight
+_revalidating: set[str] = set()
+_revalidating_lock = threading.Lock()
+
+
+class _HostQueue:
+    """Token bucket, requests in flight and waiting requests of one host."""
+
+    def __init__(self, burst: int):
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.in_flight = 0
+        self.waiting: deque[object] = deque()
+
+
+class RequestScheduler:
+    """Admit HTTP requests under per-host rate and concurrency limits.
+
+    Every host has a token bucket refilled at `rate` requests per second up to
+    `burst`, and at most `max_per_host` requests in flight; at most
+    `max_in_flight` requests run overall. Hosts with waiting requests are served
+    round-robin, and requests of one host in arrival order, so a host with many
+    queued requests does not starve the others.
+    """
+
+    def __init__(
+        self,
+        rate: float = HTTP_HOST_RATE_LIMIT,
+        burst: int = HTTP_HOST_BURST,
+        max_per_host: int = HTTP_HOST_MAX_IN_FLIGHT,
+        max_in_flight: int = HTTP_MAX_IN_FLIGHT,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_per_host = max_per_host
+        self.max_in_flight = max_in_flight
+
+        self._condition = threading.Condition()
+        self._hosts: dict[str, _HostQueue] = {}
+        self._turns: deque[str] = deque()  # Hosts with waiting requests, next first
+        self._in_flight = 0
+        self._requests = 0
+        self._delayed = 0
+        self._wait_time = 0.0
+
+    def acquire(self, host: str) -> Callable[[], None]:
+        """Block until a request to a host may start.
+
+        Args:
+            host: Host name of the request
+
+        Returns:
+            Function ending the request; calling it more than once has no effect
+        """
+        ticket = object()
+        start = time.monotonic()
+
+        with self._condition:
+            queue = self._hosts.get(host)
+            if queue is None:
+                queue = self._hosts[host] = _HostQueue(self.burst)
+            queue.waiting.append(ticket)
+            if host not in self._turns:
+                self._turns.append(host)
+
+            while self._next_ticket() is not ticket:
+                self._condition.wait(self._refill_delay(queue))
+
+            queue.waiting.popleft()
+            queue.tokens -= 1
+            queue.in_flight += 1
+            self._in_flight += 1
+
+            # Move the host to the back of the line
+            self._turns.remove(host)
+            if queue.waiting:
+                self._turns.append(host)
+
+            waited = time.monotonic() - start
+            self._requests += 1
+            if waited > 0.001:
+                self._delayed += 1
+                self._wait_time += waited
+
+            # The next request in line may be admitted as well
+            self._condition.notify_all()
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            with self._condition:
+                if released:
+                    return
+                released = True
+                queue.in_flight -= 1
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+        return release
+
+    def _next_ticket(self) -> Optional[object]:
+        """Get the waiting request to admit next, if any may start now."""
+        if self._in_flight >= self.max_in_flight:
+            return None
+
+        now = time.monotonic()
+        for host in self._turns:
+            queue = self._hosts[host]
+            queue.tokens = min(self.burst, queue.tokens + (now - queue.updated_at) * self.rate)
+            queue.updated_at = now
+            if queue.in_flight < self.max_per_host and queue.tokens >= 1:
+                return queue.waiting[0]
+        return None
+
+    def _refill_delay(self, queue: _HostQueue) -> Optional[float]:
+        """Get the seconds until a host has a token again, None if it has one."""
+        if queue.tokens >= 1:
+            return None
+        return (1 - queue.tokens) / self.rate
+
+    def stats(self) -> dict[str, Union[int, float]]:
+        """Get scheduling statistics.
+
+        Returns:
+            Dictionary with the number of hosts, requests in flight, admitted
+            requests, requests that had to wait and their total wait time in
+            seconds
+        """
+        with self._condition:
+            return {
+                "hosts": len(self._hosts),
+                "in_flight": self._in_flight,
+                "requests": self._requests,
+                "delayed": self._delayed,
+                "wait_time": round(self._wait_time, 3),
+            }
+
+
+class _ScheduledAdapter(HTTPAdapter):
+    """Transport adapter sending every request through the request scheduler.
+
+    A request holds its scheduler slot until its response body has been read or
+    the response is closed, so streamed downloads count as in flight.
+    """
+
+    def __init__(self, scheduler: RequestScheduler, **kwargs: Any):
+        self.scheduler = scheduler
+        super().__init__(**kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        release = self.scheduler.acquire(urlparse(str(request.url)).hostname or "")
+        try:
+            response = super().send(request, **kwargs)
+        except BaseException:
+            release()
+            raise
+
+        # urllib3 releases the connection once the body is read or the response
+        # is closed; the finalizer covers responses that are just dropped
+        raw = response.raw
+        release_conn = raw.release_conn
+
+        def release_slot() -> None:
+            try:
+                release_conn()
+            finally:
+                release()
+
+        raw.release_conn = release_slot  # type: ignore[method-assign]
+        weakref.finalize(raw, release)
+        return response
+
+
+_scheduler = RequestScheduler()
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """Get the request scheduler shared by all requests of the HTTP session.
+
+    Returns:
+        Shared request scheduler
+    """
+    return _scheduler
+
+
+def _create_session(max_retries: Union[Retry, int]) -> requests.Session:
+    """Create a session whose requests are admitted by the request scheduler."""
+    adapter = _ScheduledAdapter(
+        _scheduler,
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=max_retries,
+    )
+    session = requests.Session()
+    session.headers["User-Agent"] = HTTP_USER_AGENT
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Get the shared HTTP session, creating it on first use.
+
+    The session keeps connections alive in per-host pools and retries idempotent
+    requests with exponential backoff on connection errors and 5xx responses.
+    All requests, including redirects, are admitted by the shared request
+    scheduler, which enforces per-host rate and concurrency limits.
+
+    Returns:
+        Shared requests session
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=HTTP_MAX_RETRIES,
+                backoff_factor=HTTP_RETRY_BACKOFF,
+                status_forcelist=HTTP_RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                raise_on_status=False,
+            )
+            _session = _create_session(retry)
+
+        return _session
+
+
+def get_probe_session() -> requests.Session:
+    """Get the shared HTTP session for deadline-bound probes, creating it on first use.
+
+    Like get_session(), but requests are never retried: a probe that retries
+    with backoff could outlive the deadline its caller gave it.
+
+    Returns:
+        Shared requests session without retries
+    """
+    global _probe_session
+
+    with _session_lock:
+        if _probe_session is None:
+            _probe_session = _create_session(0)
+
+        return _probe_session
+
+
+def get_session_stats() -> dict[str, int]:
+    """Get connection reuse metrics of the shared HTTP sessions.
+
+    Returns:
+        Dictionary with the number of host pools, opened connections, sent
+        requests and requests served over an already open connection
+    """
+    stats = {"pools": 0, "connections": 0, "requests": 0, "reused": 0}
+
+    with _session_lock:
+        sessions = [session for session in (_session, _probe_session) if session is not None]
+        adapters = {
+            id(adapter): adapter for session in sessions for adapter in session.adapters.values()
+        }
+        for adapter in adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats["pools"] += 1
+                stats["connections"] += pool.num_connections
+                stats["requests"] += pool.num_requests
+
+    stats["reused"] = max(stats["requests"] - stats["connections"], 0)
+    return stats
+
+
+def get_download_cache_path(url: str) -> Path:
+    """Get the cache file path of a downloaded URL.
+
+    Args:
+        url: Downloaded URL
+
+    Returns:
+        Path to the cache file
+    """
+    return get_cache_path(url, extension=".xml")
+
+
+def is_download_cached(url: str, stale_while_revalidate: bool = False) -> bool:
+    """Check whether a URL has a usable cache entry, without recording an access.
+
+    Args:
+        url: URL to check
+        stale_while_revalidate: Also accept entries within the stale grace window
+
+    Returns:
+        True if download_to_cache() would be served from the cache
+    """
+    max_age_days = CACHE_MAX_AGE_DAYS
+    if stale_while_revalidate:
+        max_age_days += CACHE_STALE_GRACE_DAYS
+    return is_cache_valid(get_download_cache_path(url), max_age_days)
+
+
+def download_to_cache(
+    url: str, max_size: int = MAX_DOWNLOAD_SIZE, stale_while_revalidate: bool = False
+) -> Path:
+    """Download content into the cache, reusing a valid cache entry.
+
+    The body is streamed straight into the cache file, so memory use stays
+    constant regardless of the content size. Responses are requested
+    gzip-encoded and stored compressed as received; uncompressed responses are
+    compressed on the fly. Expired cache entries are revalidated with a
+    conditional request using the ETag and Last-Modified validators recorded in
+    the cache manifest. If the server answers 304 Not Modified, the cached
+    content is reused without transferring the body again.
+
+    With stale_while_revalidate, an entry that expired less than
+    CACHE_STALE_GRACE_DAYS ago is returned right away and refreshed in a
+    background thread, so a later call sees fresh content. The process waits
+    for the refresh before exiting. Entries past the grace window are still
+    fetched before returning.
+
+    Interrupted transfers are kept as a .part file next to the cache entry,
+    together with the validators of the response. The next attempt, in this
+    call or a later one, continues it with a Range request guarded by If-Range
+    and the complete file is checked against the announced size. The part is
+    kept gzip-framed like a cache entry, so it is renamed into the cache once
+    its content digest is computed instead of being copied.
+
+    Fetches are single-flight: concurrent threads and processes that miss the
+    same entry wait for the one holding its cache lock and then reuse its result.
 
     Args:
         url: URL to download
         max_size: Maximum download size in bytes
+        stale_while_revalidate: Serve recently expired entries while refreshing them
 
     Returns:
-        Downloaded content
+        Path to the cached content
 
     Raises:
         requests.RequestException: If download fails
         ValueError: If content exceeds max_size
+        OSError: If the cache file cannot be written
     """
     # Check cache first
-    cache_path = get_cache_path(url, extension=".xml")
-    cached_content = read_cache(cache_path, max_size=max_size)
+    cache_path = get_download_cache_path(url)
+    if lookup_cache(cache_path, max_size=max_size) is not None:
+        return cache_path
+
+    if (
+        stale_while_revalidate
+        and is_cache_valid(cache_path, CACHE_MAX_AGE_DAYS + CACHE_STALE_GRACE_DAYS)
+        and lookup_cache(cache_path, max_size=max_size, check_age=False) is not None
+    ):
+        logger.info(f"Serving stale {url} while refreshing it")
+        _revalidate_in_background(url, cache_path, max_size)
+        return cache_path
+
+    return _fetch_to_cache(url, cache_path, max_size)
+
+
+def _revalidate_in_background(url: str, cache_path: Path, max_size: int) -> None:
+    """Refresh a cache entry in a background thread, once per URL at a time.
+
+    The thread is not a daemon, so the interpreter lets it finish on exit.
+    """
+    with _revalidating_lock:
+        if url in _revalidating:
+            return
+        _revalidating.add(url)
+
+    def revalidate() -> None:
+        try:
+            _fetch_to_cache(url, cache_path, max_size)
+        except (requests.RequestException, ValueError, OSError) as e:
+            logger.warning(f"Background refresh of {url} failed: {e}")
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(url)
+
+    threading.Thread(target=revalidate, name=f"revalidate {url}").start()
+
+
+def _fetch_to_cache(url: str, cache_path: Path, max_size: int) -> Path:
+    """Fetch a URL into its cache file under the entry lock, unless it got fresh."""
+    with lock_cache_entry(cache_path):
+        # Another thread or process may have fetched it while we waited
+        if lookup_cache(cache_path, max_size=max_size) is not None:
+            logger.debug(f"Fetched concurrently: {url}")
+            return cache_path
+        return _fetch_unlocked(url, cache_path, max_size)
+
+
+def get_download_part_path(cache_path: Path) -> Path:
+    """Get the path of the partial download of a cache entry.
+
+    Args:
+        cache_path: Path to the cache file
+
+    Returns:
+        Path to the .part file, next to the cache file
+    """
+    return cache_path.with_name(cache_path.name + CACHE_PART_SUFFIX)
+
+
+def _get_part_metadata_path(part_path: Path) -> Path:
+    """Get the path of the validators stored alongside a partial download."""
+    return part_path.with_name(part_path.name + ".json")
 
-    if cached_content is not None:
-        return cached_content
 
-    # Download
-    logger.info(f"Downloading {url}")
+def _read_part_metadata(part_path: Path, url: str) -> dict[str, Any]:
+    """Read the validators of a partial download of url, empty if not resumable."""
+    if not part_path.exists():
+        return {}
 
     try:
-        response = requests.get(
-            url,
-            timeout=HTTP_TIMEOUT,
-            headers={"User-Agent": HTTP_USER_AGENT},
-            stream=True,
+        metadata = json.loads(_get_part_metadata_path(part_path).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(metadata, dict) or metadata.get("url") != url:
+        return {}
+    return metadata
+
+
+def _discard_part(part_path: Path) -> None:
+    """Delete a partial download and its validators."""
+    part_path.unlink(missing_ok=True)
+    _get_part_metadata_path(part_path).unlink(missing_ok=True)
+
+
+def _get_resume_offset(part_path: Path, part: dict[str, Any]) -> int:
+    """Get the number of body bytes a partial download holds.
+
+    Gzip-encoded bodies are stored as received, so every byte on disk counts.
+    Uncompressed bodies are compressed into one gzip member per attempt; the
+    unfinished member of an attempt that never recorded its progress (the
+    process died) is cut off.
+    """
+    size = part_path.stat().st_size
+    if part.get("content_encoding") == "gzip":
+        return size
+
+    part_size = part.get("part_size", 0)
+    if size < part_size:
+        return 0
+    if size > part_size:
+        os.truncate(part_path, part_size)
+    return int(part.get("received", 0))
+
+
+def _open_part(part_path: Path, append: bool) -> BinaryIO:
+    """Open a partial download for writing with user-only permissions."""
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    return open(os.open(part_path, flags, 0o600), "wb")
+
+
+def _get_if_range_validator(metadata: dict[str, Any]) -> Optional[str]:
+    """Get the validator for an If-Range header; weak ETags are not allowed there."""
+    etag = metadata.get("etag")
+    if etag and not etag.startswith("W/"):
+        return str(etag)
+    return metadata.get("last_modified")
+
+
+def _parse_content_range(content_range: str) -> tuple[int, Optional[int]]:
+    """Parse the first byte position and total length of a Content-Range header."""
+    match = re.fullmatch(r"bytes (\d+)-\d+/(\d+|\*)", content_range.strip())
+    if not match:
+        raise requests.exceptions.InvalidHeader(f"Invalid Content-Range: {content_range}")
+    total = match.group(2)
+    return int(match.group(1)), None if total == "*" else int(total)
+
+
+def _resumes_part(response: requests.Response, offset: int, part: dict[str, Any]) -> bool:
+    """Check that a 206 response continues a partial download where it ended."""
+    start, _ = _parse_content_range(response.headers.get("Content-Range", ""))
+    encoding = response.headers.get("Content-Encoding", "identity").lower()
+    return start == offset and encoding == part.get("content_encoding")
+
+
+def _iter_raw(response: requests.Response) -> Iterator[bytes]:
+    """Stream the body as received, mapping urllib3 errors like iter_content()."""
+    try:
+        yield from response.raw.stream(DOWNLOAD_CHUNK_SIZE, decode_content=False)
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+
+
+class _InterruptedDownload(ChunkedEncodingError):
+    """A transfer that was cut off after part of the body had arrived."""
+
+
+def _fetch_unlocked(url: str, cache_path: Path, max_size: int) -> Path:
+    """Fetch a URL into its cache file, resuming after interruptions.
+
+    Only transfers that were cut off after receiving part of the body are
+    resumed. Timeouts and connection errors before any body bytes arrive are
+    already retried by the session, so retrying them here as well would
+    multiply the requests sent to an unresponsive host.
+    """
+    part_path = get_download_part_path(cache_path)
+
+    attempt = 1
+    while True:
+        try:
+            return _fetch_attempt(url, cache_path, part_path, max_size)
+        except _InterruptedDownload as e:
+            if attempt >= DOWNLOAD_RESUME_ATTEMPTS:
+                logger.error(f"Failed to download {url}: {e}")
+                raise
+            attempt += 1
+            logger.warning(
+                f"Download of {url} interrupted, resuming "
+                f"(attempt {attempt}/{DOWNLOAD_RESUME_ATTEMPTS}): {e}"
+            )
+        except requests.RequestException as e:
+            logger.error(f"Failed to download {url}: {e}")
+            raise
+
+
+def _fetch_attempt(url: str, cache_path: Path, part_path: Path, max_size: int) -> Path:
+    """Make one request for a URL, continuing its partial download if possible."""
+    headers = {"Accept-Encoding": "gzip"}
+    part = _read_part_metadata(part_path, url)
+    validator = _get_if_range_validator(part)
+    offset = _get_resume_offset(part_path, part) if part and validator else 0
+
+    if offset:
+        # Continue the partial download, unless the content changed since
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = str(validator)
+        logger.info(f"Resuming download of {url} at byte {offset}")
+    else:
+        # Revalidate an expired entry with its validators
+        metadata = read_cache_metadata(cache_path) if cache_path.exists() else {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+        logger.info(f"Downloading {url}")
+
+    response = get_session().get(url, timeout=HTTP_TIMEOUT, headers=headers, stream=True)
+
+    if response.status_code == 304:
+        response.close()
+        if lookup_cache(cache_path, max_size=max_size, check_age=False) is not None:
+            touch_cache(cache_path)
+            write_cache_metadata(cache_path, {"fetched_at": time.time()})
+            logger.info(f"Not modified, reusing cached {url}")
+            return cache_path
+
+    if response.status_code == 416 and offset:
+        response.close()
+        if part.get("size") == offset:
+            # The previous attempt received everything but was cut off before
+            # promoting the file
+            return _promote_part(url, cache_path, part_path, part, max_size)
+
+    if response.status_code == 206 and not _resumes_part(response, offset, part):
+        logger.warning(f"Server did not resume {url} at byte {offset}, restarting")
+        restart = True
+    else:
+        restart = response.status_code in (304, 416)
+
+    if restart:
+        # Cache entry vanished, partial download unusable or not continued where
+        # it ended: fetch unconditionally
+        response.close()
+        _discard_part(part_path)
+        offset = 0
+        response = get_session().get(
+            url, timeout=HTTP_TIMEOUT, headers={"Accept-Encoding": "gzip"}, stream=True
         )
+
+    with response:
         response.raise_for_status()
 
-        # Check content length
-        content_length = response.headers.get("Content-Length")
-        if content_length and int(content_length) > max_size:
-            raise ValueError(
-                f"Content size ({content_length} bytes) exceeds maximum ({max_size} bytes)"
-            )
+        encoding = response.headers.get("Content-Encoding", "identity").lower()
+        if encoding not in ("gzip", "identity"):
+            # Offsets into a body decoded on the fly cannot be resumed
+            _discard_part(part_path)
+            return _store_response(url, cache_path, response, max_size)
 
-        # Download with size limit
-        content = b""
-        for chunk in response.iter_content(chunk_size=8192):
-            content += chunk
-            if len(content) > max_size:
-                raise ValueError(f"Downloaded content exceeds maximum size ({max_size} bytes)")
+        total: Optional[int]
+        if response.status_code == 206:
+            start, total = _parse_content_range(response.headers.get("Content-Range", ""))
+            if start != offset or encoding != part.get("content_encoding"):
+                _discard_part(part_path)
+                raise ChunkedEncodingError(f"Server did not resume at byte {offset}")
+        else:
+            # Full response: the server ignored the range or the content changed
+            offset = 0
+            content_length = response.headers.get("Content-Length")
+            total = int(content_length) if content_length else None
+            if total is not None and total > max_size:
+                raise ValueError(f"Content size ({total} bytes) exceeds maximum ({max_size} bytes)")
+            part = {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content_encoding": encoding,
+                "size": total,
+            }
+            cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            atomic_write(_get_part_metadata_path(part_path), json.dumps(part))
 
-        # Cache the result
-        write_cache(cache_path, content)
+        # Append to the partial download, gzip-framed as the cache entry it
+        # becomes; whatever arrives before an interruption is kept for the
+        # next attempt
+        received = 0
+        encoder = (
+            None
+            if encoding == "gzip"
+            else zlib.compressobj(CACHE_COMPRESSION_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+        )
+        try:
+            with _open_part(part_path, append=bool(offset)) as f:
+                try:
+                    for chunk in _iter_raw(response):
+                        f.write(encoder.compress(chunk) if encoder else chunk)
+                        received += len(chunk)
+                        if offset + received > max_size:
+                            raise ValueError(
+                                f"Downloaded content exceeds maximum size ({max_size} bytes)"
+                            )
+                finally:
+                    if encoder:
+                        f.write(encoder.flush())
+                    f.flush()
+                    part.update(received=offset + received, part_size=os.fstat(f.fileno()).st_size)
+                    atomic_write(_get_part_metadata_path(part_path), json.dumps(part))
+        except (requests.ConnectionError, ChunkedEncodingError) as e:
+            if received:
+                raise _InterruptedDownload(f"{e} after {received} bytes") from e
+            raise
+        except ValueError:
+            _discard_part(part_path)
+            raise
+        offset += received
 
-        logger.info(f"Downloaded {len(content)} bytes from {url}")
-        return content
+    if total is not None and offset != total:
+        error_type = _InterruptedDownload if received else ChunkedEncodingError
+        raise error_type(f"Download incomplete ({offset} of {total} bytes)")
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to download {url}: {e}")
+    return _promote_part(url, cache_path, part_path, part, max_size)
+
+
+def _promote_part(
+    url: str, cache_path: Path, part_path: Path, part: dict[str, Any], max_size: int
+) -> Path:
+    """Verify a complete partial download and rename it into the cache."""
+    metadata = _download_metadata(url, part.get("etag"), part.get("last_modified"))
+    try:
+        size, _ = move_into_cache(part_path, cache_path, max_size=max_size, metadata=metadata)
+    except (ValueError, zlib.error):
+        # Corrupt or oversized content must not be resumed
+        _discard_part(part_path)
         raise
 
+    _discard_part(part_path)
+    logger.info(f"Downloaded {size} bytes from {url}")
+    return cache_path
+
+
+def _store_response(url: str, cache_path: Path, response: requests.Response, max_size: int) -> Path:
+    """Stream a decoded response body straight into the cache."""
+    chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+    metadata = _download_metadata(
+        url, response.headers.get("ETag"), response.headers.get("Last-Modified")
+    )
+    size, _ = write_cache_stream(cache_path, chunks, max_size=max_size, metadata=metadata)
+    logger.info(f"Downloaded {size} bytes from {url}")
+    return cache_path
+
+
+def _download_metadata(
+    url: str, etag: Optional[str], last_modified: Optional[str]
+) -> dict[str, Any]:
+    """Build the manifest metadata of a downloaded entry.
+
+    It is recorded together with the size and digest of the new content.
+    """
+    return {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": time.time(),
+    }
+
+
+def download_with_cache(
+    url: str, max_size: int = MAX_DOWNLOAD_SIZE, stale_while_revalidate: bool = False
+) -> bytes:
+    """Download content with caching.
+
+    Args:
+        url: URL to download
+        max_size: Maximum download size in bytes
+        stale_while_revalidate: Serve recently expired entries while refreshing
+            them in the background (see download_to_cache)
+
+    Returns:
+        Downloaded content
+
+    Raises:
+        requests.RequestException: If download fails
+        ValueError: If content exceeds max_size
+        OSError: If the cache file cannot be written
+    """
+    cache_path = download_to_cache(
+        url, max_size=max_size, stale_while_revalidate=stale_while_revalidate
+    )
+    return read_cache_entry(cache_path, max_size=max_size)
+
 
 def validate_url(url: str, timeout: int = HTTP_TIMEOUT) -> tuple[bool, str]:
     """Validate URL with HEAD request.
@@ -82,12 +799,7 @@ def validate_url(url: str, timeout: int = HTTP_TIMEOUT) -> tuple[bool, str]:
         Tuple of (is_valid, message)
     """
     try:
-        response = requests.head(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-            headers={"User-Agent": HTTP_USER_AGENT},
-        )
+        response = get_session().head(url, timeout=timeout, allow_redirects=True)
 
         if response.status_code == 200:
             return True, "OK"
@@ -109,12 +821,7 @@ def check_url_exists(url: str, timeout: int = HTTP_TIMEOUT) -> bool:
         True if URL returns HTTP 200, False otherwise
     """
     try:
-        response = requests.head(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-            headers={"User-Agent": HTTP_USER_AGENT},
-        )
+        response = get_session().head(url, timeout=timeout, allow_redirects=True)
         return response.status_code == 200
     except requests.RequestException:
         return False
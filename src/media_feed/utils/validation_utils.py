@@ -1,11 +1,41 @@
 """URL and XML validation utilities for CCC events."""
 
+import asyncio
+import time
 import xml.etree.ElementTree as ET
-from typing import Optional
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional, TypeVar
+from urllib.parse import urlparse
 
 import requests
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
 
-from media_feed.utils.http_utils import HTTP_TIMEOUT, HTTP_USER_AGENT
+from media_feed.utils.http_utils import (
+    DOWNLOAD_CHUNK_SIZE,
+    HTTP_TIMEOUT,
+    get_probe_session,
+    get_request_scheduler,
+)
+
+# Status codes of servers that do not implement HEAD; such links are probed with GET
+HEAD_UNSUPPORTED_STATUS_CODES = (405, 501)
+
+_T = TypeVar("_T")
+
+
+def _time_left(deadline: float, timeout: float) -> float:
+    """Get the seconds left until a time.monotonic() deadline.
+
+    Raises:
+        requests.Timeout: If the deadline has passed
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.Timeout(f"Timed out after {timeout:.1f}s")
+    return remaining
 
 
 class ValidationResult:
@@ -24,11 +54,99 @@ class ValidationResult:
         return self.status_code == 200 and self.valid_xml and self.has_content and not self.error
 
 
-def validate_fahrplan_xml(content: str) -> tuple[bool, bool, Optional[str]]:
+class LinkCheckResult:
+    """Store the outcome of probing a link."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.status_code: Optional[int] = None
+        self.content_length: Optional[int] = None
+        self.error: Optional[str] = None
+        self.checked_at: float = time.time()
+
+    @property
+    def is_success(self) -> bool:
+        """Check if the link resolved."""
+        return self.status_code is not None and 200 <= self.status_code < 300 and not self.error
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "content_length": self.content_length,
+            "error": self.error,
+            "checked_at": self.checked_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LinkCheckResult":
+        """Restore a result stored with to_dict()."""
+        result = cls(data["url"])
+        result.status_code = data.get("status_code")
+        result.content_length = data.get("content_length")
+        result.error = data.get("error")
+        result.checked_at = data.get("checked_at", 0.0)
+        return result
+
+
+def _read_body(response: requests.Response, deadline: float, timeout: float) -> bytes:
+    """Read a streamed response body, giving up at a time.monotonic() deadline.
+
+    read1() returns whatever has arrived, so a server trickling the body is
+    stopped at the deadline instead of once a full chunk has arrived.
+
+    Raises:
+        requests.RequestException: If reading fails or the deadline passes
+    """
+    chunks = []
+    try:
+        while chunk := response.raw.read1(DOWNLOAD_CHUNK_SIZE, decode_content=True):
+            chunks.append(chunk)
+            _time_left(deadline, timeout)
+    except (ProtocolError, ReadTimeoutError) as e:
+        raise requests.ConnectionError(e) from e
+    except DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    return b"".join(chunks)
+
+
+def _request_until(
+    session: requests.Session,
+    method: str,
+    url: str,
+    deadline: float,
+    timeout: float,
+    stream: bool = False,
+) -> requests.Response:
+    """Send a request and follow its redirects, each hop with the time left until a deadline.
+
+    Raises:
+        requests.RequestException: If a request fails, redirects loop or the deadline passes
+    """
+    response = session.request(
+        method, url, timeout=_time_left(deadline, timeout), stream=stream, allow_redirects=False
+    )
+    redirects = 0
+    while response.next is not None:
+        response.close()
+        if redirects == session.max_redirects:
+            raise requests.TooManyRedirects(f"Exceeded {session.max_redirects} redirects")
+        redirects += 1
+        response = session.send(
+            response.next,
+            timeout=_time_left(deadline, timeout),
+            stream=stream,
+            allow_redirects=False,
+        )
+    return response
+
+
+def validate_fahrplan_xml(content: str | bytes) -> tuple[bool, bool, Optional[str]]:
     """Validate fahrplan schedule XML structure and content.
 
     Args:
-        content: XML content as string
+        content: XML content as string, or as bytes decoded by the parser
 
     Returns:
         Tuple of (is_valid_xml, has_events, error_message)
@@ -69,11 +187,11 @@ def validate_fahrplan_xml(content: str) -> tuple[bool, bool, Optional[str]]:
         return False, False, f"Unexpected error: {str(e)}"
 
 
-def validate_podcast_xml(content: str) -> tuple[bool, bool, Optional[str]]:
+def validate_podcast_xml(content: str | bytes) -> tuple[bool, bool, Optional[str]]:
     """Validate podcast RSS feed XML structure and content.
 
     Args:
-        content: XML content as string
+        content: XML content as string, or as bytes decoded by the parser
 
     Returns:
         Tuple of (is_valid_xml, has_items, error_message)
@@ -114,40 +232,44 @@ def validate_podcast_xml(content: str) -> tuple[bool, bool, Optional[str]]:
 
 
 def validate_url_with_content(
-    url: str, url_type: str, timeout: int = HTTP_TIMEOUT
+    url: str, url_type: str, timeout: float = HTTP_TIMEOUT
 ) -> ValidationResult:
     """Validate URL with HTTP request and content validation.
 
+    The request is not retried, and redirect hops and the body are read against
+    the deadline, so a slow server cannot keep the validation running past it.
+
     Args:
         url: URL to validate
         url_type: Type of URL ('fahrplan' or 'podcast')
-        timeout: Request timeout in seconds
+        timeout: Deadline for the whole request in seconds
 
     Returns:
         ValidationResult object
     """
     result = ValidationResult(url)
+    deadline = time.monotonic() + timeout
 
     try:
-        response = requests.get(
-            url,
-            timeout=timeout,
-            headers={"User-Agent": HTTP_USER_AGENT},
-        )
-        result.status_code = response.status_code
+        session = get_probe_session()
+        with _request_until(session, "GET", url, deadline, timeout, stream=True) as response:
+            result.status_code = response.status_code
 
-        if response.status_code != 200:
-            result.error = f"HTTP {response.status_code}"
-            return result
+            if response.status_code != 200:
+                result.error = f"HTTP {response.status_code}"
+                return result
+
+            # The parser decodes the body by the document's encoding declaration
+            body = _read_body(response, deadline, timeout)
 
         # Validate XML content based on type
         if url_type == "fahrplan":
-            is_valid, has_content, error = validate_fahrplan_xml(response.text)
+            is_valid, has_content, error = validate_fahrplan_xml(body)
             result.valid_xml = is_valid
             result.has_content = has_content
             result.error = error
         elif url_type == "podcast":
-            is_valid, has_content, error = validate_podcast_xml(response.text)
+            is_valid, has_content, error = validate_podcast_xml(body)
             result.valid_xml = is_valid
             result.has_content = has_content
             result.error = error
@@ -160,10 +282,138 @@ def validate_url_with_content(
     return result
 
 
+def check_link(url: str, timeout: float = HTTP_TIMEOUT) -> LinkCheckResult:
+    """Check that a link resolves, following redirects, without fetching its body.
+
+    Requests are not retried, and every redirect hop and a GET fallback only
+    get the time left until the deadline.
+
+    Args:
+        url: URL to check
+        timeout: Deadline for the whole check in seconds
+
+    Returns:
+        LinkCheckResult with the final status code and Content-Length
+    """
+    result = LinkCheckResult(url)
+    deadline = time.monotonic() + timeout
+
+    try:
+        session = get_probe_session()
+        response = _request_until(session, "HEAD", url, deadline, timeout)
+        if response.status_code in HEAD_UNSUPPORTED_STATUS_CODES:
+            # Only the headers are read before the connection is released
+            with _request_until(session, "GET", url, deadline, timeout, stream=True) as response:
+                pass
+
+        result.status_code = response.status_code
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            result.content_length = int(content_length)
+        if not result.is_success:
+            result.error = f"HTTP {response.status_code}"
+
+    except requests.RequestException as e:
+        result.error = str(e)
+
+    return result
+
+
+async def _run_with_limits(
+    url: str,
+    call: Callable[[float], _T],
+    timeout: int,
+    executor: ThreadPoolExecutor,
+    global_limit: asyncio.Semaphore,
+    host_limits: dict[str, asyncio.Semaphore],
+) -> _T:
+    """Run a blocking request for a URL once a global and a per-host slot are free.
+
+    The deadline starts once the slots are acquired; the call gets the time left
+    until it as its timeout and must return by then. The slots are held until
+    the worker thread returns, so the limits count every request in flight.
+
+    Returns:
+        Result of the call
+    """
+    host = urlparse(url).hostname or ""
+    loop = asyncio.get_running_loop()
+
+    async with global_limit, host_limits[host]:
+        deadline = time.monotonic() + timeout
+        return await loop.run_in_executor(
+            executor, lambda: call(max(deadline - time.monotonic(), 0.0))
+        )
+
+
+async def _run_all_async(
+    calls: Sequence[tuple[str, Callable[[float], _T]]], timeout: int
+) -> list[_T]:
+    """Run blocking requests concurrently within the request scheduler's limits.
+
+    Args:
+        calls: (url, call) pairs, each call takes its timeout in seconds
+        timeout: Deadline per request in seconds
+
+    Returns:
+        Results of the calls in order
+    """
+    # Deadlines start once a request holds its slots, so requests are admitted
+    # here within the scheduler's limits instead of queueing inside it
+    scheduler = get_request_scheduler()
+    global_limit = asyncio.Semaphore(scheduler.max_in_flight)
+    host_limits: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(scheduler.max_per_host)
+    )
+
+    # One worker thread per concurrency slot; the default executor may be smaller
+    with ThreadPoolExecutor(max_workers=scheduler.max_in_flight) as executor:
+        return await asyncio.gather(
+            *(
+                _run_with_limits(url, call, timeout, executor, global_limit, host_limits)
+                for url, call in calls
+            )
+        )
+
+
+def validate_urls(
+    targets: Sequence[tuple[str, str]],
+    timeout: int = HTTP_TIMEOUT,
+) -> list[ValidationResult]:
+    """Validate URLs concurrently within the request scheduler's concurrency limits.
+
+    Args:
+        targets: (url, url_type) pairs, url_type is 'fahrplan' or 'podcast'
+        timeout: Deadline per request in seconds
+
+    Returns:
+        ValidationResult objects in target order
+    """
+    calls = [(url, partial(validate_url_with_content, url, url_type)) for url, url_type in targets]
+    return asyncio.run(_run_all_async(calls, timeout))
+
+
+def check_links(
+    urls: Sequence[str],
+    timeout: int = HTTP_TIMEOUT,
+) -> list[LinkCheckResult]:
+    """Check links concurrently within the request scheduler's concurrency limits.
+
+    Args:
+        urls: URLs to check
+        timeout: Deadline per request in seconds
+
+    Returns:
+        LinkCheckResult objects in URL order
+    """
+    calls = [(url, partial(check_link, url)) for url in urls]
+    return asyncio.run(_run_all_async(calls, timeout))
+
+
 def validate_event_urls(
     fahrplan_url: str, podcast_url: str, timeout: int = HTTP_TIMEOUT
 ) -> tuple[ValidationResult, ValidationResult]:
-    """Validate both fahrplan and podcast URLs for an event.
+    """Validate both fahrplan and podcast URLs for an event concurrently.
 
     Args:
         fahrplan_url: Fahrplan schedule URL
@@ -173,6 +423,37 @@ def validate_event_urls(
     Returns:
         Tuple of (fahrplan_result, podcast_result)
     """
-    fahrplan_result = validate_url_with_content(fahrplan_url, "fahrplan", timeout)
-    podcast_result = validate_url_with_content(podcast_url, "podcast", timeout)
+    fahrplan_result, podcast_result = validate_urls(
+        [(fahrplan_url, "fahrplan"), (podcast_url, "podcast")], timeout
+    )
     return fahrplan_result, podcast_result
+
+
+def validate_events(
+    event_configs: dict[str, dict[str, Any]],
+    timeout: int = HTTP_TIMEOUT,
+) -> dict[str, dict[str, ValidationResult]]:
+    """Validate the Fahrplan and podcast URLs of several events concurrently.
+
+    Args:
+        event_configs: Event configurations by event key
+        timeout: Deadline per request in seconds
+
+    Returns:
+        Results by event key, then by URL type ('fahrplan', 'podcast'); URL
+        types not configured for an event are omitted
+    """
+    keys: list[tuple[str, str]] = []
+    targets: list[tuple[str, str]] = []
+    for event_key, event_config in event_configs.items():
+        for url_type, config_key in (("fahrplan", "fahrplan_url"), ("podcast", "media_feed_url")):
+            if event_config.get(config_key):
+                keys.append((event_key, url_type))
+                targets.append((str(event_config[config_key]), url_type))
+
+    results = validate_urls(targets, timeout)
+
+    by_event: dict[str, dict[str, ValidationResult]] = {key: {} for key in event_configs}
+    for (event_key, url_type), result in zip(keys, results):
+        by_event[event_key][url_type] = result
+    return by_event
@@ -0,0 +1,250 @@
+"""Shared fixtures: a temporary home directory and a local feed server."""
+
+import hashlib
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import escape, quoteattr
+
+import pytest
+import yaml
+
+from media_feed.utils.cache_utils import get_memory_cache
+
+GLOBAL_CONFIG = {
+    "contact": {"email": "feeds@example.org", "name": "Feeds"},
+    "author": "Feeds",
+    "link": "https://example.org",
+    "language": "en",
+    "image_url": "https://example.org/cover.png",
+    "category_mapping": {"Technology": ["Security"], "_default": ["Technology"]},
+}
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d+)-$")
+
+
+class FeedServer:
+    """Serve fixed bodies over HTTP on localhost and record the requests.
+
+    GET requests honour open-ended Range headers (with If-Range against the
+    ETag) and answer an If-None-Match of the current ETag with a 304. For a
+    path in cut_after, each GET pops the next byte count and only sends that
+    much of the body before dropping the connection, like a broken transfer.
+    Paths in misplaced_ranges answer a Range request with the whole body as a
+    206, like a server that does not resume where it was asked to.
+    Paths in redirects answer with a 302 to their target, and every response
+    is held back by delay seconds.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, bytes] = {}
+        self.cut_after: dict[str, list[int]] = {}
+        self.misplaced_ranges: set[str] = set()
+        self.redirects: dict[str, str] = {}
+        self.delay = 0.0
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def add(self, path: str, body: bytes) -> str:
+        """Register a body and return its URL."""
+        self.routes[path] = body
+        return self.base_url + path
+
+    def requests_for(self, path: str, method: str = "GET") -> list[dict[str, str]]:
+        """Get the headers of the requests made for a path."""
+        with self._lock:
+            return [headers for m, p, headers in self.requests if m == method and p == path]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_HEAD(self) -> None:
+                self._respond(send_body=False)
+
+            def do_GET(self) -> None:
+                self._respond(send_body=True)
+
+            def _respond(self, send_body: bool) -> None:
+                with server._lock:
+                    server.requests.append((self.command, self.path, dict(self.headers)))
+                    cuts = server.cut_after.get(self.path)
+                    cut = cuts.pop(0) if send_body and cuts else None
+
+                time.sleep(server.delay)
+                target = server.redirects.get(self.path)
+                if target is not None:
+                    self.send_response(302)
+                    self.send_header("Location", target)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = server.routes.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                start = 0
+                partial = False
+                match = _RANGE_PATTERN.match(self.headers.get("Range", ""))
+                if match and self.headers.get("If-Range", etag) == etag:
+                    partial = True
+                    if self.path not in server.misplaced_ranges:
+                        start = int(match.group(1))
+
+                if partial:
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/xml")
+                self.send_header("Content-Length", str(len(body) - start))
+                self.send_header("ETag", etag)
+                self.end_headers()
+
+                if not send_body:
+                    return
+                if cut is not None:
+                    self.wfile.write(body[start : start + cut])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                self.wfile.write(body[start:])
+
+        return Handler
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Use a temporary home directory, and with it an empty cache."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    get_memory_cache().clear()
+    return home
+
+
+@pytest.fixture
+def feed_server() -> Iterator[FeedServer]:
+    """Run a local HTTP server for the duration of a test."""
+    server = FeedServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def _schedule_xml(talks: list[dict[str, Any]]) -> bytes:
+    events = []
+    for idx, talk in enumerate(talks):
+        persons = "".join(
+            f"<person>{escape(speaker)}</person>" for speaker in talk.get("speakers", [])
+        )
+        events.append(
+            f'<event guid="g{idx}" id="{1000 + idx}">'
+            f"<url>https://fahrplan.example/events/{1000 + idx}.html</url>"
+            f"<title>{escape(talk['title'])}</title>"
+            f"<subtitle>{escape(talk.get('subtitle', ''))}</subtitle>"
+            f"<track>{escape(talk.get('track', 'Community'))}</track>"
+            f"<description>{escape(talk.get('description', ''))}</description>"
+            f"<persons>{persons}</persons>"
+            "</event>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<schedule><day index="1"><room name="Ada">{"".join(events)}</room></day></schedule>'
+    ).encode()
+
+
+def _podcast_xml(event_key: str, talks: list[dict[str, Any]]) -> bytes:
+    items = []
+    for idx, talk in enumerate(talks):
+        media_url = quoteattr(f"https://cdn.example/{event_key}/{idx}.mp4")
+        items.append(
+            f"<item><title>{escape(talk['title'])} ({event_key})</title>"
+            "<pubDate>Sat, 28 Dec 2019 22:10:00 +0100</pubDate>"
+            f"<description>Recording of {escape(talk['title'])}</description>"
+            f'<enclosure url={media_url} length="{100000 + idx}" type="video/mp4"/>'
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<rss version="2.0"><channel><title>{event_key}</title>{"".join(items)}</channel></rss>'
+    ).encode()
+
+
+@pytest.fixture
+def publish_event(feed_server: FeedServer) -> Callable[..., dict[str, Any]]:
+    """Serve the Fahrplan and media feed of an event made up of the given talks.
+
+    Talks are dicts with a title and optionally subtitle, speakers, track and
+    description. Returns the event configuration pointing at the served feeds.
+    """
+
+    def publish(event_key: str, year: int, talks: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "year": year,
+            "congress_number": int(event_key.removesuffix("c3")),
+            "fahrplan_url": feed_server.add(f"/{event_key}/schedule.xml", _schedule_xml(talks)),
+            "media_feed_url": feed_server.add(
+                f"/{event_key}/podcast.xml", _podcast_xml(event_key, talks)
+            ),
+        }
+
+    return publish
+
+
+@pytest.fixture
+def project(
+    tmp_path: Path, home: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[dict[str, dict[str, Any]]], dict[str, Any]]:
+    """Set up a project directory with config.yaml and empty media YAMLs.
+
+    Returns a function taking the event configurations by event key that writes
+    the files, changes into the project directory and returns the config.
+    """
+
+    def setup(events: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        project_dir = tmp_path / "project"
+        (project_dir / "media").mkdir(parents=True, exist_ok=True)
+        config = {"global": GLOBAL_CONFIG, "events": events}
+        (project_dir / "config.yaml").write_text(yaml.safe_dump(config, allow_unicode=True))
+        for event_key in events:
+            media = {"meta": {"title": event_key, "description": event_key}, "feed": []}
+            (project_dir / "media" / f"media_{event_key}.yml").write_text(yaml.safe_dump(media))
+        monkeypatch.chdir(project_dir)
+        return config
+
+    return setup
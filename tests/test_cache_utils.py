@@ -0,0 +1,180 @@
+"""Tests for the disk cache."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from media_feed.utils.cache_utils import (
+    CACHE_LOCK_DIR,
+    CACHE_MAX_BYTES,
+    CACHE_MAX_SIZE_ENV,
+    MemoryCache,
+    get_cache_max_bytes,
+    lock_cache_entry,
+    lookup_cache,
+    prune_cache,
+    read_cache,
+    read_derived_cache,
+    read_manifest,
+    write_cache,
+    write_cache_metadata,
+    write_derived_cache,
+)
+
+DAY = 24 * 60 * 60
+
+
+def _age(path: Path, days: float) -> None:
+    """Set the modification time of a file to some days ago."""
+    then = time.time() - days * DAY
+    os.utime(path, (then, then))
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    return directory
+
+
+def test_age_prune_keeps_recently_used_derived_and_revalidatable_entries(
+    cache_dir: Path,
+) -> None:
+    plain = cache_dir / "plain.xml"
+    validated = {used: cache_dir / f"validated-{used}.xml" for used in (True, False)}
+    derived = {used: cache_dir / f"talks-{used}.index.json" for used in (True, False)}
+
+    write_cache(plain, b"<rss/>")
+    write_cache_metadata(plain, {"url": "https://example.org/plain.xml"})
+    for path in validated.values():
+        write_cache(path, b"<rss/>")
+        write_cache_metadata(path, {"url": f"https://example.org/{path.name}", "etag": '"v1"'})
+    for path in derived.values():
+        write_derived_cache(path, "key", {"talks": []})
+    for path in (plain, *validated.values(), *derived.values()):
+        _age(path, 30)
+        write_cache_metadata(path, {"last_access": time.time() - 30 * DAY})
+
+    # Using an entry keeps it, unless it has to be downloaded again anyway
+    assert lookup_cache(plain, check_age=False) == plain
+    assert lookup_cache(validated[True], check_age=False) == validated[True]
+    assert read_derived_cache(derived[True], "key") == {"talks": []}
+
+    pruned = prune_cache(max_age_days=7, cache_dir=cache_dir)
+
+    assert sorted(pruned) == sorted([plain.name, validated[False].name, derived[False].name])
+    assert set(read_manifest(cache_dir)) == {validated[True].name, derived[True].name}
+
+
+def test_byte_budget_applies_to_derived_entries(cache_dir: Path) -> None:
+    derived = cache_dir / "talks.index.json"
+    write_derived_cache(derived, "key", {"talks": []})
+
+    assert prune_cache(max_bytes=0, cache_dir=cache_dir) == ["talks.index.json"]
+    assert not derived.exists()
+
+
+def test_writes_evict_least_recently_used_entries_beyond_the_budget(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(CACHE_MAX_SIZE_ENV, "2.5K")
+    used, unused, new = (cache_dir / f"{name}.xml" for name in ("used", "unused", "new"))
+    write_cache(used, bytes(1024), compress=False)
+    write_cache(unused, bytes(1024), compress=False)
+    assert lookup_cache(used) == used
+
+    write_cache(new, bytes(1024), compress=False)
+
+    assert not unused.exists()
+    assert set(read_manifest(cache_dir)) == {used.name, new.name}
+
+
+def test_the_budget_is_read_from_the_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(CACHE_MAX_SIZE_ENV, "200M")
+    assert get_cache_max_bytes() == 200 * 1024 * 1024
+    monkeypatch.setenv(CACHE_MAX_SIZE_ENV, "lots")
+    assert get_cache_max_bytes() == CACHE_MAX_BYTES
+
+
+def test_prune_sweeps_orphans(cache_dir: Path) -> None:
+    stale_part = cache_dir / "gone.xml.part"
+    stale_part_metadata = cache_dir / "gone.xml.part.json"
+    fresh_part = cache_dir / "active.xml.part"
+    stale_temp = cache_dir / ".entry.xml.abc123.tmp"
+    for path in (stale_part, stale_part_metadata, fresh_part, stale_temp):
+        path.write_bytes(b"partial")
+    for path in (stale_part, stale_part_metadata, stale_temp):
+        _age(path, 30)
+
+    kept = cache_dir / "kept.xml"
+    write_cache(kept, b"<rss/>")
+    with lock_cache_entry(kept):
+        pass
+    with lock_cache_entry(cache_dir / "deleted.xml"):
+        pass
+
+    pruned = prune_cache(max_age_days=7, cache_dir=cache_dir)
+
+    assert sorted(pruned) == sorted(
+        [
+            stale_part.name,
+            stale_part_metadata.name,
+            stale_temp.name,
+            f"{CACHE_LOCK_DIR}/deleted.xml.lock",
+        ]
+    )
+    assert fresh_part.exists()
+    assert (cache_dir / CACHE_LOCK_DIR / "kept.xml.lock").exists()
+
+
+def test_prune_keeps_held_lock(cache_dir: Path) -> None:
+    pending = cache_dir / "pending.xml"
+    with lock_cache_entry(pending):
+        prune_cache(max_age_days=7, cache_dir=cache_dir)
+        assert (cache_dir / CACHE_LOCK_DIR / "pending.xml.lock").exists()
+
+    # The lock still works after its file was swept
+    prune_cache(max_age_days=7, cache_dir=cache_dir)
+    with lock_cache_entry(pending):
+        assert (cache_dir / CACHE_LOCK_DIR / "pending.xml.lock").exists()
+
+
+def test_memory_cache_evicts_least_recently_used_beyond_budget() -> None:
+    cache = MemoryCache(max_bytes=10)
+    cache.put("a", b"1234", size=4)
+    cache.put("b", b"1234", size=4)
+    assert cache.get("a") == b"1234"
+
+    cache.put("c", b"1234", size=4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_cache_accounts_explicit_sizes_and_replacements() -> None:
+    cache = MemoryCache(max_bytes=100)
+    cache.put("index", {"talks": []}, size=60)
+    cache.put("index", {"talks": [1]}, size=30)
+
+    assert cache.stats()["bytes"] == 30
+
+    cache.put("huge", b"x", size=101)
+
+    assert cache.get("huge") is None
+    assert cache.get("index") == {"talks": [1]}
+
+
+def test_read_cache_skips_expired_entries(cache_dir: Path) -> None:
+    cache_path = cache_dir / "feed.xml"
+    write_cache(cache_path, b"<rss/>")
+    assert read_cache(cache_path) == b"<rss/>"
+
+    _age(cache_path, 30)
+
+    assert read_cache(cache_path) is None
+    assert read_cache(cache_path, check_age=False) == b"<rss/>"
@@ -0,0 +1,83 @@
+"""Tests for the SQLite full-text catalog."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import FeedServer
+
+from media_feed.catalog import CatalogError, build_catalog, load_catalog_talks, search_catalog
+
+TALKS_38C3 = [
+    {"title": "Security Nightmares", "speakers": ["frank", "Ron"]},
+    {"title": "Lockpicking basics", "description": "Pins, springs and security"},
+    {"title": "Rocket engines"},
+]
+TALKS_39C3 = [
+    {"title": "Fixing printers", "description": "Toner and a word on security"},
+    {"title": "Gardening with sensors"},
+]
+
+
+@pytest.fixture
+def config(home: Path, publish_event: Callable[..., dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "events": {
+            "38c3": publish_event("38c3", 2024, TALKS_38C3),
+            "39c3": publish_event("39c3", 2025, TALKS_39C3),
+        }
+    }
+
+
+def _hits(hits: list[tuple[str, dict[str, Any]]]) -> list[tuple[str, str]]:
+    return [(event_key, talk["title"]) for event_key, talk in hits]
+
+
+def test_build_ingests_all_events_for_search(config: dict[str, Any]) -> None:
+    assert build_catalog(config) == {"38c3": "added", "39c3": "added"}
+
+    assert _hits(search_catalog("security nightmares")) == [("38c3", "Security Nightmares")]
+    assert _hits(search_catalog("security")) == [
+        ("38c3", "Security Nightmares"),
+        ("38c3", "Lockpicking basics"),
+        ("39c3", "Fixing printers"),
+    ]
+    assert _hits(search_catalog("ron")) == [("38c3", "Security Nightmares")]
+    assert _hits(search_catalog("lockpick")) == [("38c3", "Lockpicking basics")]
+    assert _hits(search_catalog("security", event_key="39c3")) == [("39c3", "Fixing printers")]
+    assert search_catalog("zzz") == []
+
+
+def test_load_talks_keeps_schedule_order(config: dict[str, Any]) -> None:
+    build_catalog(config)
+
+    talks = load_catalog_talks("38c3")
+
+    assert [talk["title"] for talk in talks] == [talk["title"] for talk in TALKS_38C3]
+    assert talks[0]["media_url"] == "https://cdn.example/38c3/0.mp4"
+
+
+def test_rebuild_skips_unchanged_events(feed_server: FeedServer, config: dict[str, Any]) -> None:
+    build_catalog(config)
+    downloads = len(feed_server.requests)
+
+    assert build_catalog(config) == {"38c3": "unchanged", "39c3": "unchanged"}
+    assert len(feed_server.requests) == downloads
+    assert build_catalog(config, force=True) == {"38c3": "updated", "39c3": "updated"}
+    assert _hits(search_catalog("gardening")) == [("39c3", "Gardening with sensors")]
+
+
+def test_rebuild_removes_events_no_longer_configured(config: dict[str, Any]) -> None:
+    build_catalog(config)
+    del config["events"]["39c3"]
+
+    assert build_catalog(config) == {"38c3": "unchanged", "39c3": "removed"}
+    assert search_catalog("printers") == []
+    with pytest.raises(CatalogError, match="not in the catalog"):
+        load_catalog_talks("39c3")
+
+
+def test_search_without_catalog_raises(home: Path) -> None:
+    with pytest.raises(CatalogError, match="No catalog found"):
+        search_catalog("security")
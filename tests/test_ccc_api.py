@@ -0,0 +1,137 @@
+"""Tests for the CCC API XML readers."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from media_feed import ccc_api
+from media_feed.ccc_api import (
+    XML_BACKEND_ITERPARSE,
+    XML_BACKEND_MINIDOM,
+    load_talk_index,
+    read_fahrplan_events,
+    search_ccc_talk,
+)
+from media_feed.utils.cache_utils import get_cache_path, is_compressed_cache, write_cache
+
+SCHEDULE_XML = """<?xml version="1.0" encoding="utf-8"?>
+<schedule>
+  <day index="1">
+    <room name="Ada">
+      <event guid="g0" id="1000">
+        <date>2019-12-27T11:00:00+01:00</date>
+        <url>https://fahrplan.example/events/1000.html</url>
+        <title>BahnMining - Pünktlichkeit ist eine Zier</title>
+        <track>Security</track>
+        <description>Über Verspätungen</description>
+      </event>
+      <event guid="g1" id="1001">
+        <date>2019-12-27T12:00:00+01:00</date>
+        <url>https://fahrplan.example/events/1001.html</url>
+        <title>Hackerspaces</title>
+        <track>Community</track>
+        <description>Spaces</description>
+      </event>
+    </room>
+  </day>
+</schedule>
+""".encode()
+
+
+@pytest.fixture
+def cached_schedule(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Store the schedule as a compressed cache entry in a temporary home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    cache_path = get_cache_path("https://fahrplan.example/schedule.xml", extension=".xml")
+    write_cache(cache_path, SCHEDULE_XML)
+    return cache_path
+
+
+def test_minidom_reads_compressed_cache_entry(cached_schedule: Path) -> None:
+    assert is_compressed_cache(cached_schedule)
+
+    events = read_fahrplan_events(cached_schedule, backend=XML_BACKEND_MINIDOM)
+
+    assert [event["title"] for event in events] == [
+        "BahnMining - Pünktlichkeit ist eine Zier",
+        "Hackerspaces",
+    ]
+    assert events == read_fahrplan_events(cached_schedule, backend=XML_BACKEND_ITERPARSE)
+
+
+def test_backends_agree_on_plain_content(tmp_path: Path) -> None:
+    xml_path = tmp_path / "schedule.xml"
+    xml_path.write_bytes(SCHEDULE_XML)
+
+    assert read_fahrplan_events(xml_path, backend=XML_BACKEND_MINIDOM) == read_fahrplan_events(
+        SCHEDULE_XML, backend=XML_BACKEND_ITERPARSE
+    )
+
+
+@pytest.fixture
+def parse_counts(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Count how often the Fahrplan and media feed XMLs are parsed."""
+    counts = {"fahrplan": 0, "media": 0}
+
+    def counting(kind: str, read: Callable[..., Any]) -> Callable[..., Any]:
+        def parse(*args: Any) -> Any:
+            counts[kind] += 1
+            return read(*args)
+
+        return parse
+
+    monkeypatch.setattr(
+        ccc_api, "read_fahrplan_events", counting("fahrplan", ccc_api.read_fahrplan_events)
+    )
+    monkeypatch.setattr(ccc_api, "read_media_items", counting("media", ccc_api.read_media_items))
+    return counts
+
+
+def test_index_rebuild_reuses_records_of_unchanged_xml(
+    home: Path,
+    publish_event: Callable[..., dict[str, Any]],
+    parse_counts: dict[str, int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    event_config = publish_event("36c3", 2019, [{"title": "Hackerspaces"}])
+    index = load_talk_index(event_config)
+    assert parse_counts == {"fahrplan": 1, "media": 1}
+
+    monkeypatch.setattr(ccc_api, "TALK_INDEX_VERSION", ccc_api.TALK_INDEX_VERSION + 1)
+    rebuilt = load_talk_index(event_config)
+
+    assert rebuilt is not index
+    assert rebuilt.talks == index.talks
+    assert parse_counts == {"fahrplan": 1, "media": 1}
+
+
+def test_parser_version_bump_reparses_the_xml(
+    home: Path,
+    publish_event: Callable[..., dict[str, Any]],
+    parse_counts: dict[str, int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    event_config = publish_event("36c3", 2019, [{"title": "Hackerspaces"}])
+    load_talk_index(event_config)
+
+    monkeypatch.setattr(ccc_api, "PARSER_VERSION", ccc_api.PARSER_VERSION + 1)
+    monkeypatch.setattr(ccc_api, "TALK_INDEX_VERSION", ccc_api.TALK_INDEX_VERSION + 1)
+    load_talk_index(event_config)
+
+    assert parse_counts == {"fahrplan": 2, "media": 2}
+
+
+def test_search_ccc_talk_builds_the_entry_of_the_best_hit(
+    home: Path, publish_event: Callable[..., dict[str, Any]]
+) -> None:
+    event_config = publish_event("36c3", 2019, [{"title": "Hackerspaces"}, {"title": "Rockets"}])
+    config = {"global": {}, "events": {"36c3": event_config}}
+
+    entry = search_ccc_talk("rockets", event_config, config, event_key="36c3")
+
+    assert entry is not None
+    assert entry["title"] == "Rockets"
+    assert entry["media_url"] == "https://cdn.example/36c3/1.mp4"
+    assert search_ccc_talk("quantum computing", event_config, config) is None
@@ -0,0 +1,191 @@
+"""Tests for the add command."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+from click.testing import CliRunner
+from conftest import FeedServer
+
+from media_feed.cli import main
+from media_feed.utils.yaml_utils import load_yaml
+
+TALKS_36C3 = [
+    {
+        "title": "BahnMining - Pünktlichkeit ist eine Zier",
+        "speakers": ["David Kriesel"],
+        "description": "What the timetable data says about the trains",
+    },
+    {"title": "Security Nightmares 0x14", "speakers": ["frank", "Ron"]},
+    {"title": "Hacking washing machines"},
+    {"title": "Hacking the Planet"},
+]
+
+
+def _feed_titles(event_key: str) -> list[str]:
+    return [item["title"] for item in load_yaml(Path(f"media/media_{event_key}.yml"))["feed"]]
+
+
+def test_add_from_file_resolves_all_queries_in_one_pass(
+    feed_server: FeedServer,
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+    Path("queries.txt").write_text("# talks\nsecurity nightmares\n\nhacking\nzzz\nbahnmining\n")
+
+    result = CliRunner().invoke(
+        main, ["add", "--from-file", "queries.txt", "-e", "36c3", "--no-rate"]
+    )
+
+    assert result.exit_code == 0, result.output
+    # Entries keep the order of the query file; ambiguous and unknown queries are skipped
+    assert _feed_titles("36c3") == [
+        "Security Nightmares 0x14",
+        "BahnMining - Pünktlichkeit ist eine Zier",
+    ]
+    assert "'hacking' matches 2 talks, skipped" in result.output
+    assert "No matching talk found for 'zzz'" in result.output
+    assert len(feed_server.requests_for("/36c3/schedule.xml")) == 1
+    assert len(feed_server.requests_for("/36c3/podcast.xml")) == 1
+
+
+def test_add_from_file_skips_talks_already_in_the_feed(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+    Path("queries.txt").write_text("bahnmining\n")
+    args = ["add", "--from-file", "queries.txt", "-e", "36c3", "--no-rate"]
+
+    CliRunner().invoke(main, args)
+    result = CliRunner().invoke(main, args)
+
+    assert result.exit_code == 0, result.output
+    assert "Already in media_36c3.yml: BahnMining" in result.output
+    assert _feed_titles("36c3") == ["BahnMining - Pünktlichkeit ist eine Zier"]
+
+
+def test_add_from_file_fills_an_empty_feed(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+    Path("media/media_36c3.yml").write_text("meta:\n  title: 36c3\n  description: 36c3\nfeed:\n")
+    Path("queries.txt").write_text("bahnmining\n")
+
+    result = CliRunner().invoke(
+        main, ["add", "--from-file", "queries.txt", "-e", "36c3", "--no-rate"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert _feed_titles("36c3") == ["BahnMining - Pünktlichkeit ist eine Zier"]
+
+
+def test_add_takes_the_only_title_match_without_asking(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+
+    result = CliRunner().invoke(main, ["add", "washing machines", "-e", "36c3", "--no-rate"])
+
+    assert result.exit_code == 0, result.output
+    assert "Select talk" not in result.output
+    assert _feed_titles("36c3") == ["Hacking washing machines"]
+
+
+def test_add_finds_a_partial_word_in_the_title(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+
+    result = CliRunner().invoke(main, ["add", "BahnMin", "-e", "36c3", "--no-rate"])
+
+    assert result.exit_code == 0, result.output
+    assert _feed_titles("36c3") == ["BahnMining - Pünktlichkeit ist eine Zier"]
+
+
+def test_add_asks_for_a_hit_outside_the_title(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+
+    result = CliRunner().invoke(main, ["add", "kriesel", "-e", "36c3", "--no-rate"], input="1\n")
+
+    assert result.exit_code == 0, result.output
+    assert "Select talk" in result.output
+    assert _feed_titles("36c3") == ["BahnMining - Pünktlichkeit ist eine Zier"]
+
+
+def test_add_does_not_take_a_talk_matching_only_common_words(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+
+    result = CliRunner().invoke(
+        main, ["add", "Quantum computing in the cloud", "-e", "36c3", "--no-rate"]
+    )
+
+    assert "No matching talk found for 'Quantum computing in the cloud'" in result.output
+    assert _feed_titles("36c3") == []
+
+
+def test_add_all_events_adds_the_hit_to_its_event(
+    feed_server: FeedServer,
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project(
+        {
+            "36c3": publish_event("36c3", 2019, TALKS_36C3[:2]),
+            "37c3": publish_event("37c3", 2023, [{"title": "Fuzzing the Dishwasher"}]),
+        }
+    )
+
+    result = CliRunner().invoke(main, ["add", "dishwasher", "--all-events", "--no-rate"])
+
+    assert result.exit_code == 0, result.output
+    assert _feed_titles("37c3") == ["Fuzzing the Dishwasher"]
+    assert _feed_titles("36c3") == []
+    # Every configured event was searched
+    assert len(feed_server.requests_for("/36c3/schedule.xml")) == 1
+
+
+def test_add_all_events_rejects_an_event_selection(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    project({"36c3": publish_event("36c3", 2019, TALKS_36C3)})
+
+    result = CliRunner().invoke(main, ["add", "bahnmining", "--all-events", "-e", "36c3"])
+
+    assert "--all-events cannot be combined" in result.output
+    assert _feed_titles("36c3") == []
+
+
+def test_add_all_events_from_catalog_skips_events_no_longer_configured(
+    publish_event: Callable[..., dict[str, Any]],
+    project: Callable[..., dict[str, Any]],
+) -> None:
+    config = project(
+        {
+            "36c3": publish_event("36c3", 2019, TALKS_36C3),
+            "37c3": publish_event("37c3", 2023, [{"title": "Hacking the Dishwasher"}]),
+        }
+    )
+    CliRunner().invoke(main, ["catalog", "build"])
+    del config["events"]["37c3"]
+    Path("config.yaml").write_text(yaml.safe_dump(config, allow_unicode=True))
+
+    result = CliRunner().invoke(
+        main, ["add", "dishwasher", "--all-events", "--catalog", "--no-rate"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Skipped 37C3: not in config.yaml" in result.output
+    assert "No matching talk found for 'dishwasher'" in result.output
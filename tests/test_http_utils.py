@@ -0,0 +1,302 @@
+"""Tests for cached downloads."""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import requests
+from conftest import FeedServer
+
+from media_feed.utils import cache_utils
+from media_feed.utils.cache_utils import (
+    CACHE_MAX_AGE_DAYS,
+    CACHE_STALE_GRACE_DAYS,
+    get_cache_digest,
+    read_cache_entry,
+    read_cache_metadata,
+)
+from media_feed.utils.http_utils import (
+    DOWNLOAD_RESUME_ATTEMPTS,
+    RequestScheduler,
+    download_to_cache,
+    download_with_cache,
+    get_download_cache_path,
+    get_download_part_path,
+    validate_url,
+)
+
+DAY = 24 * 60 * 60
+
+
+def _body(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def _age(path: Path, days: float) -> None:
+    """Set the modification time of a file to some days ago."""
+    then = time.time() - days * DAY
+    os.utime(path, (then, then))
+
+
+def test_expired_entry_is_revalidated_with_its_etag(home: Path, feed_server: FeedServer) -> None:
+    body = _body(20_000)
+    url = feed_server.add("/feed.xml", body)
+    cache_path = download_to_cache(url)
+    _age(cache_path, CACHE_MAX_AGE_DAYS + 1)
+
+    assert download_to_cache(url) == cache_path
+
+    first, revalidation = feed_server.requests_for("/feed.xml")
+    assert "If-None-Match" not in first
+    assert revalidation["If-None-Match"].startswith('"')
+    # The 304 made the entry fresh again without transferring the body
+    assert time.time() - cache_path.stat().st_mtime < DAY
+    assert read_cache_entry(cache_path) == body
+    assert download_to_cache(url) == cache_path
+    assert len(feed_server.requests_for("/feed.xml")) == 2
+
+
+def test_changed_content_replaces_an_expired_entry(home: Path, feed_server: FeedServer) -> None:
+    url = feed_server.add("/feed.xml", _body(20_000))
+    _age(download_to_cache(url), CACHE_MAX_AGE_DAYS + 1)
+
+    changed = _body(20_000, seed=1)
+    feed_server.add("/feed.xml", changed)
+    cache_path = download_to_cache(url)
+
+    assert read_cache_entry(cache_path) == changed
+
+
+def test_size_digest_and_validators_change_in_one_manifest_update(
+    home: Path, feed_server: FeedServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    url = feed_server.add("/feed.xml", _body(20_000))
+    cache_path = download_to_cache(url)
+    old = read_cache_metadata(cache_path)
+    _age(cache_path, CACHE_MAX_AGE_DAYS + 1)
+
+    snapshots = []
+    write_manifest = cache_utils.atomic_write
+
+    def record_manifest(path: Path, content: str) -> None:
+        entry = json.loads(content)["entries"].get(cache_path.name, {})
+        snapshots.append((entry.get("size"), entry.get("sha256"), entry.get("etag")))
+        write_manifest(path, content)
+
+    monkeypatch.setattr(cache_utils, "atomic_write", record_manifest)
+    changed = _body(30_000, seed=1)
+    feed_server.add("/feed.xml", changed)
+    download_to_cache(url)
+
+    new = read_cache_metadata(cache_path)
+    assert set(snapshots) <= {
+        (old["size"], old["sha256"], old["etag"]),
+        (new["size"], new["sha256"], new["etag"]),
+    }
+    assert get_cache_digest(cache_path) == hashlib.sha256(changed).hexdigest()
+
+
+def test_stale_entry_is_served_while_refreshed_in_background(
+    home: Path, feed_server: FeedServer
+) -> None:
+    url = feed_server.add("/feed.xml", _body(20_000))
+    cache_path = download_to_cache(url)
+    _age(cache_path, CACHE_MAX_AGE_DAYS + CACHE_STALE_GRACE_DAYS / 2)
+    changed = _body(20_000, seed=1)
+    feed_server.add("/feed.xml", changed)
+    feed_server.delay = 0.5
+
+    start = time.monotonic()
+    assert download_to_cache(url, stale_while_revalidate=True) == cache_path
+    assert time.monotonic() - start < feed_server.delay
+    assert read_cache_entry(cache_path) != changed
+
+    for thread in threading.enumerate():
+        if thread.name == f"revalidate {url}":
+            thread.join()
+    assert read_cache_entry(cache_path) == changed
+    assert len(feed_server.requests_for("/feed.xml")) == 2
+
+
+def test_entry_past_the_grace_window_is_fetched_first(home: Path, feed_server: FeedServer) -> None:
+    url = feed_server.add("/feed.xml", _body(20_000))
+    cache_path = download_to_cache(url)
+    _age(cache_path, CACHE_MAX_AGE_DAYS + CACHE_STALE_GRACE_DAYS + 1)
+    changed = _body(20_000, seed=1)
+    feed_server.add("/feed.xml", changed)
+
+    download_to_cache(url, stale_while_revalidate=True)
+
+    assert read_cache_entry(cache_path) == changed
+
+
+def test_concurrent_misses_of_one_url_send_a_single_request(
+    home: Path, feed_server: FeedServer
+) -> None:
+    body = _body(20_000)
+    url = feed_server.add("/feed.xml", body)
+    feed_server.delay = 0.2
+    barrier = threading.Barrier(2)
+
+    def fetch() -> Path:
+        barrier.wait()
+        return download_to_cache(url)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        paths = list(pool.map(lambda _: fetch(), range(2)))
+
+    assert paths[0] == paths[1]
+    assert read_cache_entry(paths[0]) == body
+    assert len(feed_server.requests_for("/feed.xml")) == 1
+
+
+def test_interrupted_download_resumes_with_range(home: Path, feed_server: FeedServer) -> None:
+    body = _body(200_000)
+    url = feed_server.add("/feed.xml", body)
+    feed_server.cut_after["/feed.xml"] = [50_000]
+
+    cache_path = download_to_cache(url)
+
+    assert read_cache_entry(cache_path) == body
+    first, resumed = feed_server.requests_for("/feed.xml")
+    assert "Range" not in first
+    assert resumed["Range"] == "bytes=50000-"
+    assert resumed["If-Range"].startswith('"')
+    assert not get_download_part_path(cache_path).exists()
+
+
+def test_misplaced_resume_restarts_within_the_download(home: Path, feed_server: FeedServer) -> None:
+    body = _body(20_000)
+    url = feed_server.add("/feed.xml", body)
+    feed_server.cut_after["/feed.xml"] = [5_000]
+    feed_server.misplaced_ranges.add("/feed.xml")
+
+    cache_path = download_to_cache(url)
+
+    assert read_cache_entry(cache_path) == body
+    first, resumed, restarted = feed_server.requests_for("/feed.xml")
+    assert resumed["Range"] == "bytes=5000-"
+    assert "Range" not in restarted
+    assert not get_download_part_path(cache_path).exists()
+
+
+def test_partial_download_is_resumed_by_the_next_run(home: Path, feed_server: FeedServer) -> None:
+    body = _body(20_000)
+    url = feed_server.add("/feed.xml", body)
+    feed_server.cut_after["/feed.xml"] = [1_000] * DOWNLOAD_RESUME_ATTEMPTS
+
+    with pytest.raises(requests.RequestException):
+        download_to_cache(url)
+    assert get_download_part_path(get_download_cache_path(url)).exists()
+
+    cache_path = download_to_cache(url)
+
+    assert read_cache_entry(cache_path) == body
+    assert feed_server.requests_for("/feed.xml")[-1]["Range"] == "bytes=3000-"
+
+
+def test_changed_content_restarts_the_download(home: Path, feed_server: FeedServer) -> None:
+    url = feed_server.add("/feed.xml", _body(20_000))
+    feed_server.cut_after["/feed.xml"] = [1_000] * DOWNLOAD_RESUME_ATTEMPTS
+    with pytest.raises(requests.RequestException):
+        download_to_cache(url)
+
+    # The If-Range validator no longer matches, so the server sends it all
+    changed = _body(30_000, seed=1)
+    feed_server.add("/feed.xml", changed)
+    cache_path = download_to_cache(url)
+
+    assert read_cache_entry(cache_path) == changed
+    assert not get_download_part_path(cache_path).exists()
+
+
+def _peak_in_flight(scheduler: RequestScheduler, hosts: list[str]) -> dict[str, int]:
+    """Run one short request per host entry and record the peak concurrency."""
+    lock = threading.Lock()
+    running: dict[str, int] = {}
+    peaks: dict[str, int] = {"total": 0}
+
+    def request(host: str) -> None:
+        release = scheduler.acquire(host)
+        with lock:
+            running[host] = running.get(host, 0) + 1
+            peaks[host] = max(peaks.get(host, 0), running[host])
+            peaks["total"] = max(peaks["total"], sum(running.values()))
+        time.sleep(0.05)
+        with lock:
+            running[host] -= 1
+        release()
+
+    with ThreadPoolExecutor(max_workers=len(hosts)) as pool:
+        list(pool.map(request, hosts))
+    return peaks
+
+
+def test_download_with_cache_returns_the_cached_content(
+    home: Path, feed_server: FeedServer
+) -> None:
+    body = _body(20_000)
+    url = feed_server.add("/feed.xml", body)
+
+    assert download_with_cache(url) == body
+    assert download_with_cache(url) == body
+    assert len(feed_server.requests_for("/feed.xml")) == 1
+    with pytest.raises(ValueError):
+        download_with_cache(feed_server.add("/large.xml", body), max_size=1_000)
+
+
+def test_validate_url_follows_redirects(feed_server: FeedServer) -> None:
+    feed_server.add("/feed.xml", b"<rss/>")
+    feed_server.redirects["/old.xml"] = feed_server.base_url + "/feed.xml"
+
+    assert validate_url(feed_server.base_url + "/old.xml") == (True, "OK")
+    assert validate_url(feed_server.base_url + "/missing.xml") == (False, "HTTP 404")
+    assert feed_server.requests_for("/feed.xml", method="HEAD")
+
+
+def test_scheduler_limits_requests_per_host() -> None:
+    scheduler = RequestScheduler(rate=1000, burst=1000, max_per_host=2, max_in_flight=10)
+
+    peaks = _peak_in_flight(scheduler, ["a"] * 6 + ["b"] * 2)
+
+    assert peaks["a"] == 2
+    assert peaks["b"] == 2
+    assert peaks["total"] == 4
+    assert scheduler.stats()["in_flight"] == 0
+
+
+def test_scheduler_limits_requests_overall() -> None:
+    scheduler = RequestScheduler(rate=1000, burst=1000, max_per_host=10, max_in_flight=3)
+
+    peaks = _peak_in_flight(scheduler, ["a", "b", "c", "d"] * 3)
+
+    assert peaks["total"] == 3
+    assert scheduler.stats()["requests"] == 12
+
+
+def test_scheduler_rate_limits_each_host() -> None:
+    scheduler = RequestScheduler(rate=20, burst=1, max_per_host=10, max_in_flight=10)
+
+    start = time.monotonic()
+    for _ in range(5):
+        scheduler.acquire("a")()
+    scheduler.acquire("b")()
+
+    # One request a host may start right away, the others wait 1/rate each
+    assert time.monotonic() - start >= 4 / 20 * 0.9
+    assert scheduler.stats()["delayed"] == 4
+
+
+def test_release_is_idempotent() -> None:
+    scheduler = RequestScheduler(max_per_host=1)
+    release = scheduler.acquire("a")
+    release()
+    release()
+
+    assert scheduler.stats()["in_flight"] == 0
@@ -0,0 +1,80 @@
+"""Tests for the link-rot checker."""
+
+from pathlib import Path
+
+import yaml
+from conftest import FeedServer
+
+from media_feed.link_check import check_media_links
+
+
+def _media_file(tmp_path: Path, feed_server: FeedServer) -> Path:
+    feed_server.add("/talk.mp4", b"x" * 1000)
+    feed_server.add("/talk.html", b"<html/>")
+    feed = [
+        {
+            "title": "Working talk",
+            "media_url": feed_server.base_url + "/talk.mp4",
+            "media_length": "1000",
+            "web_url": feed_server.base_url + "/talk.html",
+        },
+        {
+            "title": "Moved talk",
+            "media_url": feed_server.base_url + "/gone.mp4",
+            "media_length": "1000",
+        },
+        {
+            "title": "Re-encoded talk",
+            "media_url": feed_server.base_url + "/talk.mp4",
+            "media_length": "2000",
+        },
+    ]
+    media_file = tmp_path / "media_39c3.yml"
+    media_file.write_text(yaml.safe_dump({"meta": {"title": "39c3"}, "feed": feed}))
+    return media_file
+
+
+def test_links_are_classified(home: Path, tmp_path: Path, feed_server: FeedServer) -> None:
+    report = check_media_links([_media_file(tmp_path, feed_server)], timeout=5)
+
+    assert [(link["title"], link["kind"], link["status"]) for link in report["links"]] == [
+        ("Working talk", "media", "ok"),
+        ("Working talk", "web", "ok"),
+        ("Moved talk", "media", "broken"),
+        ("Re-encoded talk", "media", "size_mismatch"),
+    ]
+    assert report["summary"]["probed"] == 3
+
+
+def test_results_are_cached_until_they_expire(
+    home: Path, tmp_path: Path, feed_server: FeedServer
+) -> None:
+    media_file = _media_file(tmp_path, feed_server)
+    check_media_links([media_file], timeout=5)
+    probes = len(feed_server.requests)
+
+    cached = check_media_links([media_file], timeout=5)
+
+    assert len(feed_server.requests) == probes
+    assert cached["summary"]["probed"] == 0
+    assert cached["summary"]["cached"] == 4
+    assert cached["summary"]["broken"] == 1
+
+    expired = check_media_links([media_file], max_age_hours=0, timeout=5)
+
+    assert expired["summary"]["probed"] == 3
+    assert len(feed_server.requests) == 2 * probes
+
+
+def test_failures_without_status_are_probed_again(home: Path, tmp_path: Path) -> None:
+    # Nothing listens on port 9 (discard) of localhost
+    media_file = tmp_path / "media_39c3.yml"
+    feed = [{"title": "Offline", "media_url": "http://127.0.0.1:9/talk.mp4"}]
+    media_file.write_text(yaml.safe_dump({"meta": {"title": "39c3"}, "feed": feed}))
+
+    first = check_media_links([media_file], timeout=5)
+    second = check_media_links([media_file], timeout=5)
+
+    assert first["links"][0]["status"] == "broken"
+    assert second["summary"]["probed"] == 1
+    assert second["summary"]["cached"] == 0
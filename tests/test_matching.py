@@ -0,0 +1,57 @@
+"""Tests for title matching."""
+
+import pytest
+
+from media_feed.matching import TitleMatcher, normalize_title
+
+
+def test_normalize_title_strips_event_suffix_and_whitespace() -> None:
+    assert normalize_title("  Hello   World (38c3) ") == "HELLO WORLD"
+
+
+@pytest.mark.parametrize(
+    ("candidate", "title"),
+    [
+        ("Hackerspaces", "Hackerspace"),
+        ("Hackerspace", "Hackerspaces"),
+        ("Übermensch", "Über"),
+        ("Über", "Übermensch"),
+        ("Ab", "Abc"),
+    ],
+)
+def test_substring_match_within_words(candidate: str, title: str) -> None:
+    assert TitleMatcher(["Unrelated talk", candidate]).match(title) == 1
+
+
+def test_substring_match_drops_subtitle() -> None:
+    matcher = TitleMatcher(["Other", "BahnMining - Pünktlichkeit ist eine Zier (36c3)"])
+
+    assert matcher.match("BahnMining") == 1
+    assert matcher.match("BahnMining - Pünktlichkeit ist eine Zier: Ein Vortrag") == 1
+
+
+def test_exact_match_wins_over_substring() -> None:
+    matcher = TitleMatcher(["Talk about security", "Security"])
+
+    assert matcher.match("security") == 1
+
+
+def test_first_candidate_wins_within_a_level() -> None:
+    matcher = TitleMatcher(["Hackerspaces of Europe", "Hackerspaces"])
+
+    assert matcher.match("Hackerspace") == 0
+    assert matcher.match("The Hackerspaces of Europe and beyond") == 0
+
+
+def test_fuzzy_match_handles_word_order() -> None:
+    words = "one two three four five six seven eight nine ten"
+    shuffled = "ten nine eight seven six five four three two one"
+
+    assert TitleMatcher(["Other", words]).match(shuffled) == 1
+
+
+def test_no_match() -> None:
+    matcher = TitleMatcher(["Hackerspaces", "Übermensch", ""])
+
+    assert matcher.match("Quantum computing") is None
+    assert matcher.match("") is None
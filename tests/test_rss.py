@@ -0,0 +1,118 @@
+"""Tests for RSS feed generation."""
+
+import copy
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import GLOBAL_CONFIG
+from jinja2 import Environment
+
+from media_feed import rss
+from media_feed.rss import TEMPLATE_BYTECODE_DIR, generate_rss_feed, get_rss_template
+
+# Channel dates are the build time, formatted in GMT unlike the item dates
+_BUILD_DATE_PATTERN = re.compile(r"<(pubDate|lastBuildDate)>[^<]*GMT</\1>")
+
+
+def _item(n: int, **fields: Any) -> dict[str, Any]:
+    return {
+        "title": f"Talk {n}",
+        "published": "Sat, 28 Dec 2019 22:10:00 +0100",
+        "speakers": f"Speaker {n}",
+        "media_url": f"https://cdn.example/{n}.mp4",
+        "media_type": "video/mp4",
+        "media_length": 100000 + n,
+        "web_url": f"https://fahrplan.example/events/{n}.html",
+        "description": f"About talk {n} & more",
+        "feedback": [{"rating": 4, "username": "a", "comment": "Good"}],
+        **fields,
+    }
+
+
+def _data(items: list[dict[str, Any]], **meta: str) -> dict[str, Any]:
+    return {"meta": {"title": "39C3", "description": "Talks", **meta}, "feed": items}
+
+
+def _render(data: dict[str, Any], output_file: Path, use_fragment_cache: bool) -> str:
+    generate_rss_feed(
+        copy.deepcopy(data),
+        GLOBAL_CONFIG,
+        output_file,
+        validate=False,
+        use_fragment_cache=use_fragment_cache,
+    )
+    return _BUILD_DATE_PATTERN.sub("", output_file.read_text())
+
+
+def test_fragment_cache_renders_like_a_full_render(home: Path, tmp_path: Path) -> None:
+    data = _data([_item(n) for n in range(5)])
+    full = _render(data, tmp_path / "full.xml", use_fragment_cache=False)
+
+    cold = _render(data, tmp_path / "feed.xml", use_fragment_cache=True)
+    warm = _render(data, tmp_path / "feed.xml", use_fragment_cache=True)
+
+    assert cold == full
+    assert warm == full
+    assert full.count("<item>") == 5
+
+
+def test_fragment_cache_rerenders_changed_items(home: Path, tmp_path: Path) -> None:
+    data = _data([_item(n) for n in range(5)])
+    _render(data, tmp_path / "feed.xml", use_fragment_cache=True)
+
+    data["feed"][2]["feedback"].append({"rating": 5, "username": "b", "comment": "Great"})
+    data["feed"][3]["title"] = "Talk 3, renamed"
+    del data["feed"][0]
+
+    cached = _render(data, tmp_path / "feed.xml", use_fragment_cache=True)
+
+    assert cached == _render(data, tmp_path / "full.xml", use_fragment_cache=False)
+    assert "Talk 3, renamed" in cached
+    assert "Talk 0" not in cached
+
+
+def test_feeds_render_without_a_usable_cache_directory(
+    home: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = _data([_item(1), _item(2)])
+    full = _render(data, tmp_path / "full.xml", use_fragment_cache=False)
+
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    monkeypatch.setenv("HOME", str(not_a_directory))
+    monkeypatch.setattr(rss, "_environment", None)
+
+    assert _render(data, tmp_path / "feed.xml", use_fragment_cache=True) == full
+
+
+def test_items_show_the_feed_image_or_the_global_one(home: Path, tmp_path: Path) -> None:
+    own = _render(
+        _data([_item(1)], image_url="https://example.org/39c3.png"),
+        tmp_path / "own.xml",
+        use_fragment_cache=True,
+    )
+    fallback = _render(_data([_item(1)]), tmp_path / "fallback.xml", use_fragment_cache=True)
+
+    assert own.count('<itunes:image href="https://example.org/39c3.png"/>') == 2
+    assert fallback.count(f'<itunes:image href="{GLOBAL_CONFIG["image_url"]}"/>') == 2
+
+
+def test_a_new_environment_loads_templates_from_the_bytecode_cache(
+    home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(rss, "_environment", None)
+    template = get_rss_template()
+    assert get_rss_template() is template
+    assert list((home / ".cache" / "media-feed" / TEMPLATE_BYTECODE_DIR).iterdir())
+
+    # Like a new process: the template must come from disk without compiling it
+    monkeypatch.setattr(rss, "_environment", None)
+
+    def fail_compile(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("template compiled again")
+
+    monkeypatch.setattr(Environment, "compile", fail_compile)
+
+    assert get_rss_template() is not template
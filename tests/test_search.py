@@ -0,0 +1,166 @@
+"""Tests for the ranked talk search."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from media_feed.ccc_api import search_all_events
+from media_feed.search import TalkIndex
+
+
+def _talk(title: str, **fields: str) -> dict[str, Any]:
+    return {
+        "title": title,
+        "subtitle": "",
+        "speakers": "",
+        "track": "",
+        "description": "",
+        **fields,
+    }
+
+
+def _titles(hits: list[tuple[float, dict[str, Any]]]) -> list[str]:
+    return [talk["title"] for _, talk in hits]
+
+
+def test_title_terms_outweigh_description_terms() -> None:
+    index = TalkIndex(
+        [
+            _talk("Printer Firmware", description="Why a rocket needs a printer"),
+            _talk("Rocket Science", description="Launching a printer"),
+            _talk("Unrelated"),
+        ]
+    )
+
+    assert _titles(index.search("rocket")) == ["Rocket Science", "Printer Firmware"]
+    assert _titles(index.search("printer")) == ["Printer Firmware", "Rocket Science"]
+
+
+def test_weighted_fields_rank_speaker_above_description() -> None:
+    index = TalkIndex(
+        [
+            _talk("Talk A", description="A lecture mentioning Alice once"),
+            _talk("Talk B", speakers="Alice"),
+        ]
+    )
+
+    assert _titles(index.search("alice")) == ["Talk B", "Talk A"]
+
+
+def test_title_phrase_boost_prefers_the_whole_query_in_the_title() -> None:
+    index = TalkIndex(
+        [
+            _talk("Nightmares of Security", description="security nightmares"),
+            _talk("Security Nightmares 0x18"),
+        ]
+    )
+
+    assert _titles(index.search("security nightmares")) == [
+        "Security Nightmares 0x18",
+        "Nightmares of Security",
+    ]
+
+
+def test_search_honours_the_limit_and_skips_unmatched_talks() -> None:
+    index = TalkIndex([_talk(f"Hacking {n}") for n in range(5)] + [_talk("Gardening")])
+
+    assert len(index.search("hacking", limit=3)) == 3
+    assert index.search("zzz") == []
+
+
+def test_hits_contain_most_query_terms() -> None:
+    index = TalkIndex(
+        [
+            _talk("BahnMining", description="Why the trains are late in the winter"),
+            _talk("Quantum computing for everyone", description="Qubits in the cloud"),
+            _talk("Hacking the Planet"),
+        ]
+    )
+
+    assert _titles(index.search("quantum computing in the cloud")) == [
+        "Quantum computing for everyone"
+    ]
+    assert index.search("quantum computing in the year 2030") == []
+
+
+def test_serialized_index_ranks_like_the_original() -> None:
+    index = TalkIndex([_talk("Security Nightmares"), _talk("Fixing printers")])
+
+    restored = TalkIndex.from_dict(index.to_dict())
+
+    assert restored.search("security") == index.search("security")
+
+
+def test_corpus_scores_are_comparable_across_indexes() -> None:
+    older = TalkIndex([_talk("Security Nightmares 0x18"), _talk("Lockpicking"), _talk("Rockets")])
+    newer = TalkIndex(
+        [
+            _talk("Fixing printers", description="A side note on printer security"),
+            _talk("Gardening"),
+        ]
+    )
+    corpus = [older, newer]
+
+    [(older_score, _)] = older.search("security", 1, corpus=corpus)
+    [(newer_score, _)] = newer.search("security", 1, corpus=corpus)
+
+    assert older_score > newer_score
+
+
+def test_all_events_ranks_a_title_match_above_a_newer_description_hit(
+    home: Path, publish_event: Callable[..., dict[str, Any]]
+) -> None:
+    config = {
+        "events": {
+            "38c3": publish_event(
+                "38c3",
+                2024,
+                [
+                    {"title": "Security Nightmares", "description": "What went wrong"},
+                    {"title": "Lockpicking basics"},
+                    {"title": "Rocket engines"},
+                ],
+            ),
+            "39c3": publish_event(
+                "39c3",
+                2025,
+                [
+                    {
+                        "title": "Fixing printers",
+                        "description": "Toner, paper jams and a word on security",
+                    },
+                    {"title": "Gardening with sensors"},
+                ],
+            ),
+        }
+    }
+
+    hits, errors = search_all_events("security", config)
+
+    assert errors == {}
+    assert [(event_key, talk["title"]) for event_key, talk in hits] == [
+        ("38c3", "Security Nightmares"),
+        ("39c3", "Fixing printers"),
+    ]
+
+    # Partial words are found through the title
+    hits, _ = search_all_events("lockpick", config)
+    assert [(event_key, talk["title"]) for event_key, talk in hits] == [
+        ("38c3", "Lockpicking basics")
+    ]
+
+
+def test_all_events_breaks_ties_by_the_newer_event(
+    home: Path, publish_event: Callable[..., dict[str, Any]]
+) -> None:
+    talks = [{"title": "Security Nightmares"}, {"title": "Lockpicking"}]
+    config = {
+        "events": {
+            "38c3": publish_event("38c3", 2024, talks),
+            "39c3": publish_event("39c3", 2025, talks),
+        }
+    }
+
+    hits, _ = search_all_events("security nightmares", config)
+
+    assert [event_key for event_key, _ in hits] == ["39c3", "38c3"]
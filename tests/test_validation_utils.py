@@ -0,0 +1,65 @@
+"""Tests for the URL validation probes."""
+
+import time
+
+from conftest import FeedServer
+
+from media_feed.utils.validation_utils import check_link, check_links, validate_urls
+
+SCHEDULE_XML = (
+    '<?xml version="1.0" encoding="iso-8859-1"?>\n'
+    "<schedule><conference><title>Kongreß</title></conference>"
+    '<day index="1"><room name="Saal Gelb"><event id="1"><title>Übersicht</title></event>'
+    "</room></day></schedule>"
+).encode("iso-8859-1")
+
+
+def test_validation_decodes_by_the_xml_declaration(feed_server: FeedServer) -> None:
+    url = feed_server.add("/schedule.xml", SCHEDULE_XML)
+
+    [result] = validate_urls([(url, "fahrplan")], timeout=5)
+
+    assert result.is_success, result.error
+
+
+def test_validation_decodes_utf16_without_a_charset_header(feed_server: FeedServer) -> None:
+    content = SCHEDULE_XML.decode("iso-8859-1").replace("iso-8859-1", "utf-16")
+    url = feed_server.add("/schedule.xml", content.encode("utf-16"))
+
+    [result] = validate_urls([(url, "fahrplan")], timeout=5)
+
+    assert result.is_success, result.error
+
+
+def test_validation_reports_a_wrong_feed_type(feed_server: FeedServer) -> None:
+    url = feed_server.add("/schedule.xml", SCHEDULE_XML)
+
+    [result] = validate_urls([(url, "podcast")], timeout=5)
+
+    assert result.valid_xml
+    assert result.error == "Root element is not 'rss'"
+
+
+def test_check_link_follows_redirects(feed_server: FeedServer) -> None:
+    feed_server.add("/talk.mp4", b"x" * 1234)
+    feed_server.redirects["/old.mp4"] = "/talk.mp4"
+
+    result = check_link(feed_server.base_url + "/old.mp4", timeout=5)
+
+    assert result.status_code == 200
+    assert result.content_length == 1234
+
+
+def test_redirect_chain_is_bound_by_the_deadline(feed_server: FeedServer) -> None:
+    feed_server.add("/talk.mp4", b"x")
+    for hop in range(5):
+        feed_server.redirects[f"/hop{hop}"] = f"/hop{hop + 1}"
+    feed_server.redirects["/hop5"] = "/talk.mp4"
+    feed_server.delay = 0.3
+
+    start = time.monotonic()
+    [result] = check_links([feed_server.base_url + "/hop0"], timeout=1)
+
+    assert result.status_code is None
+    assert result.error
+    assert time.monotonic() - start < 1.5